@@ -0,0 +1,241 @@
+"""
+benchmark.py — Hide & Seek+ Headless Benchmark Suite
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Runs named, seeded gameplay scenarios on the headless World (SDL dummy video driver) and reports
+ticks/sec, mean per-phase time and peak traced memory. Results can be saved as a JSON baseline;
+later runs compare against it and exit non-zero when a scenario regresses past the threshold.
+The soak scenarios are also played by the autopilot bot, which must add less than AUTOPILOT_BUDGET
+to their tick cost.
+
+    python benchmark.py                      # run everything, compare with the baseline if present
+    python benchmark.py --save-baseline      # record this machine's numbers
+    python benchmark.py --only particle_storm --scale 0.2
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from config import WIDTH, HEIGHT, FPS, SEEKER_SIZE, OBSTACLE_RELOCATE_FRAMES, THEMES
+from settings import Settings
+from world import World, INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT, INPUT_BOOST
+from profiler import Profiler, PHASES
+from bots import AutopilotBot
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.15  # Fractional slowdown (or memory growth) that counts as a regression
+AUTOPILOT_BUDGET = 0.05  # Largest share of World.step time the autopilot may add
+
+# --- Scenarios ---
+
+def _settings(difficulty):
+    settings = Settings()
+    settings.difficulty = difficulty
+    settings.theme_index = 0
+    settings.theme_name = next(iter(THEMES))
+    return settings
+
+def _fill_field(world, count):
+    """Scatter `count` seekers over the field (edge spawning cannot place thousands)."""
+    rng = world.np_rng
+    xs = rng.integers(0, WIDTH - SEEKER_SIZE, size=count).tolist()
+    ys = rng.integers(0, HEIGHT - SEEKER_SIZE, size=count).tolist()
+    color = world.theme["seeker"]
+    for x, y in zip(xs, ys):
+        world.seekers.spawn(x, y, color, world.seeker_speed)
+
+def max_seekers(seed):
+    """2000 swarm seekers chasing a stationary, invulnerable player."""
+    world = World(_settings("Hard"), particles=False, invulnerable=True, max_seekers=2000, seed=seed)
+    _fill_field(world, 2000)
+    return world, lambda tick: 0
+
+def particle_storm(seed):
+    """20 spawn_impact bursts per tick on top of normal play (pool stays near capacity)."""
+    world = World(_settings("Easy"), invulnerable=True, seed=seed)
+    rng = world.np_rng
+    color = (255, 120, 40)
+    def drive(tick):
+        for x, y in zip(rng.integers(0, WIDTH, 20).tolist(), rng.integers(0, HEIGHT, 20).tolist()):
+            world.particle_mgr.spawn_impact(x, y, color)
+        return 0
+    return world, drive
+
+def projectile_spam(seed):
+    """Master difficulty with a full field of 200 seekers, each firing on its own Master cooldown."""
+    settings = _settings("Master")
+    world = World(settings, invulnerable=True, max_seekers=200, seed=seed)
+    _fill_field(world, 200)
+    cooldown = settings.get_projectile_cooldown()
+    def drive(tick):
+        for i in range(tick % cooldown, len(world.seekers), cooldown):
+            world.fire_projectile(*world.seekers.center(i))
+        return 0
+    return world, drive
+
+def obstacle_relocation(seed):
+    """Obstacles relocate every 5 ticks with a 3-tick slide, player walking a square."""
+    world = World(_settings("Easy"), invulnerable=True, seed=seed)
+    world.obstacle_move_frames = 3
+    moves = (INPUT_RIGHT, INPUT_DOWN, INPUT_LEFT, INPUT_UP)
+    def drive(tick):
+        if tick % 5 == 0 and not world.moving_obstacles:
+            world.obstacle_relocate_timer = OBSTACLE_RELOCATE_FRAMES
+        return moves[(tick // 40) % 4]
+    return world, drive
+
+def survival_10min(seed):
+    """Ten minutes of Hard play (invulnerable) with a scripted player that circles and boosts."""
+    world = World(_settings("Hard"), invulnerable=True, seed=seed)
+    moves = (INPUT_RIGHT, INPUT_RIGHT | INPUT_DOWN, INPUT_DOWN, INPUT_DOWN | INPUT_LEFT,
+             INPUT_LEFT, INPUT_LEFT | INPUT_UP, INPUT_UP, INPUT_UP | INPUT_RIGHT)
+    def drive(tick):
+        mask = moves[(tick // 30) % 8]
+        if tick % 2000 == 0:
+            mask |= INPUT_BOOST
+        return mask
+    return world, drive
+
+# name: (build(seed) -> (world, drive(tick) -> inputs), ticks)
+SCENARIOS = {
+    "max_seekers": (max_seekers, 600),
+    "particle_storm": (particle_storm, 3000),
+    "projectile_spam": (projectile_spam, 3000),
+    "obstacle_relocation": (obstacle_relocation, 3000),
+    "survival_10min": (survival_10min, 10 * 60 * FPS),
+}
+AUTOPILOT_SCENARIOS = ("max_seekers", "projectile_spam")  # The soak tests the autopilot exists for
+
+# --- Runner ---
+
+def _run(build, ticks, seed, profiler=None):
+    world, drive = build(seed)
+    world.profiler = profiler
+    start = time.perf_counter()
+    for tick in range(ticks):
+        if profiler: profiler.begin()
+        inputs = drive(tick)
+        if profiler: profiler.lap("events")
+        world.step(inputs)
+        if profiler: profiler.end_frame(world)
+    return time.perf_counter() - start
+
+def run_scenario(name, seed=1, scale=1.0, repeat=3):
+    """
+    Best-of-`repeat` ticks/sec, then one profiled pass (mean ms per phase per tick) and one
+    pass under tracemalloc (peak KiB, including building the scenario).
+    """
+    build, ticks = SCENARIOS[name]
+    ticks = max(1, int(ticks * scale))
+    best = min(_run(build, ticks, seed) for _ in range(repeat))
+
+    profiler = Profiler(window=ticks)
+    _run(build, ticks, seed, profiler)
+    stats = profiler.stats()
+    phases = {phase: round(stats[phase]["mean"], 5) for phase in PHASES if stats[phase]["mean"] > 0}
+
+    tracemalloc.start()
+    _run(build, ticks, seed)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "ticks": ticks,
+        "ticks_per_sec": round(ticks / max(best, 1e-9), 1),
+        "phase_ms": phases,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+def autopilot_share(name, seed=1, scale=1.0, repeat=3):
+    """
+    Best-of-`repeat` time in AutopilotBot.act over time in World.step while the bot plays scenario
+    `name` (its driver still runs, e.g. the projectile spam, but its inputs are the bot's).
+    """
+    build, ticks = SCENARIOS[name]
+    ticks = max(1, int(ticks * scale))
+    best = None
+    for _ in range(repeat):
+        world, drive = build(seed)
+        bot = AutopilotBot()
+        act_time = step_time = 0.0
+        for tick in range(ticks):
+            drive(tick)
+            start = time.perf_counter()
+            inputs = bot.act(world)
+            mid = time.perf_counter()
+            world.step(inputs)
+            act_time += mid - start
+            step_time += time.perf_counter() - mid
+        share = act_time / max(step_time, 1e-9)
+        best = share if best is None else min(best, share)
+    return best
+
+def compare(results, baseline, threshold):
+    """List of regression messages (empty if every scenario is within threshold)."""
+    problems = []
+    for name, result in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or base.get("ticks") != result["ticks"]:
+            continue
+        if result["ticks_per_sec"] < base["ticks_per_sec"] * (1 - threshold):
+            problems.append(f"{name}: {result['ticks_per_sec']:,.0f} ticks/sec vs baseline {base['ticks_per_sec']:,.0f}")
+        if result["peak_kib"] > base["peak_kib"] * (1 + threshold):
+            problems.append(f"{name}: peak {result['peak_kib']:,.0f} KiB vs baseline {base['peak_kib']:,.0f} KiB")
+    return problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hide & Seek+ headless benchmark suite")
+    parser.add_argument("--only", nargs="+", choices=sorted(SCENARIOS), help="scenarios to run (default: all)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every scenario's tick count")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per scenario (best is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed regression (0.15 = 15%%)")
+    parser.add_argument("--json", metavar="FILE", help="also write the results to FILE")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.only or SCENARIOS:
+        result = results[name] = run_scenario(name, args.seed, args.scale, args.repeat)
+        top = sorted(result["phase_ms"].items(), key=lambda kv: -kv[1])[:3]
+        print(f"{name:<20} {result['ticks_per_sec']:>10,.0f} ticks/sec  peak {result['peak_kib']:>9,.0f} KiB  "
+              + "  ".join(f"{phase} {ms:.3f}ms" for phase, ms in top))
+    over = []
+    for name in AUTOPILOT_SCENARIOS:
+        if name in results:
+            share = results[name]["autopilot_share"] = round(autopilot_share(name, args.seed, args.scale, args.repeat), 4)
+            print(f"{name:<20} autopilot adds {share:.1%} to tick cost (budget {AUTOPILOT_BUDGET:.0%})")
+            if share > AUTOPILOT_BUDGET:
+                over.append(f"{name}: autopilot adds {share:.1%} to tick cost, budget {AUTOPILOT_BUDGET:.0%}")
+    for line in over:
+        print("OVER BUDGET " + line)
+
+    report = {"seed": args.seed, "python": platform.python_version(), "machine": platform.machine(), "scenarios": results}
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 1 if over else 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        problems = compare(results, baseline, args.threshold)
+        for line in problems:
+            print("REGRESSION " + line)
+        if problems:
+            return 1
+        print(f"No regressions past {args.threshold:.0%} against {args.baseline}")
+    return 1 if over else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- End of benchmark.py ---
@@ -0,0 +1,304 @@
+"""
+bots.py — Hide & Seek+ Bot Policies
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Scripted players for headless runs. A bot is built with a seed (its own RNG, so a game stays
+reproducible from the game seed) and act(world) returns the INPUT_* bitmask for the next tick.
+New policies only need an entry in POLICIES to be usable by simulate.py.
+"""
+
+import random
+import numpy as np
+import pygame
+from config import WIDTH, HEIGHT, SEEKER_SIZE, PLAYER_SIZE, PROJECTILE_SIZE, PROJECTILE_SPEED
+from world import INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT, INPUT_BOOST
+
+MOVES = (0, INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT,
+         INPUT_UP | INPUT_LEFT, INPUT_UP | INPUT_RIGHT, INPUT_DOWN | INPUT_LEFT, INPUT_DOWN | INPUT_RIGHT)
+
+class IdleBot:
+    """Never moves (the baseline every other bot should beat)."""
+    def __init__(self, seed=None):
+        pass
+
+    def act(self, world):
+        return 0
+
+class RandomWalkBot:
+    """Holds a random direction for a random 15-60 ticks, boosting now and then."""
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.move = 0
+        self.hold = 0
+
+    def act(self, world):
+        rng = self.rng
+        if self.hold <= 0:
+            self.move = rng.choice(MOVES)
+            self.hold = rng.randint(15, 60)
+        self.hold -= 1
+        return self.move | (INPUT_BOOST if rng.random() < 0.002 else 0)
+
+class FleeBot:
+    """
+    Runs directly away from the nearest seeker, and boosts when one gets within BOOST_RANGE.
+    With nothing close it drifts back toward the middle of the field, away from the walls.
+    """
+    BOOST_RANGE = 110
+    CALM_RANGE = 260
+
+    def __init__(self, seed=None):
+        pass
+
+    def act(self, world):
+        px, py = world.player.rect.center
+        to_center = (WIDTH // 2 - px, HEIGHT // 2 - py)
+        pos = world.seekers.positions()
+        if len(pos) == 0:
+            return _toward(*to_center)
+        rel = (pos + SEEKER_SIZE // 2) - (px, py)
+        dist2 = (rel * rel).sum(axis=1)
+        nearest = int(dist2.argmin())
+        if dist2[nearest] > self.CALM_RANGE * self.CALM_RANGE:
+            return _toward(*to_center)
+        # Running straight away pins the player against a wall, so keep some pull to the middle
+        dx = -int(rel[nearest, 0]) + to_center[0] // 4
+        dy = -int(rel[nearest, 1]) + to_center[1] // 4
+        mask = _toward(dx, dy)
+        if dist2[nearest] < self.BOOST_RANGE * self.BOOST_RANGE:
+            mask |= INPUT_BOOST
+        return mask
+
+def _toward(dx, dy, dead_zone=PLAYER_SIZE // 4):
+    """Movement bits for heading along (dx, dy)."""
+    mask = 0
+    if dx > dead_zone:
+        mask |= INPUT_RIGHT
+    elif dx < -dead_zone:
+        mask |= INPUT_LEFT
+    if dy > dead_zone:
+        mask |= INPUT_DOWN
+    elif dy < -dead_zone:
+        mask |= INPUT_UP
+    return mask
+
+# --- Autopilot ---
+
+# Candidate moves: stay plus the 8 directions, as (mask, dx sign, dy sign)
+_CANDIDATES = [(m, (1 if m & INPUT_RIGHT else -1 if m & INPUT_LEFT else 0),
+                (1 if m & INPUT_DOWN else -1 if m & INPUT_UP else 0)) for m in MOVES]
+_CANDIDATE_MASKS = [m for m, _, _ in _CANDIDATES]
+_CANDIDATE_DIRS = np.array([(dx, dy) for _, dx, dy in _CANDIDATES], dtype=np.float64)
+_FIELD_MAX = np.array((WIDTH - PLAYER_SIZE, HEIGHT - PLAYER_SIZE), dtype=np.float64)
+_CELL = 4  # Resolution (px) of the autopilot's edge and obstacle maps over player top-lefts
+
+class AutopilotBot:
+    """
+    Evasive bot: it scores the 9 moves (stay + 8 directions), walking and boosted, in one NumPy
+    pass and holds the cheapest. Each move is projected HORIZONS ticks ahead and charged for
+      - seekers: they home in at their speed, so clearance is distance minus speed * ticks; seekers
+        without line of sight to the player (World.seen) head elsewhere, so they count for less,
+      - projectiles: straight-line trajectories,
+      - obstacles the move would run into (the player stops) and the field edges (corners are traps).
+    Only seekers and projectiles that can get near the player by the last horizon are scored (the
+    NEAREST of them at most). Edge costs and obstacle cells are lookup maps, the latter rebuilt only
+    when the obstacles move; with nothing at all in reach every move scores the same and the bot
+    keeps its current one without scoring.
+    The move is held while it stays SAFE_GAP clear of every threat and obstacle: through the plan's
+    clear horizons, or for as long as even the nearest seeker running straight at the player could
+    not close in (THINK_TICKS to MAX_HOLD ticks). A new seeker, or a new projectile that could come
+    within SAFE_GAP before the hold ends, cuts it short.
+    Boost is pressed when it is ready and the best walking move is still dangerous.
+    """
+    HORIZONS = np.array((2.0, 6.0, 12.0, 20.0))
+    WEIGHTS = np.array((1.0, 0.8, 0.5, 0.3))
+    NEAREST = 16  # Seekers and projectiles scored at most
+    REACH_FALLOFFS = 3  # Threats and edges that cannot get closer than this many falloffs are not scored
+    SEEKER_FALLOFF = 30.0
+    PROJECTILE_FALLOFF = 16.0
+    PROJECTILE_WEIGHT = 3.0
+    OCCLUDED = 0.25  # Danger left of a seeker that cannot see the player
+    OBSTACLE_COST = 2.0
+    EDGE_COST = 0.6
+    EDGE_FALLOFF = 70.0
+    BOOST_DANGER = 1.5
+    THINK_TICKS = 4  # Shortest hold (~67 ms reactions)
+    MAX_HOLD = 20  # At most the last horizon
+    SAFE_GAP = 30.0
+
+    def __init__(self, seed=None):
+        self.last = 0
+        self.wait = 0
+        self.seekers = 0
+        self.projectiles = 0
+        self.vel = 0  # Player speed at the last plan
+        # Per-tick displacement of every candidate at every horizon, for a speed of 1: (C, K, 2)
+        offsets = _CANDIDATE_DIRS[:, None, :] * self.HORIZONS[None, :, None]
+        self.offsets = offsets
+        self.boost_offsets = np.concatenate((offsets, offsets * 2))
+        # Edge cost of the player's center for every top-left cell, and the centers that pay any
+        xs = np.arange(int(_FIELD_MAX[0]) // _CELL + 1) * _CELL + PLAYER_SIZE / 2
+        ys = np.arange(int(_FIELD_MAX[1]) // _CELL + 1) * _CELL + PLAYER_SIZE / 2
+        edge = np.minimum(np.minimum(xs, WIDTH - xs)[:, None], np.minimum(ys, HEIGHT - ys)[None, :])
+        self.edge_cost = self.EDGE_COST * np.exp(edge * (-1 / self.EDGE_FALLOFF))
+        margin = int(self.REACH_FALLOFFS * self.EDGE_FALLOFF)
+        self.inland = pygame.Rect(margin, margin, WIDTH - 2 * margin, HEIGHT - 2 * margin)
+        self.boxes = None  # Obstacle layout self.stall was built for
+
+    def act(self, world):
+        seekers, projectiles = len(world.seekers), world.projectiles
+        fresh = seekers > self.seekers
+        added = len(projectiles) - self.projectiles
+        self.seekers, self.projectiles = seekers, len(projectiles)
+        if self.wait > 0 and not fresh and not (added > 0 and self._incoming(world, added)):
+            self.wait -= 1
+            return self.last
+        player = world.player
+        vel = player.speed * (2 if player.boost_active else 1)
+        if player.slowmo:
+            vel = int(vel * 0.55)
+        boost_ready = player.boost_cooldown == 0 and not player.boost_active
+        self.vel = vel
+        x, y = player.rect.topleft
+        mx, my = x + PLAYER_SIZE / 2, y + PLAYER_SIZE / 2
+        horizon = self.HORIZONS[-1]
+        speed = world.seeker_speed
+
+        # Seekers that can get near by the last horizon are scored; the nearest of all bounds how
+        # long any move is safe
+        pos = world.seekers.positions()
+        calm = self.MAX_HOLD
+        near = pos[:0]
+        if len(pos):
+            dx = pos[:, 0] - (mx - SEEKER_SIZE / 2)
+            dy = pos[:, 1] - (my - SEEKER_SIZE / 2)
+            dist2 = dx * dx + dy * dy
+            closest = float(dist2.min()) ** 0.5
+            calm = (closest - SEEKER_SIZE - self.SAFE_GAP) / (speed + vel)
+            reach = (speed + vel) * horizon + SEEKER_SIZE + self.REACH_FALLOFFS * self.SEEKER_FALLOFF
+            if closest < reach:
+                near = (dist2 < reach * reach).nonzero()[0]
+                if len(near) > self.NEAREST:
+                    near = near[np.argpartition(dist2[near], self.NEAREST)[:self.NEAREST]]
+        # Everything the player's center can reach by the last horizon
+        span = horizon * vel * (2 if boost_ready else 1)
+        area = pygame.Rect(mx - span, my - span, 2 * span, 2 * span)
+        edges = not self.inland.contains(area)
+        area.inflate_ip(PLAYER_SIZE, PLAYER_SIZE)
+        obstacles = world.obstacle_grid.collides(area)
+        # Projectiles that can get near by the last horizon (the grid's flat lists keep their order stable)
+        contact = (PLAYER_SIZE + PROJECTILE_SIZE) / 2
+        reach = (PROJECTILE_SPEED + vel) * horizon + contact + self.REACH_FALLOFFS * self.PROJECTILE_FALLOFF
+        zone = pygame.Rect(mx - reach, my - reach, 2 * reach, 2 * reach)
+        grid = world.projectile_grid
+        incoming = [grid.keys[i] for i in zone.collidelistall(grid.rects)] if projectiles else ()
+        if not (len(near) or incoming or edges or obstacles):
+            # Nothing to avoid: every move scores the same
+            self.wait = max(self.THINK_TICKS, min(self.MAX_HOLD, int(calm))) - 1
+            return self.last
+
+        # Player top-left at each horizon of each candidate (boosted ones too when boost is ready)
+        future = (self.boost_offsets if boost_ready else self.offsets) * vel + (x, y)
+        np.minimum(future, _FIELD_MAX, out=future)
+        np.maximum(future, 0, out=future)
+        cost = np.zeros(len(future))
+        # Horizons each candidate stays clear through, for the hold: (C, K)
+        clear = np.ones(future.shape[:2], dtype=bool)
+        if edges or obstacles:
+            cells = (future * (1 / _CELL)).astype(np.intp)
+            if edges:
+                cost += self.edge_cost[cells[:, -1, 0], cells[:, -1, 1]]
+            if obstacles:
+                boxes = world.obstacle_grid.boxes()
+                if boxes is not self.boxes:
+                    self._set_obstacles(boxes)
+                clear = ~self.stall[cells[:, :, 0], cells[:, :, 1]]
+                # A move whose first horizon lands inside an obstacle stalls
+                cost[~clear[:, 0]] += self.OBSTACLE_COST
+
+        centers = future + PLAYER_SIZE / 2
+        cx, cy = centers[:, :, 0, None], centers[:, :, 1, None]  # (C, K, 1)
+        if len(near):
+            target = pos[near] + SEEKER_SIZE / 2
+            seen = world.seen
+            if seen is not None and len(seen) == len(pos):
+                weight = np.where(np.asarray(seen)[near], 1.0, self.OCCLUDED)
+            else:
+                weight = np.ones(len(near))
+            charge, gap = self._charge(cx, cy, target[:, 0], target[:, 1], self.HORIZONS[:, None] * speed + SEEKER_SIZE,
+                                       self.SEEKER_FALLOFF, weight)
+            cost += charge
+            clear &= gap > self.SAFE_GAP
+        if incoming:
+            proj = np.array([(p.rect.centerx, p.rect.centery, p.dx, p.dy) for p in incoming], dtype=np.float64)
+            proj = proj[_nearest(proj, (mx, my), reach, self.NEAREST, index=True)]
+            if len(proj):
+                calm = 0  # Projectiles outrun the seeker bound
+                h = self.HORIZONS[:, None]
+                charge, gap = self._charge(cx, cy, proj[:, 0] + proj[:, 2] * h, proj[:, 1] + proj[:, 3] * h, contact,
+                                           self.PROJECTILE_FALLOFF, np.full(len(proj), self.PROJECTILE_WEIGHT))
+                cost += charge
+                clear &= gap > self.SAFE_GAP
+
+        cost = cost.tolist()
+        walking = cost[:9]
+        walking[_CANDIDATE_MASKS.index(self.last)] -= 0.05  # Hysteresis against dithering
+        best = min(range(9), key=walking.__getitem__)
+        mask = _CANDIDATE_MASKS[best]
+        if boost_ready and walking[best] > self.BOOST_DANGER:
+            boosted = min(range(9, 18), key=cost.__getitem__)
+            if cost[boosted] < walking[best]:
+                best = boosted
+                mask = _CANDIDATE_MASKS[boosted - 9] | INPUT_BOOST
+        self.last = mask & ~INPUT_BOOST
+        # Hold through the last clear horizon, and past the last one while no seeker can close in
+        row = clear[best].tolist()
+        k = row.index(False) if False in row else len(row)
+        hold = self.HORIZONS[k - 1] if k else 0
+        if k == len(row):
+            hold = max(hold, calm)
+        self.wait = max(self.THINK_TICKS, min(self.MAX_HOLD, int(hold))) - 1
+        return mask
+
+    def _incoming(self, world, added):
+        """True if one of the `added` newest projectiles could come within SAFE_GAP during the hold."""
+        reach = (PROJECTILE_SPEED + self.vel) * self.wait + (PLAYER_SIZE + PROJECTILE_SIZE) / 2 + self.SAFE_GAP
+        zone = pygame.Rect(0, 0, 2 * reach, 2 * reach)
+        zone.center = world.player.rect.center
+        return zone.collidelist([p.rect for p in world.projectiles[-added:]]) >= 0
+
+    def _charge(self, cx, cy, tx, ty, reach, falloff, weight):
+        """
+        Danger of threats at (tx, ty), (T,) or per horizon (K, T), that close in by `reach` px:
+        (cost (C,), smallest clearance at each horizon (C, K)).
+        """
+        gap = np.hypot(cx - tx, cy - ty) - reach  # (C, K, T)
+        danger = np.exp(np.maximum(gap, -60) * (-1 / falloff))
+        return danger @ weight @ self.WEIGHTS, gap.min(axis=2)
+
+    def _set_obstacles(self, boxes):
+        """Top-left cells where the player overlaps an obstacle (like Rect.colliderect)."""
+        self.boxes = boxes
+        stall = np.zeros(self.edge_cost.shape, dtype=bool)
+        for x, y, w, h in boxes.tolist():
+            stall[max(0, (x - PLAYER_SIZE) // _CELL + 1):(x + w - 1) // _CELL + 1,
+                  max(0, (y - PLAYER_SIZE) // _CELL + 1):(y + h - 1) // _CELL + 1] = True
+        self.stall = stall
+
+def _nearest(points, origin, radius, count, index=False):
+    """The (up to `count`) rows of `points` closest to `origin` within `radius`, or their indices."""
+    dx = points[:, 0] - origin[0]
+    dy = points[:, 1] - origin[1]
+    dist2 = dx * dx + dy * dy
+    keep = (dist2 < radius * radius).nonzero()[0]
+    if len(keep) > count:
+        keep = keep[np.argpartition(dist2[keep], count)[:count]]
+    return keep if index else points[keep]
+
+POLICIES = {
+    "idle": IdleBot,
+    "random": RandomWalkBot,
+    "flee": FleeBot,
+    "autopilot": AutopilotBot,
+}
+
+# --- End of bots.py ---
@@ -13,8 +13,23 @@ import json
 # --- Window & Drawing ---
 WIDTH = 1280
 HEIGHT = 800
-FPS = 60
+FPS = 60  # Simulation ticks per second (fixed timestep)
+RENDER_FPS_CAP = 240  # Frame rate limit for drawing; 0 = uncapped
+MAX_CATCHUP_TICKS = 5  # Most ticks simulated per rendered frame; older lag is dropped
+PROFILE_WINDOW = 600  # Frames of per-phase timings kept by the profiler (10 s at 60 FPS)
 FONT_NAME = "freesansbold.ttf"
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by fonts.TEXT (least recently used are evicted)
+MINIMAP_HZ = 15  # Minimap marker refreshes per second, independent of the frame rate
+MINIMAP_DENSITY_MIN = 400  # From this many seekers the minimap shows a density map instead of dots
+ATTRACT_IDLE_SECONDS = 20  # Idle time on the main menu before the autopilot plays a demo game
+DARKNESS = False  # Fog-of-war overlay (darkness.py): only the player's surroundings are lit; L toggles it in game
+DARKNESS_HALF_RES = False  # Compose the darkness at half resolution and upscale it (low-end machines)
+DARKNESS_AMBIENT = 20  # Brightness left in unlit areas (0 = black, 255 = no darkness)
+DARKNESS_LIGHT_RADIUS = 200  # Radius of the light around the player (px)
+DARKNESS_CONE_LENGTH = 420  # Reach of the light cone ahead of a boosting player (px); it shrinks as the boost runs out
+DARKNESS_CONE_ANGLE = 24  # Half-angle of the boost cone (degrees)
+DARKNESS_CONE_DIRECTIONS = 32  # Pre-baked cone headings
+DARKNESS_CONE_STEPS = 8  # Pre-baked cone lengths the shrinking cone steps through
 ICON_PATH = "assets/icon32.png"  # Placeholder (not used, for expansion)
 
 # --- Player/Seeker/Gameplay ---
@@ -44,13 +59,51 @@ PROJECTILE_COOLDOWNS = {
     "Hard": 150,
     "Master": 90
 }
+# Score ramps: every N points shortens the spawn interval by SPAWN_RAMP_STEP seconds (never below
+# SPAWN_INTERVAL_MIN) or makes seekers 1 faster. 0 = no ramp on that difficulty.
+SPAWN_RAMP_SCORE = {
+    "Easy": 0,
+    "Hard": 2000,
+    "Master": 2000
+}
+SPEED_RAMP_SCORE = {
+    "Easy": 0,
+    "Hard": 0,
+    "Master": 3000
+}
+SPAWN_RAMP_STEP = 2
+SPAWN_INTERVAL_MIN = 7
 
 MAX_SEEKERS = 10
+SEEKER_CEILINGS = {  # Seekers alive at once per difficulty; from SWARM_MIN_SEEKERS up the game plays on SeekerSwarm
+    "Easy": MAX_SEEKERS,
+    "Hard": MAX_SEEKERS,
+    "Master": MAX_SEEKERS
+}
+SWARM_MIN_SEEKERS = 64  # Seeker ceilings from here up use the batched NumPy swarm
 OBSTACLE_COUNT = 8
 OBSTACLE_SIZE = 80
+GRID_CELL_SIZE = max(SEEKER_SIZE, OBSTACLE_SIZE)  # Spatial hash cell, fits any single entity
+FREE_MAP_CELL = 8  # Free-space map resolution (px): spawn and unstick positions snap to this grid
+SEEKER_FLOW_FIELD = True  # Seekers path around obstacles (flowfield.py) instead of pushing straight at the player
+FLOW_CELL_SIZE = 40  # Flow field cell in px (WIDTH and HEIGHT should be multiples)
+FLOW_DETOUR_TICKS = 30  # Decisions a seeker follows the flow field after an obstacle turns it back
+SEEKER_LINE_OF_SIGHT = True  # Obstacles hide the player: seekers without line of sight head for where they last saw it (visibility.py)
+SEEKER_LOD = True  # Distant seekers re-plan at a reduced rate (scheduler.py)
+AI_NEAR_DISTANCE = 320  # Seekers closer than this (px) to the player re-plan every tick
+AI_FAR_INTERVAL = 4  # Distant seekers re-plan every this many ticks, round-robin
+AI_MAX_PLANS = 256  # Re-plans per tick; distant seekers past this wait their turn (near ones never do)
+AI_MAX_STALE = 30  # ... but each distant seeker still re-plans at least every this many ticks
+AI_BUDGET_MS = 1.0  # Seeker update wall time per tick; ticks over it count as overruns
+AI_LOD_MIN_SEEKERS = 64  # Below this many seekers all of them re-plan every tick (planning would cost more than it saves)
 
 OBSTACLE_RELOCATE_FRAMES = 2100  # ~35 seconds
 
+PARTICLE_CAPACITY = 20000  # Pooled particles; spawns past this are dropped
+
+NEAR_MISS_DISTANCE = 65  # Center-to-center px that counts as a close dodge
+NEAR_MISS_COOLDOWN = 33  # In frames (~550 ms)
+
 # --- Themes (3 main + 3 colorblind/alt, with full mapping for UI elements) ---
 THEMES = {
     "Dark": {
@@ -161,6 +214,11 @@ THEMES = {
 # --- Leaderboard and Save Data ---
 LEADERBOARD_FILE = "leaderboard.txt"
 SAVE_DATA_FILE = "save_data.json"
+REPLAY_FILE = "last_replay.hsr"  # Seed + inputs of the most recent game (python replay.py verifies it)
+REPLAY_KEYFRAME_TICKS = 240  # Replay viewer snapshots the world this often; a seek re-simulates at most this many ticks
+REPLAY_DIR = "replays"  # Replays referenced by leaderboard entries, named by content hash
+SUBMISSIONS_FILE = "submissions.txt"  # Every accepted submission (score|name|replay ref), newest last
+VERDICT_CACHE_FILE = "verdicts.json"  # Re-simulated score per replay ref (leaderboard.py)
 
 # --- Projectiles (ghost bullets) ---
 PROJECTILE_SIZE = 18
@@ -217,10 +275,16 @@ def read_leaderboard():
     with open(LEADERBOARD_FILE, "r") as f:
         return [x.strip() for x in f.readlines()]
 
-def submit_score(score, name="AAA"):
+def parse_entry(line):
+    """A leaderboard line "score|name[|replay ref]" as (score, name, ref); ref is "" for old entries."""
+    score, name, ref = (line.strip().split("|") + [""])[:3]
+    return int(score), name, ref
+
+def submit_score(score, name="AAA", replay_ref=""):
+    """Add an entry (with the ref of the replay that proves it, see leaderboard.py) and keep the top 5."""
     scores = read_leaderboard()
-    new_scores = scores + [f"{score}|{name}"]
-    new_scores = sorted(new_scores, key=lambda s: int(s.split("|")[0]), reverse=True)[:5]
+    new_scores = scores + [f"{score}|{name}|{replay_ref}" if replay_ref else f"{score}|{name}"]
+    new_scores = sorted(new_scores, key=lambda s: parse_entry(s)[0], reverse=True)[:5]
     with open(LEADERBOARD_FILE, "w") as f:
         for s in new_scores:
             f.write(f"{s}\n")
@@ -238,6 +302,29 @@ def load_data():
 
 ensure_leaderboard()
 
+# --- Difficulty Profiles ---
+# A profile is {table name: {difficulty: value}} for any of the TUNABLE_TABLES (tune.py writes
+# them). apply_profile() updates the tables in place, so Settings getters see the new values.
+TUNABLE_TABLES = (
+    "SEEKER_SPEEDS", "SEEKER_SPAWN_INTERVALS", "PROJECTILE_COOLDOWNS", "BOOST_DURATION",
+    "SPAWN_RAMP_SCORE", "SPEED_RAMP_SCORE", "SEEKER_CEILINGS",
+)
+
+def current_profile():
+    return {name: dict(globals()[name]) for name in TUNABLE_TABLES}
+
+def apply_profile(profile):
+    for name, table in profile.items():
+        if name not in TUNABLE_TABLES:
+            raise KeyError(f"{name} is not a tunable table")
+        globals()[name].update(table)
+
+def load_profile(path):
+    with open(path, "r") as f:
+        apply_profile(json.load(f))
+
+SHIPPED_PROFILE = current_profile()  # The tables as shipped, before any load_profile()
+
 # --- Math & Visual Helpers ---
 
 def lerp(a, b, t):
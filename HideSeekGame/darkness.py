@@ -0,0 +1,187 @@
+"""
+darkness.py — Hide & Seek+ Darkness Overlay
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Optional fog of war: the field is dark except for a radial light around the player and, while a
+boost runs, a cone ahead of it that shrinks as the boost runs out.
+
+Nothing screen-sized is allocated per frame. The overlay is a grayscale light map (255 = lit,
+DARKNESS_AMBIENT = unlit) in one reusable buffer: each frame fills it with the ambient level,
+composes the pre-baked radial gradient masks into it with BLEND_RGB_MAX (the brighter light wins,
+so overlapping lights add up) and multiplies it onto the screen with BLEND_RGB_MULT. The cone is
+baked once with NumPy; its shrink steps and headings are scaled and rotated from that (in C, on
+first use) and cached. At half resolution the buffer and the masks are half size and the buffer is
+upscaled into a second reusable buffer before the multiply.
+
+    python darkness.py          # ms per frame: full and half resolution, and a Surface-per-frame overlay
+"""
+
+import math
+import time
+import numpy as np
+import pygame
+from config import (
+    WIDTH, HEIGHT, DARKNESS_AMBIENT, DARKNESS_LIGHT_RADIUS, DARKNESS_CONE_LENGTH, DARKNESS_CONE_ANGLE,
+    DARKNESS_CONE_DIRECTIONS, DARKNESS_CONE_STEPS, DARKNESS_HALF_RES
+)
+
+# --- Mask Baking ---
+
+def _falloff(t):
+    """0 at t <= 0 rising smoothly to 1 at t >= 1."""
+    t = np.clip(t, 0.0, 1.0)
+    return t * t * (3 - 2 * t)
+
+def _gray_surface(lit, ambient):
+    """Opaque grayscale Surface from a (w, h) array of light amounts in 0..1."""
+    value = (ambient + (255 - ambient) * lit).astype(np.uint8)
+    surf = pygame.surfarray.make_surface(np.repeat(value[:, :, None], 3, axis=2))
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    return surf
+
+def light_mask(radius, ambient=DARKNESS_AMBIENT):
+    """(2 * radius + 1) square mask: full light at the center fading to `ambient` at `radius`."""
+    d = np.arange(-radius, radius + 1, dtype=np.float64)
+    dist = np.hypot(d[:, None], d[None, :])
+    return _gray_surface(1 - _falloff(dist / radius), ambient)
+
+def cone_mask(length, half_angle, ambient=DARKNESS_AMBIENT):
+    """
+    (2 * length + 1) square mask with its apex at the center and a cone of light pointing right
+    (+x), `length` px long: full light for its first 30%, then dimmer toward its tip, and toward its sides.
+    """
+    d = np.arange(-length, length + 1, dtype=np.float64)
+    x, y = d[:, None], d[None, :]
+    reach = _falloff((np.hypot(x, y) / length - 0.3) / 0.7)
+    lit = (1 - reach) * (1 - _falloff(np.abs(np.arctan2(y, x)) / half_angle))
+    return _gray_surface(lit, ambient)
+
+def _crop(surf, ambient):
+    """The part of `surf` brighter than `ambient` (a copy) and its top-left within `surf`."""
+    red = pygame.surfarray.array_red(surf)
+    cols = np.flatnonzero((red > ambient).any(axis=1))
+    rows = np.flatnonzero((red > ambient).any(axis=0))
+    if len(cols) == 0:
+        return surf.subsurface((0, 0, 1, 1)).copy(), (0, 0)
+    rect = pygame.Rect(int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1))
+    return surf.subsurface(rect).copy(), rect.topleft
+
+# --- Overlay ---
+
+class Darkness:
+    """
+    The darkness overlay. half_res=True composes at half resolution and upscales (nearest-neighbor,
+    or the smoother but slower smoothscale with smooth=True). cones counts the cone masks made.
+    """
+    def __init__(self, half_res=DARKNESS_HALF_RES, smooth=False, radius=DARKNESS_LIGHT_RADIUS,
+                 cone_length=DARKNESS_CONE_LENGTH, cone_angle=DARKNESS_CONE_ANGLE, ambient=DARKNESS_AMBIENT):
+        self.scale = 2 if half_res else 1
+        self.smooth = smooth
+        self.ambient = ambient
+        self.radius = radius // self.scale
+        self.buffer = self._surface((WIDTH // self.scale, HEIGHT // self.scale))
+        self.full = self._surface((WIDTH, HEIGHT)) if self.scale > 1 else None
+        self.light = light_mask(self.radius, ambient)
+        self.cone = cone_mask(cone_length // self.scale, math.radians(cone_angle), ambient)
+        self.cone_masks = {}  # (heading index, length step) -> (mask, top-left relative to the apex)
+        self.heading = 0  # Heading index of the player's last move
+        self.cones = 0
+
+    @staticmethod
+    def _surface(size):
+        surf = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        return surf
+
+    def _cone(self, heading, step):
+        cone = self.cone_masks.get((heading, step))
+        if cone is None:
+            # Scaling and rotating about the center keep the apex there; rotate() pads with the
+            # top-left (ambient) color
+            size = self.cone.get_width() * step // DARKNESS_CONE_STEPS | 1
+            surf = pygame.transform.smoothscale(self.cone, (size, size))
+            surf = pygame.transform.rotate(surf, -360 * heading / DARKNESS_CONE_DIRECTIONS)
+            mask, (x, y) = _crop(surf, self.ambient)
+            cone = mask, (x - surf.get_width() // 2, y - surf.get_height() // 2)
+            self.cone_masks[(heading, step)] = cone
+            self.cones += 1
+        return cone
+
+    def draw(self, screen, player, offset=(0, 0)):
+        """Darken `screen` around `player` (drawn at `offset`, e.g. screen shake)."""
+        s = self.scale
+        buffer = self.buffer
+        buffer.fill((self.ambient,) * 3)
+        cx = (player.rect.centerx + offset[0]) // s
+        cy = (player.rect.centery + offset[1]) // s
+        buffer.blit(self.light, (cx - self.radius, cy - self.radius), special_flags=pygame.BLEND_RGB_MAX)
+
+        mx, my = player.last_move
+        if mx or my:
+            self.heading = round(math.atan2(my, mx) / (2 * math.pi) * DARKNESS_CONE_DIRECTIONS) % DARKNESS_CONE_DIRECTIONS
+        if player.boost_active:
+            # The cone shrinks in DARKNESS_CONE_STEPS steps as the boost runs out
+            left = player.boost_timer / max(1, player.settings.get_boost_duration())
+            step = min(max(math.ceil(left * DARKNESS_CONE_STEPS), 1), DARKNESS_CONE_STEPS)
+            mask, (dx, dy) = self._cone(self.heading, step)
+            buffer.blit(mask, (cx + dx, cy + dy), special_flags=pygame.BLEND_RGB_MAX)
+
+        if s > 1:
+            scale = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+            scale(buffer, (WIDTH, HEIGHT), self.full)
+            buffer = self.full
+        screen.blit(buffer, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+# --- Benchmark ---
+
+def benchmark_darkness(frames=300, **kwargs):
+    """
+    Mean ms per Darkness.draw() for a boosting player turning in circles, with every cone mask
+    made beforehand. Returns (ms, cone masks).
+    """
+    from settings import Settings
+    from player import Player
+    screen = pygame.display.get_surface()
+    player = Player(WIDTH // 2, HEIGHT // 2, (255, 255, 255), Settings())
+    darkness = Darkness(**kwargs)
+    for heading in range(DARKNESS_CONE_DIRECTIONS):
+        for step in range(1, DARKNESS_CONE_STEPS + 1):
+            darkness._cone(heading, step)
+    player.boost_active = True
+    duration = player.settings.get_boost_duration()
+    start = time.perf_counter()
+    for i in range(frames):
+        angle = i * 0.05
+        player.last_move = (round(10 * math.cos(angle)), round(10 * math.sin(angle)))
+        player.boost_timer = duration - i % duration
+        darkness.draw(screen, player)
+    return (time.perf_counter() - start) / frames * 1000, darkness.cones
+
+def benchmark_rebuild(frames=300):
+    """For comparison: the same light as a new screen-sized alpha Surface every frame (as animate_menu_transition does)."""
+    screen = pygame.display.get_surface()
+    d = np.arange(-DARKNESS_LIGHT_RADIUS, DARKNESS_LIGHT_RADIUS + 1, dtype=np.float64)
+    hole = (255 - DARKNESS_AMBIENT) * _falloff(np.hypot(d[:, None], d[None, :]) / DARKNESS_LIGHT_RADIUS)
+    start = time.perf_counter()
+    for _ in range(frames):
+        surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 255 - DARKNESS_AMBIENT))
+        alpha = pygame.surfarray.pixels_alpha(surf)
+        x, y = WIDTH // 2 - DARKNESS_LIGHT_RADIUS, HEIGHT // 2 - DARKNESS_LIGHT_RADIUS
+        alpha[x:x + len(d), y:y + len(d)] = hole
+        del alpha
+        screen.blit(surf, (0, 0))
+    return (time.perf_counter() - start) / frames * 1000
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    print(f"{'new Surface every frame':<30} {benchmark_rebuild():.3f} ms/frame")
+    for label, kwargs in (("full resolution", {"half_res": False}),
+                          ("half resolution", {"half_res": True}),
+                          ("half resolution, smoothscale", {"half_res": True, "smooth": True})):
+        ms, cones = benchmark_darkness(**kwargs)
+        print(f"{label:<30} {ms:.3f} ms/frame ({cones} cone masks)")
+
+# --- End of darkness.py ---
@@ -0,0 +1,349 @@
+"""
+env.py — Hide & Seek+ Vectorized Training Environment
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Gym-style reset()/step(actions) over many independent headless Worlds run in lockstep.
+Observations are built for the whole batch at once, straight from World state (no pygame surfaces):
+  obs="state": a dict of fixed-size float32 arrays (OBS_SHAPES), entities relative to the player,
+               nearest first, padded with zero rows whose last feature (present) is 0
+  obs="grid":  an (N, len(GRID_CHANNELS), GRID_H, GRID_W) uint8 occupancy grid of GRID_CELL-pixel cells
+Rewards are the score a step earned (143 x multiplier per second survived), or that rate spread
+over every tick with reward="dense". Finished games are reset in place (autoreset); the last
+observation of a finished game is in info["final_observation"].
+
+VecEnv steps its worlds in this process; ParallelVecEnv shards them over worker processes (one
+VecEnv each) for throughput past a single core. Game seeds come from one SeedSequence per env,
+so episodes are the same for any worker count.
+
+    python env.py --envs 256 --steps 1000 --workers 8      # random-action throughput check
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing as mp
+import numpy as np
+from config import (
+    WIDTH, HEIGHT, FPS, SEEKER_SIZE, PLAYER_SIZE, PROJECTILE_SPEED, OBSTACLE_COUNT, THEMES, BOOST_COOLDOWN
+)
+from settings import Settings
+from world import World, INPUT_BOOST
+from bots import MOVES
+
+# Discrete actions: the 9 moves (stay + 8 directions), then the same 9 with boost pressed
+ACTIONS = np.array(MOVES + tuple(m | INPUT_BOOST for m in MOVES), dtype=np.int64)
+
+MAX_OBS_SEEKERS = 32
+MAX_OBS_PROJECTILES = 16
+MAX_OBS_POWERUPS = 2  # World never holds more than 2
+POWERUP_KINDS = ("shield", "slow", "multiplier", "heal")
+OBS_SHAPES = {
+    "player": (8,),  # x, y, boost ready, boost active, boost cooldown, slowmo, multiplier, seekers on field
+    "seekers": (MAX_OBS_SEEKERS, 3),  # dx, dy, present
+    "projectiles": (MAX_OBS_PROJECTILES, 5),  # dx, dy, vx, vy, present
+    "powerups": (MAX_OBS_POWERUPS, 7),  # dx, dy, one-hot POWERUP_KINDS, present
+    "obstacles": (OBSTACLE_COUNT, 5),  # dx, dy, w, h, present
+}
+GRID_CELL = 40
+GRID_W = WIDTH // GRID_CELL
+GRID_H = HEIGHT // GRID_CELL
+GRID_CHANNELS = ("player", "seekers", "projectiles", "powerups", "obstacles")
+_SCALE = np.array((WIDTH, HEIGHT), dtype=np.float32)
+
+# --- Batched observations ---
+
+def _rank_within(wid, dist2):
+    """Sort entities by (world, distance). Returns the order and each sorted entity's rank in its world."""
+    order = np.lexsort((dist2, wid))
+    wid = wid[order]
+    first = np.searchsorted(wid, wid, side="left")
+    return order, wid, np.arange(len(wid)) - first
+
+def _rasterize(grid, channel, wid, boxes):
+    """Mark every GRID_CELL cell that boxes (k, 4: x, y, w, h) of world wid (k,) overlap."""
+    if not len(wid):
+        return
+    x0 = np.clip(boxes[:, 0] // GRID_CELL, 0, GRID_W - 1)
+    y0 = np.clip(boxes[:, 1] // GRID_CELL, 0, GRID_H - 1)
+    x1 = np.clip((boxes[:, 0] + boxes[:, 2] - 1) // GRID_CELL, 0, GRID_W - 1)
+    y1 = np.clip((boxes[:, 1] + boxes[:, 3] - 1) // GRID_CELL, 0, GRID_H - 1)
+    span = int(max((x1 - x0).max(), (y1 - y0).max())) + 1
+    for oy in range(span):
+        for ox in range(span):
+            cx, cy = x0 + ox, y0 + oy
+            inside = (cx <= x1) & (cy <= y1)
+            grid[wid[inside], channel, cy[inside], cx[inside]] = 1
+
+def observe_state(worlds):
+    """OBS_SHAPES arrays for a list of Worlds, built with one set of array ops for the whole batch."""
+    n = len(worlds)
+    obs = {key: np.zeros((n,) + shape, dtype=np.float32) for key, shape in OBS_SHAPES.items()}
+    players = [w.player for w in worlds]
+    center = np.array([p.rect.center for p in players], dtype=np.float32).reshape(n, 2)
+    player = obs["player"]
+    player[:, :2] = center / _SCALE
+    player[:, 2:] = [(p.boost_cooldown == 0 and not p.boost_active, p.boost_active,
+                      p.boost_cooldown / BOOST_COOLDOWN, p.slowmo, w.multiplier / 5,
+                      len(w.seekers) / w.max_seekers) for p, w in zip(players, worlds)]
+
+    # Seekers: nearest MAX_OBS_SEEKERS per world
+    positions = [w.seekers.positions() for w in worlds]
+    counts = [len(p) for p in positions]
+    if sum(counts):
+        wid = np.repeat(np.arange(n), counts)
+        rel = (np.concatenate(positions) + SEEKER_SIZE / 2).astype(np.float32) - center[wid]
+        order, wid, rank = _rank_within(wid, (rel * rel).sum(axis=1))
+        keep = rank < MAX_OBS_SEEKERS
+        out = obs["seekers"]
+        out[wid[keep], rank[keep], :2] = rel[order[keep]] / _SCALE
+        out[wid[keep], rank[keep], 2] = 1
+
+    # Projectiles: nearest MAX_OBS_PROJECTILES per world
+    rows = [(i, p.rect.centerx, p.rect.centery, p.dx, p.dy) for i, w in enumerate(worlds) for p in w.projectiles]
+    if rows:
+        rows = np.array(rows, dtype=np.float32)
+        wid = rows[:, 0].astype(np.int64)
+        rel = rows[:, 1:3] - center[wid]
+        order, wid, rank = _rank_within(wid, (rel * rel).sum(axis=1))
+        keep = rank < MAX_OBS_PROJECTILES
+        out = obs["projectiles"]
+        out[wid[keep], rank[keep], :2] = rel[order[keep]] / _SCALE
+        out[wid[keep], rank[keep], 2:4] = rows[order[keep], 3:5] / PROJECTILE_SPEED
+        out[wid[keep], rank[keep], 4] = 1
+
+    # Powerups (in field order) and obstacles (in index order)
+    rows = [(i, j, p.rect.centerx, p.rect.centery, POWERUP_KINDS.index(p.kind))
+            for i, w in enumerate(worlds) for j, p in enumerate(w.powerups[:MAX_OBS_POWERUPS])]
+    if rows:
+        rows = np.array(rows, dtype=np.int64)
+        wid, slot = rows[:, 0], rows[:, 1]
+        out = obs["powerups"]
+        out[wid, slot, :2] = (rows[:, 2:4] - center[wid]) / _SCALE
+        out[wid, slot, 2 + rows[:, 4]] = 1
+        out[wid, slot, 6] = 1
+    boxes = np.stack([w.obstacle_grid.boxes()[:OBSTACLE_COUNT] for w in worlds]) if all(
+        len(w.obstacles) == OBSTACLE_COUNT for w in worlds) else None
+    out = obs["obstacles"]
+    if boxes is not None:
+        out[:, :, :2] = (boxes[:, :, :2] + boxes[:, :, 2:] / 2 - center[:, None, :]) / _SCALE
+        out[:, :, 2:4] = boxes[:, :, 2:] / _SCALE
+        out[:, :, 4] = 1
+    else:
+        # A layout that could not place every obstacle: fill world by world
+        for i, w in enumerate(worlds):
+            b = w.obstacle_grid.boxes()[:OBSTACLE_COUNT]
+            out[i, :len(b), :2] = (b[:, :2] + b[:, 2:] / 2 - center[i]) / _SCALE
+            out[i, :len(b), 2:4] = b[:, 2:] / _SCALE
+            out[i, :len(b), 4] = 1
+    return obs
+
+def observe_grid(worlds):
+    """(N, len(GRID_CHANNELS), GRID_H, GRID_W) uint8 occupancy for a list of Worlds."""
+    n = len(worlds)
+    grid = np.zeros((n, len(GRID_CHANNELS), GRID_H, GRID_W), dtype=np.uint8)
+    player = np.array([w.player.rect.topleft for w in worlds], dtype=np.int64).reshape(n, 2)
+    _rasterize(grid, 0, np.arange(n), np.column_stack((player, np.full((n, 2), PLAYER_SIZE))))
+    positions = [w.seekers.positions() for w in worlds]
+    counts = [len(p) for p in positions]
+    if sum(counts):
+        pos = np.concatenate(positions)
+        _rasterize(grid, 1, np.repeat(np.arange(n), counts), np.column_stack((pos, np.full_like(pos, SEEKER_SIZE))))
+    for channel, attr in ((2, "projectiles"), (3, "powerups")):
+        rows = [(i,) + tuple(e.rect) for i, w in enumerate(worlds) for e in getattr(w, attr)]
+        if rows:
+            rows = np.array(rows, dtype=np.int64)
+            _rasterize(grid, channel, rows[:, 0], rows[:, 1:])
+    boxes = [w.obstacle_grid.boxes() for w in worlds]
+    _rasterize(grid, 4, np.repeat(np.arange(n), [len(b) for b in boxes]), np.concatenate(boxes))
+    return grid
+
+OBSERVERS = {"state": observe_state, "grid": observe_grid}
+
+def _take(obs, index):
+    return {k: v[index] for k, v in obs.items()} if isinstance(obs, dict) else obs[index]
+
+def _put(obs, index, rows):
+    if isinstance(obs, dict):
+        for k, v in obs.items():
+            v[index] = rows[k]
+    else:
+        obs[index] = rows
+
+# --- Environments ---
+
+class VecEnv:
+    """
+    num_envs headless games stepped in lockstep. actions are indices into ACTIONS (or raw INPUT_*
+    masks with raw_actions=True); each is held for frame_skip ticks. Games end on game over
+    (terminated) or after max_ticks (truncated) and are reset with the env's next seed.
+    first_env offsets the per-env seed streams (ParallelVecEnv shards use it).
+    """
+    def __init__(self, num_envs, difficulty="Easy", obs="state", reward="score", seed=0, max_ticks=600 * FPS,
+                 frame_skip=1, raw_actions=False, first_env=0):
+        self.num_envs = num_envs
+        self.observe = OBSERVERS[obs]
+        self.dense = reward == "dense"
+        self.max_ticks = max_ticks
+        self.frame_skip = frame_skip
+        self.raw_actions = raw_actions
+        self.first_env = first_env
+        self.settings = Settings()
+        self.settings.difficulty = difficulty
+        self.settings.theme_name = next(iter(THEMES))
+        self.worlds = []
+        self._seed(seed)
+
+    def _seed(self, seed):
+        children = np.random.SeedSequence(seed).spawn(self.first_env + self.num_envs)[self.first_env:]
+        self.rngs = [np.random.default_rng(child) for child in children]
+
+    def _new_world(self, i):
+        return World(self.settings, particles=False, seed=int(self.rngs[i].integers(1 << 32)))
+
+    def reset(self, seed=None):
+        """Start a new game in every env. Returns (obs, info)."""
+        if seed is not None:
+            self._seed(seed)
+        self.worlds = [self._new_world(i) for i in range(self.num_envs)]
+        self.scores = np.zeros(self.num_envs, dtype=np.int64)
+        return self.observe(self.worlds), {"seed": np.array([w.seed for w in self.worlds])}
+
+    def step(self, actions):
+        """Advance every game frame_skip ticks. Returns (obs, reward, terminated, truncated, info)."""
+        masks = (np.asarray(actions) if self.raw_actions else ACTIONS[actions]).tolist()
+        worlds = self.worlds
+        reward = np.zeros(self.num_envs, dtype=np.float32)
+        for _ in range(self.frame_skip):
+            if self.dense:
+                reward += [0.0 if w.game_over else 143 * w.multiplier / FPS for w in worlds]
+            for world, mask in zip(worlds, masks):
+                world.step(mask)
+            masks = [m & ~INPUT_BOOST for m in masks]  # Boost is edge-triggered: press it once
+        scores = np.array([w.score for w in worlds], dtype=np.int64)
+        if not self.dense:
+            reward += scores - self.scores
+        self.scores = scores
+        terminated = np.array([w.game_over for w in worlds])
+        truncated = ~terminated & (np.array([w.tick for w in worlds]) >= self.max_ticks)
+        obs = self.observe(worlds)
+        info = {}
+        done = np.flatnonzero(terminated | truncated)
+        if len(done):
+            info["final_observation"] = _take(obs, done)
+            info["final_index"] = done
+            info["final_score"] = scores[done]
+            info["final_ticks"] = np.array([worlds[i].tick for i in done])
+            for i in done.tolist():
+                worlds[i] = self._new_world(i)
+            self.scores[done] = 0
+            _put(obs, done, self.observe([worlds[i] for i in done.tolist()]))
+        return obs, reward, terminated, truncated, info
+
+    def close(self):
+        self.worlds = []
+
+def _worker(conn, kwargs):
+    env = VecEnv(**kwargs)
+    while True:
+        cmd, data = conn.recv()
+        if cmd == "step":
+            conn.send(env.step(data))
+        elif cmd == "reset":
+            conn.send(env.reset(data))
+        else:
+            conn.close()
+            return
+
+class ParallelVecEnv:
+    """
+    VecEnv sharded over `workers` processes (pipes, one message per shard per step), for batches
+    larger than one core can step. Same arguments, API and episodes as VecEnv.
+    """
+    def __init__(self, num_envs, workers=None, **kwargs):
+        workers = max(1, min(workers or os.cpu_count(), num_envs))
+        self.num_envs = num_envs
+        bounds = np.linspace(0, num_envs, workers + 1).astype(int)
+        self.slices = [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+        self.conns = []
+        self.procs = []
+        for shard in self.slices:
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_worker, daemon=True,
+                              args=(child, dict(kwargs, num_envs=shard.stop - shard.start, first_env=shard.start)))
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+
+    def reset(self, seed=None):
+        for conn in self.conns:
+            conn.send(("reset", seed))
+        results = [conn.recv() for conn in self.conns]
+        return _concat([r[0] for r in results]), {"seed": np.concatenate([r[1]["seed"] for r in results])}
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        for conn, shard in zip(self.conns, self.slices):
+            conn.send(("step", actions[shard]))
+        results = [conn.recv() for conn in self.conns]
+        obs = _concat([r[0] for r in results])
+        reward, terminated, truncated = (np.concatenate([r[k] for r in results]) for k in (1, 2, 3))
+        info = {}
+        finals = [(shard, r[4]) for shard, r in zip(self.slices, results) if r[4]]
+        if finals:
+            info["final_observation"] = _concat([f["final_observation"] for _, f in finals])
+            info["final_index"] = np.concatenate([f["final_index"] + shard.start for shard, f in finals])
+            for key in ("final_score", "final_ticks"):
+                info[key] = np.concatenate([f[key] for _, f in finals])
+        return obs, reward, terminated, truncated, info
+
+    def close(self):
+        for conn in self.conns:
+            conn.send(("close", None))
+        for proc in self.procs:
+            proc.join()
+        self.conns = []
+
+def _concat(parts):
+    if isinstance(parts[0], dict):
+        return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+    return np.concatenate(parts)
+
+def make_env(num_envs, workers=1, **kwargs):
+    """VecEnv for workers=1 (in-process), else a ParallelVecEnv (workers=None: one per CPU)."""
+    if workers == 1:
+        return VecEnv(num_envs, **kwargs)
+    return ParallelVecEnv(num_envs, workers, **kwargs)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hide & Seek+ vectorized environment throughput check")
+    parser.add_argument("--envs", type=int, default=256)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1, help="processes (1 = in-process VecEnv, 0 = one per CPU)")
+    parser.add_argument("--difficulty", choices=("Easy", "Hard", "Master"), default="Easy")
+    parser.add_argument("--obs", choices=sorted(OBSERVERS), default="state")
+    parser.add_argument("--frame-skip", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    env = make_env(args.envs, args.workers or None, difficulty=args.difficulty, obs=args.obs,
+                   seed=args.seed, frame_skip=args.frame_skip)
+    rng = np.random.default_rng(args.seed)
+    env.reset()
+    episodes = 0
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        _, _, terminated, truncated, info = env.step(rng.integers(len(ACTIONS), size=args.envs))
+        episodes += len(info.get("final_index", ()))
+    elapsed = time.perf_counter() - start
+    env.close()
+    steps = args.envs * args.steps
+    print(f"{steps:,} env steps ({args.envs} envs x {args.steps}, {args.obs} obs, frame skip {args.frame_skip}) "
+          f"on {args.workers or os.cpu_count()} workers in {elapsed:.2f}s: {steps / elapsed:,.0f} steps/sec, "
+          f"{episodes} episodes finished")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- End of env.py ---
@@ -0,0 +1,178 @@
+"""
+flowfield.py — Hide & Seek+ Seeker Flow Field
+CrystalCard-hub, Copilot (2025 Refined Edition)
+One shared path map for every seeker. The field is a grid of FLOW_CELL_SIZE cells; a cell is free
+when a seeker centered on it clears every obstacle. The map is a BFS distance field from the
+player's cell over the free cells, and a seeker that an obstacle turned back heads for its cell's
+next cell on a shortest route to the player (seeker.py: the detour state).
+
+The work is O(grid) at most and only happens when something changes:
+  set_obstacles()  free cells and neighbor lists   (reset, and after every obstacle relocation)
+  set_goal()       drops the distance field        (the player entered another cell)
+  lookups          resume the BFS just far enough to settle the asked cell, cache its next cell
+Seekers chase the player, so most lookups settle within a few rings around the goal.
+"""
+
+import numpy as np
+from config import WIDTH, HEIGHT, SEEKER_SIZE, FLOW_CELL_SIZE
+
+# Neighbor offsets (dx, dy): 4 orthogonal, then 4 diagonal
+_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+_FAR = 1 << 20  # Distance of cells the BFS has not reached (yet)
+
+class FlowField:
+    """
+    Shared seeker path map over the field. `agent` is the size of the square that has to fit
+    (obstacles are grown by half of it). searches counts BFS restarts, goal_changes set_goal()
+    calls that moved the goal.
+    """
+    def __init__(self, cell=FLOW_CELL_SIZE, agent=SEEKER_SIZE):
+        self.cell = cell
+        self.grow = agent / 2
+        self.cols = WIDTH // cell
+        self.rows = HEIGHT // cell
+        self.goal = -1
+        self.goal_point = (0, 0)
+        self.searches = 0
+        self.goal_changes = 0
+        self.set_obstacles(np.zeros((0, 4), dtype=np.int64))
+
+    def __getstate__(self):
+        # Derived tables are rebuilt from the boxes, which keeps pickled Worlds (replay keyframes) small
+        state = self.__dict__.copy()
+        for key in ("free", "neighbors", "units", "_dist", "_queue", "_next"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        goal, point = self.goal, self.goal_point
+        self.set_obstacles(self.boxes)
+        if goal >= 0:
+            self.set_goal(*point)
+
+    # --- Rebuilds ---
+
+    def set_obstacles(self, boxes):
+        """New obstacle layout ((n, 4) x, y, w, h): recompute free cells and neighbor lists."""
+        self.boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4).copy()
+        cols, rows, cell = self.cols, self.rows, self.cell
+        ys, xs = np.divmod(np.arange(cols * rows), cols)
+        cx = xs[:, None] * cell + cell / 2
+        cy = ys[:, None] * cell + cell / 2
+        x, y, w, h = (self.boxes[:, k] for k in range(4))
+        grow = self.grow
+        inside = (cx > x - grow) & (cx < x + w + grow) & (cy > y - grow) & (cy < y + h + grow)
+        free = (~inside.any(axis=1)).tolist()
+
+        # Neighbor lists: free cells one step away, without diagonals that clip a blocked corner.
+        # units holds the matching unit step vectors for the tie-break toward the player.
+        neighbors, units = [], []
+        for i in range(cols * rows):
+            ix, iy = i % cols, i // cols
+            row, unit = [], []
+            for dx, dy in _OFFSETS:
+                nx, ny = ix + dx, iy + dy
+                if not (0 <= nx < cols and 0 <= ny < rows and free[ny * cols + nx]):
+                    continue
+                if dx and dy and not (free[iy * cols + nx] and free[ny * cols + ix]):
+                    continue
+                row.append(ny * cols + nx)
+                unit.append((dx * 0.7071, dy * 0.7071) if dx and dy else (dx, dy))
+            neighbors.append(row)
+            units.append(unit)
+        self.free = free
+        self.neighbors = neighbors
+        self.units = units
+        self.goal = -1
+
+    def cell_of(self, x, y):
+        cx = min(max(int(x) // self.cell, 0), self.cols - 1)
+        cy = min(max(int(y) // self.cell, 0), self.rows - 1)
+        return cy * self.cols + cx
+
+    def center_of(self, cell):
+        cy, cx = divmod(cell, self.cols)
+        return cx * self.cell + self.cell // 2, cy * self.cell + self.cell // 2
+
+    def set_goal(self, x, y):
+        """Chase (x, y). Only does work when that lies in a different cell than the last goal."""
+        cell = self.cell_of(x, y)
+        if cell == self.goal:
+            return
+        self.goal = cell
+        self.goal_point = (x, y)
+        self.goal_changes += 1
+        self._dist = None
+        self._next = {}
+
+    # --- Search ---
+
+    def _settle(self, cell):
+        """Resume the BFS from the goal until `cell` has its distance (or the search runs dry)."""
+        if self._dist is None:
+            self.searches += 1
+            self._dist = [_FAR] * len(self.neighbors)
+            self._dist[self.goal] = 0
+            self._queue = [self.goal]
+            self._head = 0
+        dist, queue, neighbors = self._dist, self._queue, self.neighbors
+        head = self._head
+        while dist[cell] == _FAR and head < len(queue):
+            i = queue[head]
+            head += 1
+            d = dist[i] + 1
+            for j in neighbors[i]:
+                if dist[j] == _FAR:
+                    dist[j] = d
+                    queue.append(j)
+        self._head = head
+
+    def next_cell(self, cell):
+        """
+        The neighbor of `cell` one step closer to the goal (ties broken toward the player), or -1
+        at the goal and where no route exists. A blocked cell (a seeker squeezed against an
+        obstacle) steps to its closest free neighbor.
+        """
+        nxt = self._next.get(cell)
+        if nxt is not None:
+            return nxt
+        nxt = -1
+        if cell != self.goal:
+            # BFS settles layer by layer: once a cell has a distance, every cell one step
+            # closer already has its own
+            if self.free[cell]:
+                self._settle(cell)
+            else:
+                for j in self.neighbors[cell]:
+                    self._settle(j)
+            dist = self._dist
+            here = dist[cell] if self.free[cell] else _FAR + 1
+            ox, oy = self.center_of(cell)
+            gx, gy = self.goal_point[0] - ox, self.goal_point[1] - oy
+            best = None
+            for j, (ux, uy) in zip(self.neighbors[cell], self.units[cell]):
+                key = (dist[j], -(ux * gx + uy * gy))
+                if dist[j] < here and (best is None or key < best):
+                    best, nxt = key, j
+        self._next[cell] = nxt
+        return nxt
+
+    # --- Lookups ---
+
+    def waypoint(self, x, y):
+        """Center of the next cell for a seeker centered at (x, y), or None to head straight for the player."""
+        nxt = self.next_cell(self.cell_of(x, y))
+        return self.center_of(nxt) if nxt >= 0 else None
+
+    def waypoints(self, points):
+        """Batched waypoint() for (n, 2) centers: (targets (n, 2), found (n,) bool)."""
+        cx = np.minimum(np.maximum(points[:, 0] // self.cell, 0), self.cols - 1)
+        cy = np.minimum(np.maximum(points[:, 1] // self.cell, 0), self.rows - 1)
+        next_cell = self.next_cell
+        nxt = np.array([next_cell(c) for c in (cy * self.cols + cx).tolist()], dtype=np.int64)
+        ny, nx = np.divmod(nxt, self.cols)
+        targets = np.column_stack((nx, ny)) * self.cell + self.cell // 2
+        return targets, nxt >= 0
+
+# --- End of flowfield.py ---
@@ -0,0 +1,73 @@
+"""
+fonts.py — Hide & Seek+ Font Registry and Text Cache
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Every UI font is opened once per size through FONTS, and rendered strings are kept in TEXT,
+a bounded LRU cache keyed by (font, text, color), so unchanged HUD and menu text is never re-rendered.
+"""
+
+import pygame
+from collections import OrderedDict
+from config import FONT_NAME, TEXT_CACHE_SIZE
+
+class FontRegistry:
+    """Loads each (name, size) font once and hands out the same Font object afterwards."""
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, size, name=FONT_NAME):
+        font = self.fonts.get((name, size))
+        if font is None:
+            font = self.fonts[(name, size)] = pygame.font.Font(name, size)
+        return font
+
+    def clear(self):
+        self.fonts.clear()
+
+class TextCache:
+    """
+    Rendered text surfaces, most recently used last. When full, the least recently used
+    surface is evicted. hits/misses/evictions are kept for stats().
+    """
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = self.surfaces[key] = font.render(text, True, color)
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+FONTS = FontRegistry()
+TEXT = TextCache()
+
+def render_text(size, text, color):
+    """Cached render of `text` in the UI font at `size`."""
+    return TEXT.render(FONTS.get(size), text, color)
+
+# --- End of fonts.py ---
@@ -0,0 +1,171 @@
+"""
+freespace.py — Hide & Seek+ Free-Space Map
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Where a square of a given size fits between the obstacles, for spawning and unsticking without
+random probing. For each (size, margin) in use the map holds, on a grid of FREE_MAP_CELL px
+top-left positions:
+  - which positions are free (the square clears every obstacle, tested exactly like Rect.colliderect)
+  - for every blocked position, the nearest free one (an exact Euclidean distance transform:
+    nearest free column per row, then the nearest of those over all rows)
+  - the free positions as one index array, and the free ones on the field edge
+so "nearest free position to (x, y)" and "random free position" are table lookups.
+
+set_obstacles() only stores the boxes; a map is built on its first query after that (about a
+millisecond for the default obstacles), so the obstacles can change every tick of a relocation.
+
+    python freespace.py             # time map builds and queries for a few obstacle counts
+"""
+
+import math
+import time
+import random
+import numpy as np
+from config import WIDTH, HEIGHT, FREE_MAP_CELL
+from spatial import boxes_overlap_any
+
+class _Map:
+    """Free-space tables for one (size, margin)."""
+    def __init__(self, boxes, size, margin, cell):
+        hi_x, hi_y = WIDTH - margin - size, HEIGHT - margin - size
+        # Grid positions, the last one pinned to the far limit so the field edges are included
+        self.xs = np.minimum(margin + np.arange(math.ceil((hi_x - margin) / cell) + 1) * cell, hi_x)
+        self.ys = np.minimum(margin + np.arange(math.ceil((hi_y - margin) / cell) + 1) * cell, hi_y)
+        self.margin = margin
+        self.cell = cell
+        xs, ys = self.xs, self.ys
+        nx, ny = len(xs), len(ys)
+
+        # Blocked positions: x in (ox - size, ox + w) and y in (oy - size, oy + h) for some box
+        blocked = np.zeros((nx, ny), dtype=bool)
+        if len(boxes):
+            x, y, w, h = boxes.T
+            x0, x1 = np.searchsorted(xs, x - size, "right"), np.searchsorted(xs, x + w, "left")
+            y0, y1 = np.searchsorted(ys, y - size, "right"), np.searchsorted(ys, y + h, "left")
+            for a, b, c, d in zip(x0.tolist(), x1.tolist(), y0.tolist(), y1.tolist()):
+                blocked[a:b, c:d] = True
+        free = ~blocked
+
+        # Distance transform, pass 1: nearest free position in the same row (left or right)
+        idx = np.broadcast_to(np.arange(nx)[:, None], (nx, ny))
+        left = np.maximum.accumulate(np.where(free, idx, -1), axis=0)
+        right = np.minimum.accumulate(np.where(free, idx, nx)[::-1], axis=0)[::-1]
+        dl = np.where(left >= 0, xs[idx] - xs[np.maximum(left, 0)], np.inf)
+        dr = np.where(right < nx, xs[np.minimum(right, nx - 1)] - xs[idx], np.inf)
+        col = np.where(dl <= dr, left, right)
+        g = np.minimum(dl, dr)
+        # Pass 2, blocked positions only: the best row-nearest over every row
+        self.near_x = np.broadcast_to(xs[:, None], (nx, ny)).copy()
+        self.near_y = np.broadcast_to(ys[None, :], (nx, ny)).copy()
+        bi, bj = np.nonzero(blocked)
+        if len(bi):
+            d2 = (ys[bj][:, None] - ys[None, :]) ** 2 + g[bi] ** 2
+            row = np.argmin(d2, axis=1)
+            found = np.isfinite(d2[np.arange(len(bi)), row])
+            self.near_x[bi, bj] = np.where(found, xs[col[bi, row].clip(0, nx - 1)], -1)
+            self.near_y[bi, bj] = np.where(found, ys[row], -1)
+
+        self.free = np.flatnonzero(free.ravel())  # Flat index i * ny + j of every free position
+        edge = free.copy()
+        edge[1:-1, 1:-1] = False
+        self.edge = np.flatnonzero(edge.ravel())
+        self.ny = ny
+
+    def position(self, k):
+        i, j = divmod(int(k), self.ny)
+        return int(self.xs[i]), int(self.ys[j])
+
+class FreeSpace:
+    """
+    Free-space maps of the current obstacles, one per (size, margin) queried. Positions are
+    top-left corners; margin keeps them that far from the field edges. builds counts map builds.
+    Pickles without the maps (they are rebuilt on demand).
+    """
+    def __init__(self, cell=FREE_MAP_CELL):
+        self.cell = cell
+        self.boxes = np.zeros((0, 4), dtype=np.int64)
+        self.maps = {}
+        self.builds = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["maps"] = {}
+        return state
+
+    def set_obstacles(self, boxes):
+        """New obstacle layout ((n, 4) x, y, w, h); maps are rebuilt when next needed."""
+        self.boxes = np.array(boxes, dtype=np.int64).reshape(-1, 4)
+        self.maps = {}
+
+    def _map(self, size, margin):
+        m = self.maps.get((size, margin))
+        if m is None:
+            m = self.maps[(size, margin)] = _Map(self.boxes, size, margin, self.cell)
+            self.builds += 1
+        return m
+
+    def nearest(self, x, y, size, margin=0):
+        """
+        The free position closest to top-left (x, y) (itself if that grid position is free), to
+        within one map cell. (x, y) unchanged if nothing is free.
+        """
+        m = self._map(size, margin)
+        i = min(max(round((x - margin) / self.cell), 0), len(m.xs) - 1)
+        j = min(max(round((y - margin) / self.cell), 0), len(m.ys) - 1)
+        nx, ny = int(m.near_x[i, j]), int(m.near_y[i, j])
+        return (nx, ny) if nx >= 0 else (x, y)
+
+    def random_free(self, size, rng, margin=0):
+        """A uniformly random free position (rng: random.Random), or None if nothing is free."""
+        m = self._map(size, margin)
+        if len(m.free) == 0:
+            return None
+        return m.position(m.free[rng.randrange(len(m.free))])
+
+    def random_edge(self, size, rng, others=None, other_size=None):
+        """
+        A random free position on the field edge clear of the `others` squares ((n, 2) top-lefts
+        of other_size, default `size`). Falls back to any free edge position, then to any free
+        position, then to (0, 0) when nothing is free at all.
+        """
+        m = self._map(size, 0)
+        edge = m.edge
+        if others is not None and len(others) and len(edge):
+            i, j = np.divmod(edge, m.ny)
+            spots = np.column_stack((m.xs[i], m.ys[j]))
+            clear = edge[~boxes_overlap_any(spots, size, others, other_size or size)]
+            if len(clear):
+                edge = clear
+        if len(edge):
+            return m.position(edge[rng.randrange(len(edge))])
+        return self.random_free(size, rng) or (0, 0)
+
+# --- Benchmark ---
+
+def benchmark_free_space(obstacles=8, size=40, repeats=200, seed=0):
+    """(ms per map build, ms per nearest(), ms per random_free()) with `obstacles` random 80 px boxes."""
+    rng = np.random.default_rng(seed)
+    boxes = np.column_stack((rng.integers(0, WIDTH - 80, obstacles), rng.integers(0, HEIGHT - 80, obstacles),
+                             np.full(obstacles, 80), np.full(obstacles, 80)))
+    free = FreeSpace()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        free.set_obstacles(boxes)
+        free._map(size, 0)
+    build_ms = (time.perf_counter() - start) / repeats * 1000
+    points = (rng.random((repeats, 2)) * (WIDTH, HEIGHT)).astype(int).tolist()
+    start = time.perf_counter()
+    for x, y in points:
+        free.nearest(x, y, size)
+    nearest_ms = (time.perf_counter() - start) / repeats * 1000
+    r = random.Random(seed)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        free.random_free(size, r)
+    return build_ms, nearest_ms, (time.perf_counter() - start) / repeats * 1000
+
+if __name__ == "__main__":
+    for obstacles in (8, 64, 150, 300):
+        build_ms, nearest_ms, random_ms = benchmark_free_space(obstacles)
+        print(f"{obstacles:>4} obstacles: build {build_ms:.3f} ms, nearest {nearest_ms:.4f} ms, random {random_ms:.4f} ms")
+
+# --- End of freespace.py ---
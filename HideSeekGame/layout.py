@@ -0,0 +1,126 @@
+"""
+layout.py — Hide & Seek+ Obstacle Layouts
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Obstacle layouts from a jittered grid instead of rejection sampling, so they are always made in
+bounded time, however many obstacles are asked for.
+
+sample_layout() splits the field into a grid of cells, each at least one obstacle wide, and puts
+one candidate box at a random spot inside every cell, in random order. Boxes in different cells
+never overlap. place_obstacles() takes the first `count` candidates that clear the rects to
+avoid (the player), so the only per-placement work is one pass over the candidates. The grid is
+sized for about twice as many cells as obstacles (for spread and spares), down to obstacle-sized
+cells; past that, the layout holds every obstacle that fits.
+
+LayoutPrefetch samples the next layout on a background thread while the current one stands.
+Its seed is drawn from the game's stream up front, so the result never depends on thread timing
+and games stay deterministic.
+
+    python layout.py                # time layouts from 8 to hundreds of obstacles
+"""
+
+import math
+import time
+import threading
+import numpy as np
+import pygame
+from config import WIDTH, HEIGHT, OBSTACLE_SIZE
+
+# --- Sampling ---
+
+def grid_shape(count, size=OBSTACLE_SIZE):
+    """(cols, rows) of the cell grid for `count` obstacles of `size`: about 2 * count + 4 cells."""
+    cell = math.sqrt(WIDTH * HEIGHT / (2 * count + 4))
+    cols = min(max(math.ceil(WIDTH / cell), 1), WIDTH // size)
+    rows = min(max(math.ceil(HEIGHT / cell), 1), HEIGHT // size)
+    return cols, rows
+
+def sample_layout(count, size=OBSTACLE_SIZE, seed=None):
+    """
+    Candidate boxes for a layout of `count` obstacles: an (n, 4) int array of x, y, w, h, one per
+    grid cell, in random order. Deterministic for a given seed.
+    """
+    rng = np.random.default_rng(seed)
+    cols, rows = grid_shape(count, size)
+    cw, ch = WIDTH / cols, HEIGHT / rows
+    cells = rng.permutation(cols * rows)
+    cy, cx = np.divmod(cells, cols)
+    jitter = rng.random((len(cells), 2))
+    boxes = np.empty((len(cells), 4), dtype=np.int64)
+    boxes[:, 0] = cx * cw + jitter[:, 0] * (cw - size)
+    boxes[:, 1] = cy * ch + jitter[:, 1] * (ch - size)
+    boxes[:, 2:] = size
+    return boxes
+
+def place_obstacles(candidates, count, avoid=()):
+    """Rects for the first `count` candidate boxes that overlap none of the `avoid` rects."""
+    clear = np.ones(len(candidates), dtype=bool)
+    x, y, w, h = candidates.T
+    for r in avoid:
+        clear &= ~((x < r.right) & (x + w > r.x) & (y < r.bottom) & (y + h > r.y))
+    return [pygame.Rect(box) for box in candidates[clear][:count].tolist()]
+
+# --- Background Prefetch ---
+
+class LayoutPrefetch:
+    """
+    The next layout's candidates, sampled on a background thread. prefetch(seed) starts one,
+    result() waits for it (normally long finished) and hands it over. Pickles with the result
+    in place of the thread.
+    """
+    def __init__(self, count, size=OBSTACLE_SIZE):
+        self.count = count
+        self.size = size
+        self.seed = None
+        self.candidates = None
+        self.thread = None
+
+    def __getstate__(self):
+        self._join()
+        state = self.__dict__.copy()
+        state["thread"] = None
+        return state
+
+    def prefetch(self, seed):
+        self._join()
+        self.seed = seed
+        self.candidates = None
+        self.thread = threading.Thread(target=self._sample, daemon=True)
+        self.thread.start()
+
+    def _sample(self):
+        self.candidates = sample_layout(self.count, self.size, self.seed)
+
+    def _join(self):
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def result(self):
+        """Candidates of the prefetched layout (sampled here if prefetch() was never called)."""
+        self._join()
+        if self.candidates is None:
+            self._sample()
+        candidates, self.candidates = self.candidates, None
+        return candidates
+
+# --- Benchmark ---
+
+def benchmark_layout(count, size=OBSTACLE_SIZE, repeats=50):
+    """(ms to sample a layout, ms to place it around a player rect, obstacles placed)."""
+    player = pygame.Rect(WIDTH // 2, HEIGHT // 2, 40, 40)
+    start = time.perf_counter()
+    for seed in range(repeats):
+        candidates = sample_layout(count, size, seed)
+    sample_ms = (time.perf_counter() - start) / repeats * 1000
+    start = time.perf_counter()
+    for _ in range(repeats):
+        placed = place_obstacles(candidates, count, [player])
+    return sample_ms, (time.perf_counter() - start) / repeats * 1000, len(placed)
+
+if __name__ == "__main__":
+    for count, size in ((8, OBSTACLE_SIZE), (64, OBSTACLE_SIZE), (150, OBSTACLE_SIZE), (300, 40), (600, 24)):
+        sample_ms, place_ms, placed = benchmark_layout(count, size)
+        print(f"{count:>4} obstacles of {size:>2} px: sample {sample_ms:.3f} ms (background), "
+              f"place {place_ms:.3f} ms (relocation frame), {placed} placed")
+
+# --- End of layout.py ---
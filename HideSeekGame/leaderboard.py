@@ -0,0 +1,214 @@
+"""
+leaderboard.py — Hide & Seek+ Replay-Verified Leaderboard
+CrystalCard-hub, Copilot (2025 Refined Edition)
+A leaderboard entry is "score|name|ref", where ref names the replay that produced it
+(REPLAY_DIR/<ref>.hsr, ref = hash of the replay bytes). A score is only accepted once the replay
+re-simulated on the headless World reproduces it exactly. Games played with a difficulty profile
+carry its tables in the replay (so they re-simulate under them) and its id as a fourth field,
+"score|name|ref|profile", in SUBMISSIONS_FILE.
+
+submit() verifies one finished game; submit_async() does so in a background process, so the
+game-over screen (main.py) shows at once and picks up the board when the verdict arrives. The CLI re-checks a
+backlog: every entry of SUBMISSIONS_FILE and the leaderboard, re-simulated across a process pool
+in chunks. Re-simulated scores are cached per ref in VERDICT_CACHE_FILE (a ref is a content hash,
+so a cached result never goes stale); entries whose replay is missing or whose claimed score
+diverges are rejected, and --rebuild rewrites the leaderboard from the accepted ones.
+
+    python leaderboard.py --workers 8            # verify submissions + leaderboard, report ticks/sec
+    python leaderboard.py --rebuild              # ... and keep only verified entries on the board
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from config import (
+    LEADERBOARD_FILE, REPLAY_DIR, SUBMISSIONS_FILE, VERDICT_CACHE_FILE, read_leaderboard, parse_entry, submit_score
+)
+from replay import Replay
+
+DEFAULT_CHUNK = 20  # Replays re-simulated per pool task
+
+# --- Replay References ---
+
+def replay_ref(replay):
+    return hashlib.sha1(replay.to_bytes()).hexdigest()[:16]
+
+def replay_path(ref, directory=REPLAY_DIR):
+    return os.path.join(directory, f"{ref}.hsr")
+
+def store_replay(replay, directory=REPLAY_DIR):
+    """Save `replay` under its content hash and return the ref."""
+    ref = replay_ref(replay)
+    os.makedirs(directory, exist_ok=True)
+    path = replay_path(ref, directory)
+    if not os.path.exists(path):
+        replay.save(path)
+    return ref
+
+# --- Re-simulation ---
+
+def resimulate(ref, directory=REPLAY_DIR):
+    """Verdict for one replay: {"score": replayed score, "ticks": ticks} or {"error": reason}."""
+    try:
+        replay = Replay.load(replay_path(ref, directory))
+    except (OSError, ValueError, IndexError) as e:
+        return {"error": f"unreadable replay ({e.__class__.__name__})"}
+    if replay_ref(replay) != ref:
+        return {"error": "replay does not match its ref"}
+    world = replay.simulate()
+    return {"score": world.score, "ticks": world.tick}
+
+def resimulate_chunk(refs, directory=REPLAY_DIR):
+    """Worker entry point: verdicts for a list of refs."""
+    return [(ref, resimulate(ref, directory)) for ref in refs]
+
+class VerdictCache:
+    """Re-simulation verdicts on disk, keyed by replay ref."""
+    def __init__(self, path=VERDICT_CACHE_FILE):
+        self.path = path
+        self.verdicts = {}
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                self.verdicts = json.load(f)
+
+    def save(self):
+        if self.path:
+            with open(self.path, "w") as f:
+                json.dump(self.verdicts, f)
+
+def resimulate_all(refs, cache, workers=None, chunk=DEFAULT_CHUNK, directory=REPLAY_DIR, progress=None):
+    """
+    Re-simulate every ref not yet in `cache` (workers=1 runs inline), storing the verdicts.
+    Returns (refs re-simulated, ticks re-simulated, seconds).
+    """
+    todo = sorted(set(refs) - cache.verdicts.keys())
+    chunks = [todo[i:i + chunk] for i in range(0, len(todo), chunk)]
+    ticks = 0
+    start = time.perf_counter()
+
+    def merge(results):
+        nonlocal ticks
+        for ref, verdict in results:
+            cache.verdicts[ref] = verdict
+            ticks += verdict.get("ticks", 0)
+        if progress:
+            progress(len(results))
+
+    if workers == 1:
+        for refs in chunks:
+            merge(resimulate_chunk(refs, directory))
+    elif chunks:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(resimulate_chunk, refs, directory) for refs in chunks]):
+                merge(future.result())
+    return len(todo), ticks, time.perf_counter() - start
+
+# --- Verification ---
+
+def judge(entry, cache):
+    """(accepted, reason) for a (score, name, ref) entry against the cached verdicts."""
+    score, _, ref = entry
+    if not ref:
+        return score == 0, "no replay" if score else "empty slot"
+    verdict = cache.verdicts.get(ref)
+    if verdict is None:
+        return False, "not verified"
+    if "error" in verdict:
+        return False, verdict["error"]
+    if verdict["score"] != score:
+        return False, f"claimed {score}, replay scores {verdict['score']}"
+    return True, "ok"
+
+def submit(replay, name, cache=None):
+    """
+    Verify a finished game's replay inline and, if it reproduces replay.score, store it and add
+    the entry to the leaderboard and SUBMISSIONS_FILE. Returns (accepted, leaderboard lines).
+    """
+    world = replay.simulate()
+    if world.score != replay.score:
+        return False, read_leaderboard()
+    ref = store_replay(replay)
+    if cache is not None:
+        cache.verdicts[ref] = {"score": world.score, "ticks": world.tick}
+    tag = f"|{replay.profile_id}" if replay.profile else ""
+    with open(SUBMISSIONS_FILE, "a") as f:
+        f.write(f"{replay.score}|{name}|{ref}{tag}\n")
+    return True, submit_score(replay.score, name, ref)
+
+_verifier = None  # One background process for submit_async(), started on first use
+
+def submit_async(replay, name):
+    """submit() in a background process. Returns a Future of its (accepted, leaderboard lines)."""
+    global _verifier
+    if _verifier is None:
+        # spawn: a fresh interpreter rather than a fork of the running game (display, threads)
+        _verifier = ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn"))
+    return _verifier.submit(submit, replay, name)
+
+def read_submissions(path=SUBMISSIONS_FILE):
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        return [parse_entry(line) for line in f if line.strip()]
+
+def rebuild_leaderboard(accepted, size=5):
+    """Rewrite LEADERBOARD_FILE with the best `size` accepted entries (empty slots as 0|AAA)."""
+    best = sorted(set(accepted), key=lambda e: e[0], reverse=True)[:size]
+    lines = [f"{score}|{name}|{ref}" if ref else f"{score}|{name}" for score, name, ref in best]
+    lines += ["0|AAA"] * (size - len(lines))
+    with open(LEADERBOARD_FILE, "w") as f:
+        for line in lines:
+            f.write(f"{line}\n")
+    return lines
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-simulate leaderboard submissions and reject diverging scores")
+    parser.add_argument("--submissions", default=SUBMISSIONS_FILE, help="submission log to verify")
+    parser.add_argument("--replays", default=REPLAY_DIR, help="directory of <ref>.hsr replays")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes (1 = run inline)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="replays per pool task")
+    parser.add_argument("--cache", default=VERDICT_CACHE_FILE, help="verdict cache file ('' to disable)")
+    parser.add_argument("--rebuild", action="store_true", help="rewrite the leaderboard from the accepted entries")
+    args = parser.parse_args(argv)
+
+    board = [parse_entry(line) for line in read_leaderboard() if line.strip()]
+    entries = read_submissions(args.submissions) + board
+    cache = VerdictCache(args.cache or None)
+    cached = sum(1 for _, _, ref in entries if ref in cache.verdicts)
+
+    done = 0
+    def progress(count):
+        nonlocal done
+        done += count
+        print(f"\r{done} replays re-simulated", end="", file=sys.stderr, flush=True)
+
+    count, ticks, elapsed = resimulate_all([ref for _, _, ref in entries if ref], cache, args.workers, args.chunk,
+                                           args.replays, progress)
+    if count:
+        print(file=sys.stderr)
+    cache.save()
+
+    accepted, rejected = [], []
+    for entry in entries:
+        ok, reason = judge(entry, cache)
+        (accepted if ok else rejected).append((entry, reason))
+    print(f"{len(entries)} entries: {count} replays re-simulated, {cached} verdicts from cache")
+    if count:
+        print(f"{ticks:,} ticks in {elapsed:.2f}s on {args.workers} workers: {ticks / max(elapsed, 1e-9):,.0f} ticks/sec, "
+              f"{count / max(elapsed, 1e-9):,.1f} replays/sec")
+    print(f"accepted {len(accepted)}, rejected {len(rejected)}")
+    for (score, name, ref), reason in rejected:
+        print(f"  rejected {score}|{name}|{ref or '-'}: {reason}")
+    if args.rebuild:
+        print("leaderboard:", ", ".join(rebuild_leaderboard([e for e, _ in accepted])))
+    return 1 if rejected else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- End of leaderboard.py ---
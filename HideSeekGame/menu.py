@@ -8,10 +8,14 @@ Handles main menu, settings, pause, game over, minimap, achievement popups, tips
 import pygame
 import random
 import math
+import time
+import numpy as np
 from config import (
-    FONT_NAME, WIDTH, HEIGHT, read_leaderboard, get_achievement_desc,
-    theme_minimap, theme_player, theme_seeker, theme_powerup, theme_obstacle, theme_proj
+    WIDTH, HEIGHT, SEEKER_SIZE, MINIMAP_HZ, MINIMAP_DENSITY_MIN, BOOST_COOLDOWN, parse_entry, get_achievement_desc,
+    theme_minimap, theme_player, theme_seeker, theme_powerup, theme_obstacle
 )
+from fonts import FONTS, TEXT, render_text
+from sprites import SPRITES
 
 # --- Button Class ---
 
@@ -22,7 +26,7 @@ class Button:
     def __init__(self, rect, text):
         self.rect = pygame.Rect(rect)
         self.text = text
-        self.font = pygame.font.Font(FONT_NAME, 32)
+        self.font = FONTS.get(32)
         self.hover = False
         self.anim = 0
 
@@ -30,7 +34,7 @@ class Button:
         color = (150, 200, 255) if self.hover else (70, 70, 70)
         pygame.draw.rect(screen, color, self.rect, border_radius=16)
         pygame.draw.rect(screen, (200, 200, 200), self.rect, 2, border_radius=16)
-        text = self.font.render(self.text, True, (255, 255, 255))
+        text = TEXT.render(self.font, self.text, (255, 255, 255))
         screen.blit(text, text.get_rect(center=self.rect.center))
 
     def is_clicked(self, pos):
@@ -43,8 +47,7 @@ class Button:
 
 def draw_menu(screen, buttons):
     screen.fill((20, 20, 40))
-    font = pygame.font.Font(FONT_NAME, 68)
-    title = font.render("Hide & Seek+", True, (255, 220, 80))
+    title = render_text(68, "Hide & Seek+", (255, 220, 80))
     screen.blit(title, title.get_rect(center=(WIDTH//2, 140)))
     for b in buttons:
         b.update_hover(pygame.mouse.get_pos())
@@ -64,16 +67,14 @@ def _draw_menu_particles(screen):
         pygame.draw.circle(screen, (140, 140, 200), (s[0], s[1]), s[2])
 
 def _draw_menu_hint(screen):
-    font = pygame.font.Font(FONT_NAME, 28)
     hint = "Press Play to begin! Customize in Settings."
-    txt = font.render(hint, True, (200, 210, 240))
+    txt = render_text(28, hint, (200, 210, 240))
     screen.blit(txt, (WIDTH//2 - 170, 220))
 
 # --- Settings Screen ---
 
 def draw_settings(screen, settings):
     screen.fill((50, 50, 70))
-    font = pygame.font.Font(FONT_NAME, 36)
     desc = settings.get_difficulty_desc()
     texts = [
         f"Settings",
@@ -93,7 +94,7 @@ def draw_settings(screen, settings):
         "M - Toggle Minimap"
     ]
     for i, line in enumerate(texts):
-        txt = font.render(line, True, (255, 255, 255))
+        txt = render_text(36, line, (255, 255, 255))
         screen.blit(txt, (60, 40 + i * 42))
     pygame.display.flip()
 
@@ -101,36 +102,37 @@ def draw_settings(screen, settings):
 
 def draw_pause(screen):
     screen.fill((0, 0, 0))
-    font = pygame.font.Font(FONT_NAME, 52)
-    text = font.render("Paused - Press C to Continue or Q to Quit", True, (255, 255, 255))
+    text = render_text(52, "Paused - Press C to Continue or Q to Quit", (255, 255, 255))
     screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
     pygame.display.flip()
 
 # --- Game Over Screen ---
 
-def draw_game_over(screen, score, high_score, leaderboard, achievements=None):
+def draw_game_over(screen, score, high_score, leaderboard, achievements=None, note=None):
     screen.fill((16, 12, 20))
-    font = pygame.font.Font(FONT_NAME, 58)
-    text = font.render(f"Game Over - Score: {score}", True, (255, 255, 255))
-    hi_text = font.render(f"High Score: {high_score}", True, (180, 255, 180))
-    instruct = pygame.font.Font(FONT_NAME, 38).render("Press R to Restart or Q to Quit", True, (200, 200, 200))
+    text = render_text(58, f"Game Over - Score: {score}", (255, 255, 255))
+    hi_text = render_text(58, f"High Score: {high_score}", (180, 255, 180))
+    instruct = render_text(38, "Press R to Restart or Q to Quit", (200, 200, 200))
     screen.blit(text, text.get_rect(center=(WIDTH // 2, 220)))
     screen.blit(hi_text, hi_text.get_rect(center=(WIDTH // 2, 300)))
     screen.blit(instruct, instruct.get_rect(center=(WIDTH // 2, 375)))
-    font_small = pygame.font.Font(FONT_NAME, 30)
-    lb_title = font_small.render("Leaderboard (Top 5)", True, (255, 255, 0))
+    lb_title = render_text(30, "Leaderboard (Top 5)", (255, 255, 0))
     screen.blit(lb_title, (WIDTH // 2 - 90, 430))
     for i, sc in enumerate(leaderboard):
-        val, name = sc.split("|")
-        lb_line = font_small.render(f"{i+1}. {val} ({name})", True, (255, 255, 255))
+        val, name, _ = parse_entry(sc)
+        lb_line = render_text(30, f"{i+1}. {val} ({name})", (255, 255, 255))
         screen.blit(lb_line, (WIDTH // 2 - 80, 470 + i * 36))
+    if note:
+        # Where the submission stands (verifying, rejected, failed)
+        note_text = render_text(24, note, (170, 170, 190))
+        screen.blit(note_text, (WIDTH // 2 - 80, 470 + 5 * 36 + 8))
     if achievements:
-        ach_title = font_small.render("Achievements Unlocked", True, (100, 255, 200))
+        ach_title = render_text(30, "Achievements Unlocked", (100, 255, 200))
         screen.blit(ach_title, (WIDTH // 2 + 270, 430))
         unlocked = [a for a, v in achievements.achievements.items() if v]
         for idx, ach in enumerate(unlocked[:6]):
             desc = get_achievement_desc(ach)
-            ach_line = font_small.render(f"{desc}", True, (240, 220, 120))
+            ach_line = render_text(30, f"{desc}", (240, 220, 120))
             screen.blit(ach_line, (WIDTH // 2 + 270, 470 + idx * 32))
     pygame.display.flip()
 
@@ -142,7 +144,7 @@ def draw_boost_bar(screen, player):
     pygame.draw.rect(screen, (80, 80, 80), (x, y, w, h), 0, border_radius=8)
     # Draw bar fill
     if player.boost_cooldown > 0:
-        fill = int(w * (1 - player.boost_cooldown / 1800))
+        fill = int(w * (1 - player.boost_cooldown / BOOST_COOLDOWN))
         pygame.draw.rect(screen, (0, 200, 80), (x, y, fill, h), 0, border_radius=8)
     elif player.boost_active:
         fill = int(w * (player.boost_timer / player.settings.get_boost_duration()))
@@ -158,107 +160,169 @@ def draw_boost_bar(screen, player):
         if active:
             pygame.draw.circle(screen, color, (icon_x + i*32, y + h//2), 12)
     # Boost count stat
-    font = pygame.font.Font(FONT_NAME, 20)
-    boost_txt = font.render(f"Boosts: {player.boost_count}", True, (200,220,255))
+    boost_txt = render_text(20, f"Boosts: {player.boost_count}", (200,220,255))
     screen.blit(boost_txt, (x-120, y+2))
 
 # --- Minimap ---
 
-def draw_minimap(screen, player, seekers, obstacles, powerups):
-    theme_name = player.settings.theme_name
-    theme = player.settings.get_theme()
-    bg, border = theme_minimap(theme_name)
-    sx, sy = WIDTH-180, 40
-    mw, mh = 158, 158
-    surf = pygame.Surface((mw, mh), pygame.SRCALPHA)
-    surf.fill(bg + (180,))  # semi-transparent
-
-    # Obstacles (proportional mapping)
-    for ob in obstacles:
-        mx = int((ob.x / WIDTH) * mw)
-        my = int((ob.y / HEIGHT) * mh)
-        mw_ob = int((ob.width / WIDTH) * mw)
-        mh_ob = int((ob.height / HEIGHT) * mh)
-        pygame.draw.rect(surf, theme_obstacle(theme_name), (mx, my, mw_ob, mh_ob))
-    # Powerups (minimap shows only active)
-    for p in powerups:
-        mx = int((p.x / WIDTH) * mw)
-        my = int((p.y / HEIGHT) * mh)
-        pygame.draw.circle(surf, theme_powerup(theme_name), (mx+18, my+18), 7)
-    # Seekers
-    for s in seekers:
-        mx = int((s.rect.x / WIDTH) * mw)
-        my = int((s.rect.y / HEIGHT) * mh)
-        pygame.draw.ellipse(surf, theme_seeker(theme_name), (mx+10, my+10, 13, 13))
-    # Player
-    mx = int((player.rect.x / WIDTH) * mw)
-    my = int((player.rect.y / HEIGHT) * mh)
-    pygame.draw.rect(surf, theme_player(theme_name), (mx+10, my+10, 12, 12), border_radius=4)
-    pygame.draw.rect(surf, border, (0,0,mw,mh), 3)
-    # Legend
-    font = pygame.font.Font(FONT_NAME, 14)
-    surf.blit(font.render("Minimap", True, (210,210,240)), (8, 2))
-    screen.blit(surf, (sx, sy))
+class Minimap:
+    """
+    Minimap with cached layers: background + obstacles below the markers and border + label above,
+    both rebuilt only when the theme or obstacle layout changes. Markers are re-projected in one
+    NumPy pass at most `hz` times per second; in between, the last composed map is blitted as-is.
+    From MINIMAP_DENSITY_MIN seekers up, seekers are drawn as a density map instead of dots.
+    """
+    SIZE = 158
+    POS = (WIDTH-180, 40)
+    DENSITY_CELL = 4
+
+    def __init__(self, hz=MINIMAP_HZ):
+        self.interval = 1.0 / hz if hz else 0.0
+        self.key = None
+        self.base = None
+        self.frame = None
+        self.dot = None
+        self.density = None
+        self.surface = None
+        self.last_refresh = -math.inf
+        self.refreshes = 0
+
+    def invalidate(self):
+        """Refresh the markers on the next draw."""
+        self.last_refresh = -math.inf
+
+    def _build_layers(self, theme_name, obstacles):
+        mw = mh = self.SIZE
+        bg, border = theme_minimap(theme_name)
+        self.base = pygame.Surface((mw, mh), pygame.SRCALPHA)
+        self.base.fill(bg + (180,))  # semi-transparent
+        # Obstacles (proportional mapping)
+        for ob in obstacles:
+            mx = int((ob.x / WIDTH) * mw)
+            my = int((ob.y / HEIGHT) * mh)
+            mw_ob = int((ob.width / WIDTH) * mw)
+            mh_ob = int((ob.height / HEIGHT) * mh)
+            pygame.draw.rect(self.base, theme_obstacle(theme_name), (mx, my, mw_ob, mh_ob))
+        self.frame = pygame.Surface((mw, mh), pygame.SRCALPHA)
+        pygame.draw.rect(self.frame, border, (0,0,mw,mh), 3)
+        # Legend
+        self.frame.blit(render_text(14, "Minimap", (210,210,240)), (8, 2))
+        self.dot = pygame.Surface((13, 13), pygame.SRCALPHA)
+        pygame.draw.ellipse(self.dot, theme_seeker(theme_name), (0, 0, 13, 13))
+
+    def _draw_density(self, surf, pos, theme_name):
+        c = self.DENSITY_CELL
+        cells = -(-self.SIZE // c)
+        centers = (pos + SEEKER_SIZE // 2) * self.SIZE // np.array((WIDTH, HEIGHT)) // c
+        cx = np.clip(centers[:, 0], 0, cells - 1)
+        cy = np.clip(centers[:, 1], 0, cells - 1)
+        counts = np.bincount(cy * cells + cx, minlength=cells * cells).reshape(cells, cells)
+        if self.density is None:
+            self.density = pygame.Surface((cells, cells), pygame.SRCALPHA)
+        self.density.fill(theme_seeker(theme_name) + (0,))
+        alpha = pygame.surfarray.pixels_alpha(self.density)
+        alpha[:] = np.where(counts > 0, np.minimum(255, 110 + 30 * counts), 0).T
+        del alpha
+        surf.blit(pygame.transform.smoothscale(self.density, (cells * c, cells * c)), (0, 0))
+
+    def _compose(self, player, seekers, powerups):
+        theme_name = player.settings.theme_name
+        mw = mh = self.SIZE
+        surf = self.base.copy()
+        # Powerups (minimap shows only active)
+        for p in powerups:
+            mx = int((p.x / WIDTH) * mw)
+            my = int((p.y / HEIGHT) * mh)
+            pygame.draw.circle(surf, theme_powerup(theme_name), (mx+18, my+18), 7)
+        # Seekers
+        pos = seekers.positions()
+        if len(pos) >= MINIMAP_DENSITY_MIN:
+            self._draw_density(surf, pos, theme_name)
+        elif len(pos):
+            marks = pos * mw // np.array((WIDTH, HEIGHT)) + 10
+            dot = self.dot
+            surf.blits([(dot, m) for m in marks.tolist()], doreturn=False)
+        # Player
+        mx = int((player.rect.x / WIDTH) * mw)
+        my = int((player.rect.y / HEIGHT) * mh)
+        pygame.draw.rect(surf, theme_player(theme_name), (mx+10, my+10, 12, 12), border_radius=4)
+        surf.blit(self.frame, (0, 0))
+        return surf
+
+    def draw(self, screen, player, seekers, obstacles, powerups):
+        """`seekers` is a seeker engine (SeekerGroup or SeekerSwarm)."""
+        key = (player.settings.theme_name, tuple(map(tuple, obstacles)))
+        if key != self.key:
+            self._build_layers(key[0], obstacles)
+            self.key = key
+            self.invalidate()
+        now = time.perf_counter()
+        if now - self.last_refresh >= self.interval:
+            self.surface = self._compose(player, seekers, powerups)
+            self.last_refresh = now
+            self.refreshes += 1
+        screen.blit(self.surface, self.POS)
 
 # --- Tips System ---
 
 def draw_tips(screen, tips, score):
-    font = pygame.font.Font(FONT_NAME, 22)
     idx = ((score // 143) // 10) % len(tips)
     tip = tips[idx]
-    tip_txt = font.render("Tip: " + tip, True, (180, 180, 255))
+    tip_txt = render_text(22, "Tip: " + tip, (180, 180, 255))
     screen.blit(tip_txt, (WIDTH//2 - 160, HEIGHT - 26))
 
 # --- Menu Transitions and Animation ---
 
+# One black Surface, faded with its surface alpha instead of a new per-pixel alpha fill each frame
+_fade = pygame.Surface((WIDTH, HEIGHT))
+
 def animate_menu_transition(screen, frame):
     if frame == 0:
         return
-    alpha = max(0, 255 - 10*frame)
-    surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    surf.fill((0, 0, 0, alpha))
-    screen.blit(surf, (0, 0))
+    _fade.set_alpha(max(0, 255 - 10*frame))
+    screen.blit(_fade, (0, 0))
 
 # --- Achievement Popup ---
 
 def draw_achievement_popup(screen, desc):
     popup = pygame.Surface((420, 60), pygame.SRCALPHA)
     popup.fill((30, 50, 100, 180))
-    font = pygame.font.Font(FONT_NAME, 30)
-    txt = font.render(f"Achievement: {desc}", True, (255, 255, 120))
+    txt = render_text(30, f"Achievement: {desc}", (255, 255, 120))
     popup.blit(txt, txt.get_rect(center=(210, 30)))
     screen.blit(popup, (WIDTH//2 - 210, 28))
 
 # --- Help Overlay (in-game or from menu) ---
 
 def draw_help_overlay(screen, main_menu=False):
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 170))
-    font = pygame.font.Font(FONT_NAME, 38)
-    help_lines = [
-        "Hide & Seek+  Controls & Tips",
-        "",
-        "WASD / Arrow Keys: Move",
-        "B: Boost (dash, cooldown at bottom)",
-        "ESC: Pause",
-        "R: Restart instantly",
-        "T: Change Theme (settings)",
-        "D: Toggle Difficulty (settings)",
-        "C: Toggle Colorblind Mode",
-        "M: Show/hide minimap",  # <-- Updated key
-        "F1: Show/hide this help overlay",
-        "",
-        "- Get close to seekers for more points.",
-        "- Collect powerups to gain an edge.",
-        "- Obstacles move every 35s (Easy/Hard).",
-        "- Survive as long as you can!",
-        "",
-        "Press ESC or F1 to close help."
-    ]
-    for i, line in enumerate(help_lines):
-        txt = font.render(line, True, (255, 255, 255) if i == 0 else (220, 220, 240))
-        overlay.blit(txt, (60, 36 + i * 46))
-    screen.blit(overlay, (0, 0))
+    # The overlay never changes, so it is composed once and kept in the sprite cache
+    def build():
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        help_lines = [
+            "Hide & Seek+  Controls & Tips",
+            "",
+            "WASD / Arrow Keys: Move",
+            "B: Boost (dash, cooldown at bottom)",
+            "ESC: Pause",
+            "R: Restart instantly   P: Autopilot on/off",
+            "T: Change Theme (settings)",
+            "D: Toggle Difficulty (settings)",
+            "C: Toggle Colorblind Mode",
+            "M: Show/hide minimap   L: Darkness on/off",  # <-- Updated key
+            "F1: Show/hide this help overlay",
+            "",
+            "- Get close to seekers for more points.",
+            "- Collect powerups to gain an edge.",
+            "- Obstacles move every 35s (Easy/Hard).",
+            "- Survive as long as you can!",
+            "",
+            "Press ESC or F1 to close help."
+        ]
+        for i, line in enumerate(help_lines):
+            txt = render_text(38, line, (255, 255, 255) if i == 0 else (220, 220, 240))
+            overlay.blit(txt, (60, 36 + i * 46))
+        return overlay
+    screen.blit(SPRITES.get(("help_overlay",), build), (0, 0))
     pygame.display.flip()
 
 # --- End of menu.py ---
@@ -7,12 +7,13 @@ Handles player movement, powerups, boosts, status effects, visual polish, and fu
 
 import pygame
 import math
-import random
 from config import (
-    PLAYER_SIZE, PLAYER_SPEED, WIDTH, HEIGHT,
-    POWERUP_COLORS, POWERUP_DURATION, POWERUP_NAMES,
-    clamp, lerp, color_lerp
+    PLAYER_SIZE, PLAYER_SPEED, WIDTH, HEIGHT, POWERUP_DURATION, BOOST_COOLDOWN
 )
+from spatial import hits_any
+from sprites import powerup_sprite, player_body_sprite, player_trail_sprite, glow_sprite, health_sprite
+
+_FIELD_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
 
 class Powerup:
     """
@@ -27,20 +28,11 @@ class Powerup:
         self.pulse = 0
 
     def draw(self, screen, offset=(0, 0)):
-        color = POWERUP_COLORS.get(self.kind, (200, 200, 200))
         self.pulse += 0.18
         scale = 1.0 + 0.05 * math.sin(self.pulse)
-        surf = pygame.Surface((36, 36), pygame.SRCALPHA)
-        pygame.draw.ellipse(surf, color + (190,), (0, 0, 36, 36))
-        pygame.draw.ellipse(surf, (255, 255, 255, 60), (5, 5, 26, 26))
-        icon = POWERUP_NAMES[self.kind][0]
-        font = pygame.font.SysFont("arial", 22, bold=True)
-        txt = font.render(icon, True, (34, 34, 34))
-        surf.blit(txt, txt.get_rect(center=(18, 18)))
-        # Pulsate for effect
+        # Pulsate for effect (pre-baked frame per size)
         size = int(36 * scale)
-        surf2 = pygame.transform.smoothscale(surf, (size, size))
-        screen.blit(surf2, (self.x + offset[0] - (size-36)//2, self.y + offset[1] - (size-36)//2))
+        screen.blit(powerup_sprite(self.kind, size), (self.x + offset[0] - (size-36)//2, self.y + offset[1] - (size-36)//2))
 
     def update(self):
         self.age += 1
@@ -91,19 +83,20 @@ class Player:
             move_x += vel
 
         self.last_move = (move_x, move_y)
-        old_rect = self.rect.copy()
-        self.rect.x += move_x
-        self.rect.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-        for ob in obstacles:
-            if self.rect.colliderect(ob):
-                self.rect.x = old_rect.x
-
-        old_rect = self.rect.copy()
-        self.rect.y += move_y
-        self.rect.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-        for ob in obstacles:
-            if self.rect.colliderect(ob):
-                self.rect.y = old_rect.y
+        rect = self.rect
+        if move_x:
+            old_x = rect.x
+            rect.x += move_x
+            rect.clamp_ip(_FIELD_RECT)
+            if hits_any(rect, obstacles):
+                rect.x = old_x
+
+        if move_y:
+            old_y = rect.y
+            rect.y += move_y
+            rect.clamp_ip(_FIELD_RECT)
+            if hits_any(rect, obstacles):
+                rect.y = old_y
 
         # Trail for feedback
         if len(self.trail) > self.max_trail:
@@ -115,7 +108,7 @@ class Player:
             self.boost_timer -= 1
             if self.boost_timer <= 0:
                 self.boost_active = False
-                self.boost_cooldown = 1800
+                self.boost_cooldown = BOOST_COOLDOWN
         elif self.boost_cooldown > 0:
             self.boost_cooldown -= 1
 
@@ -174,39 +167,29 @@ class Player:
 
     def draw(self, screen, offset=(0, 0)):
         # Trail for feedback
-        for i, pos in enumerate(self.trail):
-            alpha = int(110 * (i / len(self.trail)))
-            surf = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE), pygame.SRCALPHA)
-            pygame.draw.rect(surf, self.color + (alpha,), (0, 0, PLAYER_SIZE, PLAYER_SIZE), border_radius=10)
-            screen.blit(surf, (pos[0] - PLAYER_SIZE // 2 + offset[0], pos[1] - PLAYER_SIZE // 2 + offset[1]))
-        # Main body
-        surf = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE), pygame.SRCALPHA)
+        ox, oy = offset
+        half = PLAYER_SIZE // 2
+        n = len(self.trail)
+        screen.blits([(player_trail_sprite(self.color, int(110 * (i / n))), (pos[0] - half + ox, pos[1] - half + oy))
+                      for i, pos in enumerate(self.trail)], doreturn=False)
+        # Main body (with outline)
         col = self.color
-        if self.invincible and (pygame.time.get_ticks() // 100) % 2 == 0:
+        if self.invincible and (self.animation // 6) % 2 == 0:  # 100 ms blink, counted in ticks
             col = (80, 255, 255)
         elif self.boost_active:
             col = (0, 255, 200)
         elif self.blink_timer % 4 < 2 and self.blink_timer > 0:
             col = (255, 80, 80)
-        pygame.draw.rect(surf, col, (0, 0, PLAYER_SIZE, PLAYER_SIZE), border_radius=12)
-        screen.blit(surf, (self.rect.x + offset[0], self.rect.y + offset[1]))
-        # Outline
-        pygame.draw.rect(screen, (255, 255, 255), self.rect.move(offset), 2, border_radius=10)
+        screen.blit(player_body_sprite(col), (self.rect.x + ox, self.rect.y + oy))
         # Boost flash
         if self.boost_active:
-            glow = pygame.Surface((PLAYER_SIZE + 12, PLAYER_SIZE + 12), pygame.SRCALPHA)
-            pygame.draw.ellipse(glow, (0, 255, 200, 60), (0, 0, PLAYER_SIZE + 12, PLAYER_SIZE + 12))
-            screen.blit(glow, (self.rect.x - 6 + offset[0], self.rect.y - 6 + offset[1]))
+            screen.blit(glow_sprite((0, 255, 200), 60, PLAYER_SIZE + 12), (self.rect.x - 6 + ox, self.rect.y - 6 + oy))
         # Invincible shield
         if self.invincible:
-            shield = pygame.Surface((PLAYER_SIZE + 20, PLAYER_SIZE + 20), pygame.SRCALPHA)
-            pygame.draw.ellipse(shield, (20, 220, 255, 60), (0, 0, PLAYER_SIZE + 20, PLAYER_SIZE + 20))
-            screen.blit(shield, (self.rect.x - 10 + offset[0], self.rect.y - 10 + offset[1]))
+            screen.blit(glow_sprite((20, 220, 255), 60, PLAYER_SIZE + 20), (self.rect.x - 10 + ox, self.rect.y - 10 + oy))
         # Health bar (future health system)
         if self.health < 3:
-            for i in range(3):
-                col = (255, 60, 60) if i >= self.health else (80, 255, 80)
-                pygame.draw.rect(screen, col, (self.rect.x + offset[0] + i*14, self.rect.y-18 + offset[1], 12, 7), border_radius=3)
+            screen.blit(health_sprite(self.health), (self.rect.x + ox, self.rect.y - 18 + oy))
 
     def status_summary(self):
         """
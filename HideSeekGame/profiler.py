@@ -0,0 +1,123 @@
+"""
+profiler.py — Hide & Seek+ Frame Profiler
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Per-phase frame timings (perf_counter_ns) kept in ring buffers, with min/mean/p95/p99 summaries,
+a live overlay (F3 in game) and optional per-frame CSV export (main.py --profile-out FILE).
+Instrumented code holds `profiler = None` while profiling is off, so each phase boundary costs
+one falsy check; with a Profiler attached, each boundary is one lap() call.
+"""
+
+import csv
+import time
+import numpy as np
+import pygame
+from config import PROFILE_WINDOW
+from fonts import FONTS
+
+PHASES = (
+    "events", "relocate", "powerups", "player", "seekers", "projectiles", "collisions",
+    "particles", "draw", "hud", "minimap", "flip",
+)
+COUNTS = ("seekers", "particles", "projectiles", "powerups", "ai_plans", "ai_overruns")
+
+class Profiler:
+    """
+    Call begin() at the top of a frame and lap(phase) at the end of each phase: the time since
+    the previous lap is added to that phase (phases hit by several ticks in one frame add up).
+    end_frame(world) pushes the frame into the ring buffers and the CSV, if one is open.
+    """
+    def __init__(self, window=PROFILE_WINDOW, csv_path=None):
+        self.window = window
+        self.slot = {phase: i for i, phase in enumerate(PHASES)}
+        self.samples = np.zeros((len(PHASES), window), dtype=np.int64)
+        self.counts = np.zeros((len(COUNTS), window), dtype=np.int64)
+        self.current = [0] * len(PHASES)
+        self.frames = 0
+        self._last = time.perf_counter_ns()
+        self._last_tick = 0
+        self._overlay = None
+        self._overlay_time = 0
+        self.csv_file = None
+        self.writer = None
+        if csv_path:
+            self.csv_file = open(csv_path, "w", newline="", buffering=1)
+            self.writer = csv.writer(self.csv_file)
+            self.writer.writerow(("frame", "ticks") + tuple(f"{p}_ns" for p in PHASES) + COUNTS)
+
+    def begin(self):
+        self._last = time.perf_counter_ns()
+
+    def lap(self, phase):
+        now = time.perf_counter_ns()
+        self.current[self.slot[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self, world):
+        col = self.frames % self.window
+        self.samples[:, col] = self.current
+        particles = world.particle_mgr.count() if world.particle_mgr else 0
+        ai = world.ai
+        counts = (len(world.seekers), particles, len(world.projectiles), len(world.powerups),
+                  ai.planned if ai else len(world.seekers), ai.overruns if ai else 0)
+        self.counts[:, col] = counts
+        self.frames += 1
+        if self.writer:
+            self.writer.writerow((self.frames, world.tick - self._last_tick) + tuple(self.current) + counts)
+        self._last_tick = world.tick
+        self.current = [0] * len(PHASES)
+
+    def close(self):
+        if self.csv_file:
+            self.csv_file.close()
+            self.csv_file = None
+            self.writer = None
+
+    def stats(self):
+        """{phase: {min, mean, p95, p99}} in milliseconds over the buffered frames, plus a "frame" total."""
+        n = min(self.frames, self.window)
+        if n == 0:
+            return {}
+        data = self.samples[:, :n] / 1e6
+        rows = list(zip(PHASES, data)) + [("frame", data.sum(axis=0))]
+        return {
+            phase: {
+                "min": float(values.min()),
+                "mean": float(values.mean()),
+                "p95": float(np.percentile(values, 95)),
+                "p99": float(np.percentile(values, 99)),
+            }
+            for phase, values in rows
+        }
+
+    def latest_counts(self):
+        if self.frames == 0:
+            return dict.fromkeys(COUNTS, 0)
+        return dict(zip(COUNTS, self.counts[:, (self.frames - 1) % self.window].tolist()))
+
+    def overlay(self, refresh_ms=250):
+        """Stats panel surface, re-rendered at most every refresh_ms."""
+        now = pygame.time.get_ticks()
+        if self._overlay is not None and now - self._overlay_time < refresh_ms:
+            return self._overlay
+        self._overlay_time = now
+        # The numbers change every refresh, so render them directly rather than through TEXT
+        font = FONTS.get(16)
+        stats = self.stats()
+        counts = self.latest_counts()
+        lines = [("phase", "min", "mean", "p95", "p99")]
+        for phase, s in stats.items():
+            lines.append((phase,) + tuple(f"{s[k]:.2f}" for k in ("min", "mean", "p95", "p99")))
+        items = [f"{k}: {v}" for k, v in counts.items()]
+        summary = ["   ".join(items[i:i + 2]) for i in range(0, len(items), 2)]
+        surf = pygame.Surface((330, 16 + 18 * (len(lines) + len(summary))), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            color = (255, 255, 120) if i == 0 or line[0] == "frame" else (220, 220, 240)
+            for j, cell in enumerate(line):
+                surf.blit(font.render(cell, True, color), (8 + (0 if j == 0 else 40 + 60 * j), 8 + 18 * i))
+        for i, line in enumerate(summary, len(lines)):
+            surf.blit(font.render(line, True, (180, 255, 180)), (8, 8 + 18 * i))
+        self._overlay = surf
+        return surf
+
+# --- End of profiler.py ---
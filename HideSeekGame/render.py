@@ -0,0 +1,329 @@
+"""
+render.py — Hide & Seek+ World Rendering
+CrystalCard-hub, Copilot (2025 Refined Edition)
+draw_world() draws a complete gameplay frame. DirtyRenderer keeps the background and obstacles
+pre-composited on a cached static layer and each frame only restores, redraws and pushes the
+screen tiles touched by moving entities, particles and the HUD (full flip during screen shake and
+with the darkness overlay on, which changes the whole screen).
+"""
+
+import time
+import random
+from contextlib import contextmanager
+import numpy as np
+import pygame
+from config import WIDTH, HEIGHT, FPS
+from fonts import TEXT
+from menu import Minimap, draw_boost_bar, draw_achievement_popup, draw_help_overlay
+
+# Fixed HUD regions (x, y, w, h) that are redrawn every frame
+_BOOST_BAR_REGION = (WIDTH//2 - 150 - 122, HEIGHT - 46, 520, 32)
+_MINIMAP_REGION = Minimap.POS + (Minimap.SIZE, Minimap.SIZE)
+_POPUP_REGION = (WIDTH//2 - 210, 28, 420, 60)
+_OVERLAY_POS = (10, 140)
+
+MINIMAP = Minimap()
+
+# --- Frame Drawing ---
+
+def draw_static(surface, world, offset=(0, 0)):
+    """Background and obstacles (everything that only changes on relocation or theme change)."""
+    surface.fill(world.theme["bg"])
+    for ob in world.obstacles:
+        pygame.draw.rect(surface, (70, 70, 90), ob.move(offset))
+
+def draw_entities(screen, world, offset=(0, 0)):
+    for p in world.powerups:
+        p.draw(screen, offset=offset)
+    world.player.draw(screen, offset=offset)
+    world.seekers.draw(screen, offset=offset)
+    for proj in world.projectiles:
+        proj.draw(screen)
+    if world.particle_mgr:
+        world.particle_mgr.draw(screen, offset=offset)
+
+def draw_hud(screen, world, font, minimap_toggle=True, achievement_popup=None, profiler=None, autopilot=False):
+    """Boost bar, minimap, HUD text and achievement popup. Returns the rects of the HUD text."""
+    player = world.player
+    draw_boost_bar(screen, player)
+    if profiler: profiler.lap("hud")
+    if minimap_toggle:
+        MINIMAP.draw(screen, player, world.seekers, world.obstacles, world.powerups)
+    if profiler: profiler.lap("minimap")
+    timer_text = TEXT.render(
+        font, f"Seeker Spawn: {max(0, world.seeker_spawn_interval - world.seeker_timer // FPS)} | Seekers: {len(world.seekers)}/{world.max_seekers}", (255, 255, 255)
+    )
+    score_text = TEXT.render(font, f"Score: {world.score}", (255, 255, 255))
+    high_score_text = TEXT.render(font, f"High Score: {world.settings.high_score}", (180, 255, 180))
+    rects = []
+    if world.multiplier > 1 or world.multiplier_anim > 0:
+        multiplier_text = TEXT.render(font, f"Multiplier: x{world.multiplier}", (255, 220, 0))
+        rects.append(screen.blit(multiplier_text, (10, 70+abs(world.multiplier_anim))))
+    rects.append(screen.blit(timer_text, (10, 10)))
+    rects.append(screen.blit(score_text, (10, 40)))
+    rects.append(screen.blit(high_score_text, (10, 100)))
+    if autopilot:
+        autopilot_text = TEXT.render(font, "AUTOPILOT", (120, 220, 255))
+        rects.append(screen.blit(autopilot_text, (WIDTH - 20 - autopilot_text.get_width(), 8)))
+    if achievement_popup:
+        draw_achievement_popup(screen, achievement_popup)
+    if profiler: profiler.lap("hud")
+    return rects
+
+def draw_world(screen, world, font, minimap_toggle=True, achievement_popup=None, help_overlay=False, profiler=None,
+               autopilot=False, darkness=None):
+    """Draw one gameplay frame of `world` (no flip). `darkness` (a darkness.Darkness) darkens the field under the HUD."""
+    draw_offset = [0,0]
+    if world.screen_shake > 0:
+        draw_offset[0] = random.randint(-world.screen_shake, world.screen_shake)
+        draw_offset[1] = random.randint(-world.screen_shake, world.screen_shake)
+
+    draw_static(screen, world, draw_offset)
+    draw_entities(screen, world, draw_offset)
+    if darkness:
+        darkness.draw(screen, world.player, draw_offset)
+    if profiler: profiler.lap("draw")
+    draw_hud(screen, world, font, minimap_toggle, achievement_popup, profiler, autopilot)
+    if help_overlay:
+        draw_help_overlay(screen)
+
+# --- Render Interpolation ---
+
+SNAP_DISTANCE = 64  # Moves longer than this in one tick (teleports, respawns) are not interpolated
+
+@contextmanager
+def interpolated(world, alpha):
+    """
+    Temporarily place the player, seekers and projectiles `alpha` (0..1) of the way from where they
+    were before the last tick to where they are now, for drawing between fixed ticks.
+    Needs a World created with track_motion=True; everything is put back on exit.
+    """
+    if alpha <= 0 or world.game_over:
+        yield
+        return
+    player = world.player.rect
+    player_now = player.topleft
+    px, py = world.prev_player
+    if abs(player_now[0] - px) <= SNAP_DISTANCE and abs(player_now[1] - py) <= SNAP_DISTANCE:
+        player.topleft = (round(px + (player_now[0] - px) * alpha), round(py + (player_now[1] - py) * alpha))
+    seekers = world.seekers
+    prev = world.prev_seekers
+    now = seekers.positions()[:len(prev)].copy()
+    if len(prev):
+        step = now - prev
+        lerp = np.rint(prev + step * alpha).astype(np.int64)
+        snap = (np.abs(step) > SNAP_DISTANCE).any(axis=1)
+        lerp[snap] = now[snap]
+        seekers.set_positions(lerp)
+    projectiles = [(proj.rect, proj.rect.topleft, proj.prev) for proj in world.projectiles]
+    for rect, (x, y), (ox, oy) in projectiles:
+        rect.topleft = (round(ox + (x - ox) * alpha), round(oy + (y - oy) * alpha))
+    try:
+        yield
+    finally:
+        player.topleft = player_now
+        if len(prev):
+            seekers.set_positions(now)
+        for rect, topleft, _ in projectiles:
+            rect.topleft = topleft
+
+# --- Dirty-Rectangle Renderer ---
+
+class DirtyRenderer:
+    """
+    Presents gameplay frames with pygame.display.update(rects) instead of a full flip.
+    The screen is split into TILE-sized tiles; a frame restores last frame's tiles from the static
+    layer, draws everything, and pushes last frame's tiles plus this frame's. Falls back to a full
+    flip during screen shake, with the help overlay or the darkness overlay up, or when most of
+    the screen is dirty.
+    """
+    TILE = 64
+    FULL_FRACTION = 0.6
+
+    def __init__(self):
+        self.cols = -(-WIDTH // self.TILE)
+        self.rows = -(-HEIGHT // self.TILE)
+        self.static = None
+        self.static_key = None
+        self.prev_tiles = None
+        self.full_frames = 0
+        self.dirty_frames = 0
+        self.static_rebuilds = 0
+        self.last_rects = 0
+        self.profiler = None  # A profiler.Profiler to time draw/hud/minimap/flip
+        self.darkness = None  # A darkness.Darkness to draw the fog-of-war overlay with
+
+    def invalidate(self):
+        """Force the next frame to redraw and push the whole screen (e.g. after a menu drew over it)."""
+        self.prev_tiles = None
+
+    def _static_layer(self, world):
+        key = (tuple(world.theme["bg"]), tuple(map(tuple, world.obstacles)))
+        if key != self.static_key:
+            if self.static is None:
+                self.static = pygame.Surface((WIDTH, HEIGHT))
+                if pygame.display.get_surface() is not None:
+                    self.static = self.static.convert()
+            draw_static(self.static, world)
+            self.static_key = key
+            self.static_rebuilds += 1
+            self.prev_tiles = None
+        return self.static
+
+    def _mark(self, tiles, boxes):
+        """Mark the tiles touched by an (n, 4) array of x, y, w, h boxes."""
+        if len(boxes) == 0:
+            return
+        t = self.TILE
+        x0 = np.clip(boxes[:, 0] // t, 0, self.cols - 1)
+        y0 = np.clip(boxes[:, 1] // t, 0, self.rows - 1)
+        x1 = np.clip((boxes[:, 0] + boxes[:, 2] - 1) // t, 0, self.cols - 1)
+        y1 = np.clip((boxes[:, 1] + boxes[:, 3] - 1) // t, 0, self.rows - 1)
+        # Boxes no larger than a tile touch at most their four corner tiles
+        small = (x1 - x0 <= 1) & (y1 - y0 <= 1)
+        tiles[y0[small], x0[small]] = True
+        tiles[y0[small], x1[small]] = True
+        tiles[y1[small], x0[small]] = True
+        tiles[y1[small], x1[small]] = True
+        for i in np.flatnonzero(~small).tolist():
+            tiles[y0[i]:y1[i] + 1, x0[i]:x1[i] + 1] = True
+
+    def _entity_boxes(self, world):
+        player = world.player
+        r = player.rect
+        # Shield bubble (10px all round) and health pips (18px above)
+        boxes = [(r.x - 10, r.y - 18, r.width + 20, r.height + 28)]
+        if player.trail:
+            xs = [p[0] for p in player.trail]
+            ys = [p[1] for p in player.trail]
+            half = r.width // 2
+            boxes.append((min(xs) - half, min(ys) - half, max(xs) - min(xs) + r.width, max(ys) - min(ys) + r.height))
+        for p in world.powerups:
+            boxes.append((p.x - 2, p.y - 2, 40, 40))
+        for proj in world.projectiles:
+            boxes.append(tuple(proj.rect))
+        parts = [np.array(boxes, dtype=np.int64)]
+        if len(world.seekers):
+            # Golden sparkles can land a couple of pixels outside the body
+            pos = world.seekers.positions()
+            seekers = np.empty((len(pos), 4), dtype=np.int64)
+            seekers[:, :2] = pos - 3
+            seekers[:, 2:] = world.seekers.rect(0).width + 6
+            parts.append(seekers)
+        if world.particle_mgr and world.particle_mgr.count():
+            parts.append(world.particle_mgr.boxes())
+        return np.concatenate(parts)
+
+    def _rects(self, tiles):
+        """Merge marked tiles into rects: horizontal runs per row, stacked while rows repeat."""
+        t = self.TILE
+        rects = []
+        open_runs = {}
+        for ty, row in enumerate(tiles.tolist()):
+            runs = {}
+            tx = 0
+            while tx < self.cols:
+                if row[tx]:
+                    start = tx
+                    while tx < self.cols and row[tx]:
+                        tx += 1
+                    run = (start, tx)
+                    rect = open_runs.get(run)
+                    if rect is not None:
+                        rect.height += t
+                    else:
+                        rect = pygame.Rect(start * t, ty * t, (tx - start) * t, t)
+                        rects.append(rect)
+                    runs[run] = rect
+                tx += 1
+            open_runs = runs
+        return rects
+
+    def draw(self, screen, world, font, minimap_toggle=True, achievement_popup=None, help_overlay=False, overlay=None,
+             autopilot=False):
+        """
+        Draw and present one gameplay frame of `world`. `overlay` is an optional Surface (e.g. the profiler panel);
+        autopilot=True shows the AUTOPILOT badge.
+        """
+        prof = self.profiler
+        if world.screen_shake > 0 or help_overlay or self.darkness:
+            draw_world(screen, world, font, minimap_toggle, achievement_popup, help_overlay, prof, autopilot, self.darkness)
+            if overlay:
+                screen.blit(overlay, _OVERLAY_POS)
+            pygame.display.flip()
+            if prof: prof.lap("flip")
+            self.prev_tiles = None
+            self.full_frames += 1
+            return
+
+        static = self._static_layer(world)
+        prev = self.prev_tiles
+        if prev is None:
+            screen.blit(static, (0, 0))
+        else:
+            screen.blits([(static, r, r) for r in self._rects(prev)], doreturn=False)
+
+        draw_entities(screen, world)
+        if prof: prof.lap("draw")
+        text_rects = draw_hud(screen, world, font, minimap_toggle, achievement_popup, prof, autopilot)
+        if overlay:
+            text_rects.append(screen.blit(overlay, _OVERLAY_POS))
+
+        tiles = np.zeros((self.rows, self.cols), dtype=bool)
+        regions = [_BOOST_BAR_REGION] + [tuple(r) for r in text_rects]
+        if minimap_toggle:
+            regions.append(_MINIMAP_REGION)
+        if achievement_popup:
+            regions.append(_POPUP_REGION)
+        self._mark(tiles, np.array(regions, dtype=np.int64))
+        self._mark(tiles, self._entity_boxes(world))
+        self.prev_tiles = tiles
+
+        if prev is None or (tiles | prev).mean() > self.FULL_FRACTION:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_rects = 1
+        else:
+            rects = self._rects(tiles | prev)
+            pygame.display.update(rects)
+            self.dirty_frames += 1
+            self.last_rects = len(rects)
+        if prof: prof.lap("flip")
+
+# --- Renderer Benchmark ---
+
+def benchmark_render(settings, frames=600):
+    """
+    Step a headless world with a few seekers and time full-frame drawing (draw_world + flip)
+    against DirtyRenderer. Returns (full_ms, dirty_ms) per frame.
+    """
+    from world import World
+    from fonts import FONTS
+    screen = pygame.display.get_surface()
+    font = FONTS.get(28)
+    results = []
+    for dirty in (False, True):
+        world = World(settings, invulnerable=True, seed=1)
+        renderer = DirtyRenderer()
+        total = 0.0
+        for _ in range(frames):
+            world.step(0)
+            world.screen_shake = 0
+            start = time.perf_counter()
+            if dirty:
+                renderer.draw(screen, world, font)
+            else:
+                draw_world(screen, world, font)
+                pygame.display.flip()
+            total += time.perf_counter() - start
+        results.append(total / frames * 1000)
+    return tuple(results)
+
+if __name__ == "__main__":
+    from settings import Settings
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    full_ms, dirty_ms = benchmark_render(Settings())
+    print(f"full redraw: {full_ms:.3f} ms/frame   dirty rects: {dirty_ms:.3f} ms/frame")
+
+# --- End of render.py ---
@@ -0,0 +1,206 @@
+"""
+render_bench.py — Hide & Seek+ Rendering Micro-Benchmarks
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Times every draw routine into an off-screen Surface across entity counts and themes, and reports
+ms per call, the frame rate that cost alone would allow (an FPS curve over counts), and Python
+allocations per call (tracemalloc peak bytes and net new blocks). Use it to compare renderer changes.
+
+    python render_bench.py
+    python render_bench.py --routines seeker particles --counts 1 100 10000 --themes Dark --csv out.csv
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import sys
+import csv
+import time
+import random
+import argparse
+import tracemalloc
+import numpy as np
+import pygame
+from config import WIDTH, HEIGHT, SEEKER_SIZE, PLAYER_SIZE, THEMES, POWERUP_NAMES
+from settings import Settings
+from player import Player, Powerup
+from seeker import Seeker, GoldenSeeker, SeekerSwarm, ParticleManager
+from menu import Minimap, draw_boost_bar, draw_help_overlay
+from darkness import Darkness
+
+DEFAULT_COUNTS = (1, 10, 100, 1000, 10000)
+
+# --- Routine Setups ---
+# Each takes (count, settings) and returns a draw(surface) callable for `count` entities.
+
+def _spot(size):
+    return random.randint(0, WIDTH - size), random.randint(0, HEIGHT - size)
+
+def seeker_setup(count, settings):
+    seekers = [Seeker(*_spot(SEEKER_SIZE), settings.get_theme()["seeker"], 2) for _ in range(count)]
+    def draw(surface):
+        for s in seekers:
+            s.draw(surface)
+    return draw
+
+def golden_setup(count, settings):
+    seekers = [GoldenSeeker(*_spot(SEEKER_SIZE), 3) for _ in range(count)]
+    def draw(surface):
+        for s in seekers:
+            s.draw(surface)
+    return draw
+
+def swarm_setup(count, settings):
+    swarm = SeekerSwarm(capacity=count)
+    for _ in range(count):
+        swarm.spawn(*_spot(SEEKER_SIZE), settings.get_theme()["seeker"], 2)
+    return swarm.draw
+
+def player_setup(count, settings):
+    players = []
+    for _ in range(count):
+        player = Player(*_spot(PLAYER_SIZE), settings.get_theme()["player"], settings)
+        cx, cy = player.rect.center
+        player.trail = [(cx - 6 * i, cy) for i in range(player.max_trail + 1)]
+        player.invincible = True
+        players.append(player)
+    def draw(surface):
+        for p in players:
+            p.draw(surface)
+    return draw
+
+def powerup_setup(count, settings):
+    kinds = list(POWERUP_NAMES)
+    powerups = [Powerup(*_spot(36), kinds[i % len(kinds)]) for i in range(count)]
+    def draw(surface):
+        for p in powerups:
+            p.draw(surface)
+    return draw
+
+def particles_setup(count, settings):
+    particles = ParticleManager(capacity=max(count, 1), rng=np.random.default_rng(1))
+    while particles.count() < count:
+        particles.spawn_impact(*_spot(16), settings.get_theme()["seeker"])
+    return particles.draw
+
+def minimap_setup(count, settings):
+    minimap = Minimap(hz=0)  # Re-compose on every call
+    player = Player(*_spot(PLAYER_SIZE), settings.get_theme()["player"], settings)
+    swarm = SeekerSwarm(capacity=count)
+    for _ in range(count):
+        swarm.spawn(*_spot(SEEKER_SIZE), settings.get_theme()["seeker"], 2)
+    obstacles = [pygame.Rect(*_spot(80), 80, 80) for _ in range(8)]
+    powerups = [Powerup(*_spot(36), "shield")]
+    def draw(surface):
+        minimap.draw(surface, player, swarm, obstacles, powerups)
+    return draw
+
+def boost_bar_setup(count, settings):
+    player = Player(WIDTH // 2, HEIGHT // 2, settings.get_theme()["player"], settings)
+    player.boost_cooldown = 900
+    player.invincible = player.slowmo = True
+    return lambda surface: draw_boost_bar(surface, player)
+
+def help_overlay_setup(count, settings):
+    return draw_help_overlay
+
+def _darkness_setup(half_res):
+    def setup(count, settings):
+        darkness = Darkness(half_res)
+        player = Player(WIDTH // 2, HEIGHT // 2, settings.get_theme()["player"], settings)
+        player.boost_active = True
+        player.boost_timer = settings.get_boost_duration() // 2
+        player.last_move = (5, 5)
+        return lambda surface: darkness.draw(surface, player)
+    return setup
+
+# name: (setup, scales with count)
+ROUTINES = {
+    "seeker": (seeker_setup, True),
+    "golden": (golden_setup, True),
+    "swarm": (swarm_setup, True),
+    "player": (player_setup, True),
+    "powerup": (powerup_setup, True),
+    "particles": (particles_setup, True),
+    "minimap": (minimap_setup, True),
+    "boost_bar": (boost_bar_setup, False),
+    "help_overlay": (help_overlay_setup, False),
+    "darkness": (_darkness_setup(False), False),
+    "darkness_half": (_darkness_setup(True), False),
+}
+
+# --- Measurement ---
+
+def measure(draw, surface, budget=0.2, min_calls=3):
+    """
+    Call draw(surface) until `budget` seconds pass (at least min_calls times).
+    Returns (ms per call, peak traced bytes per call, net new blocks per call).
+    """
+    draw(surface)  # Warm caches (sprites, fonts, text) so steady-state cost is measured
+    calls = 0
+    start = time.perf_counter()
+    while calls < min_calls or time.perf_counter() - start < budget:
+        draw(surface)
+        calls += 1
+    ms = (time.perf_counter() - start) / calls * 1000
+
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+    base = tracemalloc.get_traced_memory()[0]
+    draw(surface)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    new_blocks = sys.getallocatedblocks() - blocks
+    tracemalloc.stop()
+    return ms, peak, new_blocks
+
+def run(routines, counts, themes, budget=0.2, seed=1):
+    """Rows of (routine, theme, count, ms_per_call, fps, alloc_bytes, new_blocks)."""
+    surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+    rows = []
+    for name in routines:
+        setup, scales = ROUTINES[name]
+        for theme in themes:
+            settings = Settings()
+            settings.theme_name = theme
+            for count in (counts if scales else (1,)):
+                random.seed(seed)
+                draw = setup(count, settings)
+                ms, peak, blocks = measure(draw, surface, budget)
+                rows.append((name, theme, count, ms, 1000 / ms if ms else float("inf"), peak, blocks))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hide & Seek+ rendering micro-benchmarks")
+    parser.add_argument("--routines", nargs="+", choices=list(ROUTINES), default=list(ROUTINES))
+    parser.add_argument("--counts", nargs="+", type=int, default=list(DEFAULT_COUNTS))
+    parser.add_argument("--themes", nargs="+", choices=list(THEMES), default=list(THEMES))
+    parser.add_argument("--budget", type=float, default=0.2, help="seconds of timing per data point")
+    parser.add_argument("--csv", metavar="FILE", help="write every data point to FILE")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    rows = run(args.routines, args.counts, args.themes, args.budget)
+
+    print(f"{'routine':<13} {'theme':<13} {'count':>6} {'ms/call':>9} {'fps':>10} {'alloc B':>9} {'blocks':>7}")
+    for name, theme, count, ms, fps, peak, blocks in rows:
+        print(f"{name:<13} {theme:<13} {count:>6} {ms:>9.3f} {fps:>10,.0f} {peak:>9,} {blocks:>7}")
+    # FPS curves: one line per routine, averaged over themes
+    print("\nFPS by count (mean over themes)")
+    for name in args.routines:
+        points = {}
+        for row in rows:
+            if row[0] == name:
+                points.setdefault(row[2], []).append(row[4])
+        print(f"{name:<13} " + "  ".join(f"{count}:{sum(v) / len(v):,.0f}" for count, v in points.items()))
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("routine", "theme", "count", "ms_per_call", "fps", "alloc_bytes", "new_blocks"))
+            writer.writerows(rows)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- End of render_bench.py ---
@@ -0,0 +1,252 @@
+"""
+replay.py — Hide & Seek+ Input Recording and Replay
+CrystalCard-hub, Copilot (2025 Refined Edition)
+A game is fully determined by its seed, difficulty, the config tables it was played with (a
+difficulty profile, see config.load_profile) and the INPUT_* bitmask of every tick, so a replay
+stores only those; the tables only when they differ from the shipped ones. Inputs are run-length
+encoded and each run is one varint ((length - 1) << 5 | mask): held keys cost a byte or two per
+change, so a 10-minute game is a few KB. Re-simulating a replay on the headless World (with its
+tables put in place meanwhile) reproduces the recorded score exactly.
+
+    python replay.py                 # verify last_replay.hsr (written after every game)
+    python replay.py some_game.hsr
+"""
+
+import os
+import sys
+import json
+import pickle
+import hashlib
+import argparse
+from contextlib import contextmanager
+from itertools import repeat
+from config import FPS, THEMES, REPLAY_FILE, REPLAY_KEYFRAME_TICKS, SHIPPED_PROFILE, current_profile, apply_profile
+from settings import Settings
+from world import World
+
+MAGIC = b"HSR\x02"  # Played under a profile: its tables follow the theme name
+MAGIC_V1 = b"HSR\x01"  # Shipped tables (the format before profiles, so existing refs still match)
+DIFFICULTIES = ("Easy", "Hard", "Master")
+_MASK_BITS = 5
+
+# --- Varints ---
+
+def _write_varint(out, n):
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+def _read_varint(data, i):
+    n = shift = 0
+    while True:
+        byte = data[i]
+        i += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, i
+        shift += 7
+
+def _profile_bytes(profile):
+    return json.dumps(profile, sort_keys=True, separators=(",", ":")).encode()
+
+# --- Replay ---
+
+class Replay:
+    """
+    One recorded game: seed, difficulty, theme, the config tables (profile, None for the shipped
+    ones) and the per-tick input masks as [mask, count] runs.
+    record(mask) appends a tick; score is the final score the game ended with.
+    """
+    def __init__(self, seed, difficulty="Easy", theme_name=None, runs=None, score=0, profile=None):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.theme_name = theme_name if theme_name in THEMES else next(iter(THEMES))
+        self.runs = runs if runs is not None else []
+        self.score = score
+        self.profile = profile or None
+
+    @classmethod
+    def for_world(cls, world):
+        """An empty recording for a freshly built World, under the tables in place now."""
+        profile = current_profile()
+        return cls(world.seed, world.difficulty, world.settings.theme_name,
+                   profile=profile if profile != SHIPPED_PROFILE else None)
+
+    @property
+    def profile_id(self):
+        """Short hash of the profile, "" for the shipped tables."""
+        if not self.profile:
+            return ""
+        return hashlib.sha1(_profile_bytes(self.profile)).hexdigest()[:8]
+
+    def record(self, mask):
+        runs = self.runs
+        if runs and runs[-1][0] == mask:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+
+    @property
+    def ticks(self):
+        return sum(count for _, count in self.runs)
+
+    def inputs(self):
+        """Every tick's input mask, in order."""
+        for mask, count in self.runs:
+            yield from repeat(mask, count)
+
+    # --- Encoding ---
+
+    def to_bytes(self):
+        out = bytearray(MAGIC if self.profile else MAGIC_V1)
+        _write_varint(out, self.seed)
+        out.append(DIFFICULTIES.index(self.difficulty))
+        name = self.theme_name.encode()
+        _write_varint(out, len(name))
+        out += name
+        if self.profile:
+            profile = _profile_bytes(self.profile)
+            _write_varint(out, len(profile))
+            out += profile
+        _write_varint(out, self.score)
+        _write_varint(out, self.ticks)
+        for mask, count in self.runs:
+            _write_varint(out, (count - 1) << _MASK_BITS | mask)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic = data[:len(MAGIC)]
+        if magic not in (MAGIC, MAGIC_V1):
+            raise ValueError("not a Hide & Seek+ replay")
+        i = len(MAGIC)
+        seed, i = _read_varint(data, i)
+        difficulty = DIFFICULTIES[data[i]]
+        length, i = _read_varint(data, i + 1)
+        theme_name = data[i:i + length].decode()
+        i += length
+        profile = None
+        if magic == MAGIC:
+            length, i = _read_varint(data, i)
+            profile = json.loads(data[i:i + length])
+            i += length
+        score, i = _read_varint(data, i)
+        ticks, i = _read_varint(data, i)
+        runs = []
+        while i < len(data):
+            value, i = _read_varint(data, i)
+            runs.append([value & ((1 << _MASK_BITS) - 1), (value >> _MASK_BITS) + 1])
+        replay = cls(seed, difficulty, theme_name, runs, score, profile)
+        if replay.ticks != ticks:
+            raise ValueError(f"replay truncated: {replay.ticks} of {ticks} ticks")
+        return replay
+
+    def save(self, path=REPLAY_FILE):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path=REPLAY_FILE):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    # --- Re-simulation ---
+
+    def settings(self):
+        settings = Settings()
+        settings.difficulty = self.difficulty
+        settings.theme_name = self.theme_name
+        return settings
+
+    @contextmanager
+    def tables(self):
+        """The config tables this game was played with, in place meanwhile (untouched if they already are)."""
+        # Tables a profile leaves out (older profiles predate some tables) were the shipped ones
+        played = dict(SHIPPED_PROFILE, **(self.profile or {}))
+        current = current_profile()
+        if current == played:
+            yield
+            return
+        apply_profile(played)
+        try:
+            yield
+        finally:
+            apply_profile(current)
+
+    def simulate(self, particles=False):
+        """Play the recorded inputs on a new World and return it (headless by default)."""
+        with self.tables():
+            world = World(self.settings(), particles=particles, seed=self.seed)
+            step = world.step
+            for mask in self.inputs():
+                step(mask)
+        return world
+
+    def verify(self):
+        """True if re-simulating reproduces the recorded score."""
+        return self.simulate().score == self.score
+
+# --- Keyframed Timeline (seeking) ---
+
+class ReplayTimeline:
+    """
+    A replay re-simulated once up front, with a pickled full-World keyframe every `interval` ticks.
+    seek(tick) restores the keyframe at or before `tick` and steps only the remaining ticks
+    headlessly, so any seek costs one unpickle plus fewer than `interval` ticks.
+    Worlds are built without particles (cosmetic, on their own RNG) to keep keyframes small.
+    """
+    def __init__(self, replay, interval=REPLAY_KEYFRAME_TICKS):
+        self.replay = replay
+        self.interval = interval
+        self.masks = bytes(replay.inputs())
+        self.length = len(self.masks)
+        with replay.tables():
+            world = World(replay.settings(), particles=False, track_motion=True, seed=replay.seed)
+            self.keyframes = [pickle.dumps(world, pickle.HIGHEST_PROTOCOL)]
+            for tick, mask in enumerate(self.masks, 1):
+                world.step(mask)
+                if tick % interval == 0:
+                    self.keyframes.append(pickle.dumps(world, pickle.HIGHEST_PROTOCOL))
+        self.final_score = world.score
+        self.world = pickle.loads(self.keyframes[0])
+
+    @property
+    def tick(self):
+        return self.world.tick
+
+    def advance(self, ticks=1):
+        """Step the current world forward up to `ticks` ticks (stops at the end of the recording)."""
+        world = self.world
+        masks = self.masks
+        with self.replay.tables():
+            for tick in range(world.tick, min(world.tick + ticks, self.length)):
+                world.step(masks[tick])
+        return world
+
+    def seek(self, tick):
+        """The World as it was after `tick` ticks."""
+        tick = max(0, min(tick, self.length))
+        if not (self.world.tick <= tick < self.world.tick + self.interval):
+            self.world = pickle.loads(self.keyframes[tick // self.interval])
+        return self.advance(tick - self.world.tick)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-simulate a Hide & Seek+ replay and check its score")
+    parser.add_argument("path", nargs="?", default=REPLAY_FILE)
+    args = parser.parse_args(argv)
+    replay = Replay.load(args.path)
+    world = replay.simulate()
+    print(f"{args.path}: seed {replay.seed}, {replay.difficulty}, {replay.ticks} ticks "
+          f"({replay.ticks / FPS:.1f}s) in {os.path.getsize(args.path):,} bytes, "
+          f"{'profile ' + replay.profile_id if replay.profile else 'shipped tables'}")
+    print(f"recorded score {replay.score}, replayed score {world.score}")
+    if world.score != replay.score:
+        print("MISMATCH")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- End of replay.py ---
@@ -0,0 +1,130 @@
+"""
+replay_viewer.py — Hide & Seek+ Replay Viewer
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Plays back a recorded game with the regular gameplay drawing (draw_world: player, seekers, HUD,
+minimap) plus a timeline bar. Playback steps the headless World at 0.25x-16x and draws once per
+frame, never the skipped ticks; seeking goes through ReplayTimeline keyframes.
+
+    python replay_viewer.py [FILE]
+
+Space: play/pause   Up/Down: speed   Left/Right: -/+ 5 s   , / .: one tick (paused)
+Home/End: start/end   Click or drag the timeline to scrub   Esc/Q: quit
+"""
+
+import sys
+import time
+import argparse
+import pygame
+from config import WIDTH, HEIGHT, FPS, REPLAY_FILE
+from fonts import FONTS, render_text
+from replay import Replay, ReplayTimeline
+from render import draw_world, interpolated
+
+SPEEDS = (0.25, 0.5, 1, 2, 4, 8, 16)
+_BAR = pygame.Rect(40, HEIGHT - 84, WIDTH - 80, 14)
+
+# --- Timeline Bar ---
+
+def draw_timeline(screen, timeline, speed, playing, seek_ms):
+    tick, length = timeline.tick, max(1, timeline.length)
+    pygame.draw.rect(screen, (40, 40, 60), _BAR, 0, border_radius=6)
+    fill = _BAR.copy()
+    fill.width = int(_BAR.width * tick / length)
+    pygame.draw.rect(screen, (120, 200, 255), fill, 0, border_radius=6)
+    for k in range(0, timeline.length + 1, timeline.interval):
+        x = _BAR.x + _BAR.width * k // length
+        pygame.draw.line(screen, (90, 90, 120), (x, _BAR.bottom), (x, _BAR.bottom + 4))
+    pygame.draw.rect(screen, (255, 255, 255), _BAR, 2, border_radius=6)
+    state = f"{speed:g}x" if playing else "paused"
+    status = (f"{tick / FPS:6.1f}s / {timeline.length / FPS:.1f}s   tick {tick}   {state}"
+              f"   seek {seek_ms:.1f} ms   final score {timeline.final_score}")
+    screen.blit(render_text(20, status, (220, 220, 240)), (_BAR.x, _BAR.y - 24))
+
+# --- Viewer Loop ---
+
+def view(replay):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Hide & Seek+ Replay")
+    clock = pygame.time.Clock()
+    font = FONTS.get(28)
+    timeline = ReplayTimeline(replay)
+    speed_index = SPEEDS.index(1)
+    playing = True
+    scrubbing = False
+    progress = 0.0  # Fraction of a tick played since the last step
+    seek_ms = 0.0
+    last_time = time.perf_counter()
+
+    def seek(tick):
+        nonlocal progress, seek_ms
+        start = time.perf_counter()
+        timeline.seek(tick)
+        seek_ms = (time.perf_counter() - start) * 1000
+        progress = 0.0
+
+    def tick_at(x):
+        return round((x - _BAR.x) / _BAR.width * timeline.length)
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+            if event.type == pygame.KEYDOWN:
+                if event.key in (pygame.K_ESCAPE, pygame.K_q):
+                    return
+                if event.key == pygame.K_SPACE:
+                    playing = not playing
+                elif event.key == pygame.K_UP:
+                    speed_index = min(speed_index + 1, len(SPEEDS) - 1)
+                elif event.key == pygame.K_DOWN:
+                    speed_index = max(speed_index - 1, 0)
+                elif event.key == pygame.K_LEFT:
+                    seek(timeline.tick - 5 * FPS)
+                elif event.key == pygame.K_RIGHT:
+                    seek(timeline.tick + 5 * FPS)
+                elif event.key == pygame.K_COMMA and not playing:
+                    seek(timeline.tick - 1)
+                elif event.key == pygame.K_PERIOD and not playing:
+                    seek(timeline.tick + 1)
+                elif event.key == pygame.K_HOME:
+                    seek(0)
+                elif event.key == pygame.K_END:
+                    seek(timeline.length)
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and _BAR.inflate(0, 16).collidepoint(event.pos):
+                scrubbing = True
+                seek(tick_at(event.pos[0]))
+            if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                scrubbing = False
+            if event.type == pygame.MOUSEMOTION and scrubbing:
+                seek(tick_at(event.pos[0]))
+
+        now = time.perf_counter()
+        if playing and not scrubbing and timeline.tick < timeline.length:
+            progress += (now - last_time) * FPS * SPEEDS[speed_index]
+            whole = int(progress)
+            if whole:
+                timeline.advance(whole)  # Headless: the skipped ticks are never drawn
+                progress -= whole
+        last_time = now
+
+        world = timeline.world
+        # Interpolate only below 1x, where ticks span several frames
+        with interpolated(world, progress if SPEEDS[speed_index] < 1 and playing else 0):
+            draw_world(screen, world, font)
+        draw_timeline(screen, timeline, SPEEDS[speed_index], playing, seek_ms)
+        pygame.display.flip()
+        clock.tick(FPS)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch a Hide & Seek+ replay")
+    parser.add_argument("path", nargs="?", default=REPLAY_FILE)
+    args = parser.parse_args(argv)
+    view(Replay.load(args.path))
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- End of replay_viewer.py ---
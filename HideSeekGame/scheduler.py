@@ -0,0 +1,91 @@
+"""
+scheduler.py — Hide & Seek+ Seeker AI Scheduler
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Level-of-detail for seeker decisions. A decision is the re-plan part of a seeker update: jitter,
+flow field detour and the new step toward the player. Between decisions a seeker repeats its
+last step (collisions, stuck detection and coloring still run every tick).
+
+Each tick plan() returns the mask of seekers that decide (None, meaning all of them, while there
+are fewer than AI_LOD_MIN_SEEKERS: below that the planning costs more than it saves):
+  - every seeker within AI_NEAR_DISTANCE of the player (full rate)
+  - a round-robin share of the distant ones, so each decides every AI_FAR_INTERVAL ticks,
+    capped so that no more than AI_MAX_PLANS seekers decide per tick (distant seekers past the
+    cap wait their turn; near seekers always decide), but never so far that a distant seeker
+    goes more than AI_MAX_STALE ticks without a decision
+The mask only depends on positions, so games stay deterministic and replays verify. Wall time
+is measured separately: record() counts ticks whose seeker update ran over AI_BUDGET_MS.
+"""
+
+import numpy as np
+from config import SEEKER_SIZE, AI_NEAR_DISTANCE, AI_FAR_INTERVAL, AI_MAX_PLANS, AI_MAX_STALE, AI_BUDGET_MS, AI_LOD_MIN_SEEKERS
+
+class AIScheduler:
+    """
+    Decides which seekers re-plan each tick. updates[i] counts the decisions handed to seeker i,
+    overruns the ticks over budget_ms.
+    """
+    def __init__(self, near=AI_NEAR_DISTANCE, interval=AI_FAR_INTERVAL, max_plans=AI_MAX_PLANS, max_stale=AI_MAX_STALE,
+                 budget_ms=AI_BUDGET_MS, min_seekers=AI_LOD_MIN_SEEKERS):
+        self.near = near
+        self.interval = max(1, interval)
+        self.max_plans = max_plans
+        self.max_stale = max(self.interval, max_stale)
+        self.budget_ms = budget_ms
+        self.min_seekers = min_seekers
+        self.cursor = 0  # Seeker index the round-robin resumes from
+        self.updates = np.zeros(16, dtype=np.int64)
+        self.planned = 0  # Decisions handed out on the last tick
+        self.ticks = 0
+        self.overruns = 0
+        self.total_ms = 0.0
+        self.worst_ms = 0.0
+
+    def plan(self, seekers, target):
+        """Mask of the seekers (a SeekerSwarm or SeekerGroup) that decide this tick, chasing `target`."""
+        n = len(seekers)
+        if n > len(self.updates):
+            grown = np.zeros(max(n, 2 * len(self.updates)), dtype=np.int64)
+            grown[:len(self.updates)] = self.updates
+            self.updates = grown
+        if n < self.min_seekers:
+            self.planned = n
+            self.updates[:n] += 1
+            return None
+        d = seekers.positions() + SEEKER_SIZE // 2 - target
+        think = (d * d).sum(axis=1) < self.near * self.near
+        far = np.flatnonzero(~think)
+        if len(far):
+            # Enough for a full round every `interval` ticks, within what the near seekers left
+            # over, and at least a full round every `max_stale` ticks
+            share = min(-(-len(far) // self.interval), self.max_plans - (n - len(far)))
+            share = max(share, -(-len(far) // self.max_stale))
+            start = np.searchsorted(far, self.cursor)
+            picked = far[(start + np.arange(share)) % len(far)]
+            think[picked] = True
+            self.cursor = int(picked[-1]) + 1
+        self.planned = int(think.sum())
+        self.updates[:n] += think
+        return think
+
+    def record(self, seconds):
+        """Wall time of one tick's seeker update."""
+        ms = seconds * 1000
+        self.ticks += 1
+        self.total_ms += ms
+        self.worst_ms = max(self.worst_ms, ms)
+        if ms > self.budget_ms:
+            self.overruns += 1
+
+    def stats(self, count=None):
+        """Summary: budget overruns, update times in ms, and decisions per seeker (the first `count`)."""
+        updates = self.updates[:count]
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "mean_ms": self.total_ms / max(self.ticks, 1),
+            "worst_ms": self.worst_ms,
+            "planned": self.planned,
+            "updates": updates.tolist(),
+        }
+
+# --- End of scheduler.py ---
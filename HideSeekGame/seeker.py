@@ -8,63 +8,81 @@ Handles all seeker logic, AI pathing, stuck detection, particle effects, special
 import pygame
 import random
 import math
+import numpy as np
+from collections import deque
+from itertools import repeat
 from config import (
-    SEEKER_SIZE, WIDTH, HEIGHT, lerp, color_lerp, theme_seeker, theme_player, theme_powerup
+    SEEKER_SIZE, WIDTH, HEIGHT, PARTICLE_CAPACITY, FLOW_DETOUR_TICKS, theme_powerup
 )
+from spatial import SpatialHash, boxes_overlap_any
+from sprites import seeker_sprite, golden_sprite, sparkle_sprite, boss_sprite
+
+_FIELD_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
 
 # --- Particle System ---
 
-class Particle:
+class ParticleManager:
     """
-    A single particle for visual effects (impacts, collections, seeker actions).
+    Manages all particles, offers spawn methods for different game events.
+    Particles live in a fixed-capacity pool of NumPy arrays, are integrated in one vectorized step
+    and drawn with a single Surface.blits() over pre-rendered, alpha-bucketed ellipse sprites.
+    Uses its own RNG so visual effects never disturb the gameplay random stream.
     """
-    def __init__(self, x, y, color, vx, vy, life, size=8):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx = vx
-        self.vy = vy
-        self.life = life
-        self.size = size
-        self.age = 0
+    ALPHA_BUCKETS = 16
+    MAX_SIZE = 16
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.age += 1
-        # Fade velocity over time
-        if self.age < self.life // 2:
-            self.vx *= 0.99
-            self.vy *= 0.99
-        else:
-            self.vx *= 0.95
-            self.vy *= 0.95
+    def __init__(self, capacity=PARTICLE_CAPACITY, rng=None):
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.n = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.life = np.ones(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color_id = np.zeros(capacity, dtype=np.int32)
+        self.colors = []
+        self._color_ids = {}
+        self.sprites = []  # Flat table: (color_id * MAX_SIZE + size) * ALPHA_BUCKETS + bucket -> Surface
 
-    def draw(self, screen, offset=(0,0)):
-        alpha = int(255 * max(0, 1 - self.age / self.life))
-        surf = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        c = self.color + (alpha,)
-        pygame.draw.ellipse(surf, c, (0, 0, self.size, self.size))
-        screen.blit(surf, (self.x + offset[0], self.y + offset[1]))
+    def count(self):
+        return self.n
 
-    def is_alive(self):
-        return self.age < self.life
+    def clear(self):
+        self.n = 0
 
-class ParticleManager:
-    """
-    Manages all particles, offers spawn methods for different game events.
-    """
-    def __init__(self):
-        self.particles = []
+    def _color_id(self, color):
+        color = tuple(int(c) for c in color[:3])
+        cid = self._color_ids.get(color)
+        if cid is None:
+            cid = len(self.colors)
+            self._color_ids[color] = cid
+            self.colors.append(color)
+            self.sprites.extend([None] * (self.MAX_SIZE * self.ALPHA_BUCKETS))
+        return cid
+
+    def _emit(self, x, y, color_id, speed_lo, speed_hi, life_lo, life_hi, size_lo, size_hi, count):
+        """Burst `count` particles per origin in random directions. x, y, color_id may be arrays."""
+        x = np.repeat(np.atleast_1d(x), count)
+        k = min(len(x), self.capacity - self.n)
+        if k <= 0:
+            return
+        rng = self.rng
+        i = slice(self.n, self.n + k)
+        angle = rng.uniform(0, 2*math.pi, k)
+        speed = rng.uniform(speed_lo, speed_hi, k)
+        self.pos[i, 0] = x[:k]
+        self.pos[i, 1] = np.repeat(np.atleast_1d(y), count)[:k]
+        self.vel[i, 0] = np.cos(angle) * speed
+        self.vel[i, 1] = np.sin(angle) * speed
+        self.age[i] = 0
+        self.life[i] = rng.integers(life_lo, life_hi + 1, k)
+        self.size[i] = rng.integers(size_lo, size_hi + 1, k)
+        self.color_id[i] = color_id if np.ndim(color_id) == 0 else np.repeat(color_id, count)[:k]
+        self.n += k
 
     def spawn_impact(self, x, y, color):
-        for _ in range(20):
-            angle = random.uniform(0, 2*math.pi)
-            speed = random.uniform(2, 7)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            p = Particle(x, y, color, vx, vy, random.randint(16, 30), size=random.randint(6, 12))
-            self.particles.append(p)
+        self._emit(x, y, self._color_id(color), 2, 7, 16, 30, 6, 12, 20)
 
     def spawn_collect(self, x, y, kind):
         color = theme_powerup("Dark")  # Default
@@ -76,28 +94,80 @@ class ParticleManager:
             color = (80, 255, 100)
         elif kind == "multiplier":
             color = (255, 220, 40)
-        for _ in range(14):
-            a = random.uniform(0, 2*math.pi)
-            s = random.uniform(1, 5)
-            p = Particle(x, y, color, math.cos(a)*s, math.sin(a)*s, random.randint(12, 22), size=8)
-            self.particles.append(p)
+        self._emit(x, y, self._color_id(color), 1, 5, 12, 22, 8, 8, 14)
 
     def spawn_trail(self, x, y, color):
         # Fainter, longer-lived trailing particles for seekers
-        for _ in range(3):
-            a = random.uniform(0, 2*math.pi)
-            s = random.uniform(0.5, 2)
-            p = Particle(x, y, color, math.cos(a)*s, math.sin(a)*s, random.randint(18, 34), size=6)
-            self.particles.append(p)
+        self._emit(x, y, self._color_id(color), 0.5, 2, 18, 34, 6, 6, 3)
+
+    def spawn_impacts(self, points, color):
+        """spawn_impact() at many points (k, 2) at once."""
+        if len(points):
+            self._emit(points[:, 0], points[:, 1], self._color_id(color), 2, 7, 16, 30, 6, 12, 20)
+
+    def spawn_trails(self, points, colors):
+        """spawn_trail() for many seekers at once: points (k, 2), colors (k, 3)."""
+        if len(points) == 0:
+            return
+        unique, inverse = np.unique(colors, axis=0, return_inverse=True)
+        ids = np.array([self._color_id(c) for c in unique.tolist()])[inverse.ravel()]
+        self._emit(points[:, 0], points[:, 1], ids, 0.5, 2, 18, 34, 6, 6, 3)
 
     def update(self):
-        for p in self.particles:
-            p.update()
-        self.particles = [p for p in self.particles if p.is_alive()]
+        n = self.n
+        if n == 0:
+            return
+        pos, vel, age, life = self.pos[:n], self.vel[:n], self.age[:n], self.life[:n]
+        pos += vel
+        age += 1
+        # Fade velocity over time
+        vel *= np.where(age < life // 2, 0.99, 0.95)[:, None]
+        alive = age < life
+        if not alive.all():
+            keep = int(alive.sum())
+            for arr in (self.pos, self.vel, self.age, self.life, self.size, self.color_id):
+                arr[:keep] = arr[:n][alive]
+            self.n = keep
+
+    def _sprite(self, key):
+        buckets = self.ALPHA_BUCKETS
+        color = self.colors[key // (self.MAX_SIZE * buckets)]
+        size = key // buckets % self.MAX_SIZE
+        alpha = min(255, (key % buckets * 2 + 1) * 256 // (2 * buckets))
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, color + (alpha,), (0, 0, size, size))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        # Premultiplied sprites blend identically to plain alpha, but blit faster
+        surf = surf.premul_alpha()
+        self.sprites[key] = surf
+        return surf
+
+    def boxes(self):
+        """Live particles as an (n, 4) int array of x, y, w, h (for dirty-rect tracking)."""
+        n = self.n
+        box = np.empty((n, 4), dtype=np.int64)
+        box[:, :2] = self.pos[:n]
+        box[:, 2] = box[:, 3] = np.maximum(self.size[:n], 1)
+        return box
 
     def draw(self, screen, offset=(0,0)):
-        for p in self.particles:
-            p.draw(screen, offset=offset)
+        n = self.n
+        if n == 0:
+            return
+        buckets = self.ALPHA_BUCKETS
+        alpha = 255 * np.maximum(0, 1 - self.age[:n] / self.life[:n])
+        bucket = np.minimum(alpha.astype(np.int32) * buckets // 256, buckets - 1)
+        keys = (self.color_id[:n] * self.MAX_SIZE + np.minimum(self.size[:n], self.MAX_SIZE - 1)) * buckets + bucket
+        sprites = self.sprites
+        for key in np.unique(keys).tolist():
+            if sprites[key] is None:
+                self._sprite(key)
+        # Lazy zips hand blits() one short-lived tuple at a time, so no per-particle list is built
+        xs = (self.pos[:n, 0] + offset[0]).astype(np.int32).tolist()
+        ys = (self.pos[:n, 1] + offset[1]).astype(np.int32).tolist()
+        screen.blits(zip(map(sprites.__getitem__, keys.tolist()), zip(xs, ys), repeat(None), repeat(pygame.BLEND_PREMULTIPLIED)),
+                     doreturn=False)
 
 # --- Seeker Base Class ---
 
@@ -105,29 +175,40 @@ class Seeker:
     """
     The main seeker enemy, with AI pathing, stuck detection, teleportation, and color feedback.
     """
-    def __init__(self, x, y, color, speed, particle_mgr=None):
+    def __init__(self, x, y, color, speed, particle_mgr=None, rng=None):
         self.rect = pygame.Rect(x, y, SEEKER_SIZE, SEEKER_SIZE)
         self.base_color = color
         self.color = color
+        self.settled = color  # A color the fade below maps to itself (int() stops it short of base_color)
         self.speed = speed
-        self.last_positions = []
+        self.last_positions = deque(maxlen=41)
         self.stuck_timer = 0
         self.UNSTUCK_TIME = 600  # 10 seconds at 60fps
         self.particle_mgr = particle_mgr
-        self.teleport_cooldown = random.randint(400, 900)
+        self.rng = rng if rng is not None else random  # The game's random.Random stream
+        self.teleport_cooldown = self.rng.randint(400, 900)
         self.teleport_flash = 0
         self.trail_timer = 0
+        self.detour = 0  # Decisions left following the flow field around an obstacle
+        self.velocity = (0, 0)  # Step chosen at the last decision, repeated until the next one
+        self.steering = False  # Whether that step heads for a flow field waypoint
+        self.decisions = 0
+        self.last_seen = None  # Player center when this seeker last had line of sight
 
-    def update(self, player_rect, other_seekers, obstacles, danger_distance=120):
-        # Stuck detection and teleport
-        if len(self.last_positions) > 40:
-            self.last_positions.pop(0)
-        self.last_positions.append(self.rect.topleft)
+    def update(self, player_rect, other_seekers, obstacles, danger_distance=120, flow=None, think=True, seen=True):
+        # other_seekers and obstacles are SpatialHashes (SeekerGroup's grid, the world's obstacle grid)
+        # think=False (AIScheduler: a distant seeker between its decisions) repeats the last step
+        # seen=False (no line of sight to the player) heads for where the player was last seen
+        # Stuck detection and teleport: once the deque is full, its oldest entry is the
+        # position 40 ticks ago (as SeekerSwarm's HISTORY)
+        rect = self.rect
+        last_positions = self.last_positions
+        last_positions.append(rect.topleft)
 
         stuck = False
-        if len(self.last_positions) == 40:
-            moved = max(abs(self.rect.x - self.last_positions[0][0]), abs(self.rect.y - self.last_positions[0][1]))
-            if moved < 2:
+        if len(last_positions) == last_positions.maxlen:
+            ox, oy = last_positions[0]
+            if -2 < rect.x - ox < 2 and -2 < rect.y - oy < 2:
                 self.stuck_timer += 1
                 if self.stuck_timer > self.UNSTUCK_TIME:
                     stuck = True
@@ -136,16 +217,21 @@ class Seeker:
 
         if stuck or self.teleport_cooldown <= 0:
             # Teleport to a random edge (and do a flash effect)
-            self.rect.topleft = random.choice([
-                (random.randint(0, WIDTH-SEEKER_SIZE), 0),
-                (random.randint(0, WIDTH-SEEKER_SIZE), HEIGHT-SEEKER_SIZE),
-                (0, random.randint(0, HEIGHT-SEEKER_SIZE)),
-                (WIDTH-SEEKER_SIZE, random.randint(0, HEIGHT-SEEKER_SIZE))
+            rng = self.rng
+            self.rect.topleft = rng.choice([
+                (rng.randint(0, WIDTH-SEEKER_SIZE), 0),
+                (rng.randint(0, WIDTH-SEEKER_SIZE), HEIGHT-SEEKER_SIZE),
+                (0, rng.randint(0, HEIGHT-SEEKER_SIZE)),
+                (WIDTH-SEEKER_SIZE, rng.randint(0, HEIGHT-SEEKER_SIZE))
             ])
             self.stuck_timer = 0
+            self.detour = 0
+            self.velocity = (0, 0)
+            self.steering = False
+            self.last_seen = None
             self.last_positions.clear()
             self.color = (0, 255, 255)
-            self.teleport_cooldown = random.randint(500, 1100)
+            self.teleport_cooldown = rng.randint(500, 1100)
             self.teleport_flash = 7
             if self.particle_mgr:
                 self.particle_mgr.spawn_impact(self.rect.centerx, self.rect.centery, (0,255,255))
@@ -155,36 +241,57 @@ class Seeker:
         if self.teleport_flash > 0:
             self.teleport_flash -= 1
 
-        # AI movement: home in on player, with some random jitter
-        dx = player_rect.centerx - self.rect.centerx + random.randint(-30, 30)
-        dy = player_rect.centery - self.rect.centery + random.randint(-30, 30)
-        distance = max(1, (dx**2 + dy**2)**0.5)
-        new_rect = self.rect.copy()
-        new_rect.x += int(self.speed * dx / distance)
-        new_rect.y += int(self.speed * dy / distance)
-        new_rect.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-
-        blocked = False
-        for other in other_seekers:
-            if new_rect.colliderect(other):
-                blocked = True
-        for ob in obstacles:
-            if new_rect.colliderect(ob):
-                blocked = True
-        if not blocked:
-            self.rect = new_rect
-
+        # AI movement: home in on player (or where it was last seen), with some random jitter
         px, py = player_rect.center
-        sx, sy = self.rect.center
-        dist2 = (px - sx)**2 + (py - sy)**2
-        if dist2 < danger_distance ** 2:
+        sx, sy = rect.center
+        if seen or self.last_seen is None:
+            self.last_seen = (px, py)
+        if think:
+            self.decisions += 1
+            rand = self.rng.random
+            tx, ty = self.last_seen
+            dx = tx - sx + int(rand() * 61) - 30
+            dy = ty - sy + int(rand() * 61) - 30
+            via = None
+            if self.detour > 0 and flow is not None:
+                # Detouring: head for the next cell of the flow field instead (it leads to the
+                # player, so only while the player is in sight)
+                self.detour -= 1
+                via = flow.waypoint(sx, sy) if seen else None
+                if via is not None:
+                    dx, dy = via[0] - sx, via[1] - sy
+            step = self.speed / max(1, math.sqrt(dx*dx + dy*dy))
+            self.velocity = (int(dx * step), int(dy * step))
+            self.steering = via is not None
+        mx, my = self.velocity
+
+        # A detour step that clips a corner slides along it (x only, then y only)
+        for mx, my in ((mx, my), (mx, 0), (0, my)) if self.steering else ((mx, my),):
+            new_rect = rect.move(mx, my)
+            new_rect.clamp_ip(_FIELD_RECT)
+            if obstacles.collides(new_rect):
+                # Turned back by an obstacle: route around it for a while
+                self.detour = FLOW_DETOUR_TICKS
+            elif not other_seekers.collides(new_rect, self):
+                self.rect = rect = new_rect
+                sx, sy = new_rect.center
+                break
+
+        dist2 = (px - sx)*(px - sx) + (py - sy)*(py - sy)
+        if dist2 < danger_distance * danger_distance:
             self.color = (255, 64, 64)
-        elif self.rect.colliderect(player_rect):
+        elif rect.colliderect(player_rect):
             self.color = (255, 255, 255)
         elif self.teleport_flash > 0:
             self.color = (0, 255, 255)
-        else:
-            self.color = color_lerp(self.color, self.base_color, 0.18)
+        elif self.color != self.settled:
+            # Inlined color_lerp(self.color, self.base_color, 0.18)
+            r, g, b = self.color[:3]
+            br, bg, bb = self.base_color[:3]
+            color = (int(r + (br-r)*0.18), int(g + (bg-g)*0.18), int(b + (bb-b)*0.18))
+            if color == self.color:
+                self.settled = color
+            self.color = color
 
         # Trail effect (for polish)
         self.trail_timer += 1
@@ -192,16 +299,10 @@ class Seeker:
             self.particle_mgr.spawn_trail(self.rect.centerx, self.rect.centery, self.base_color)
 
     def draw(self, screen, offset=(0,0)):
-        surf = pygame.Surface((SEEKER_SIZE, SEEKER_SIZE), pygame.SRCALPHA)
-        if self.teleport_flash > 0:
-            pygame.draw.rect(surf, (0,255,255, 150), (0,0,SEEKER_SIZE,SEEKER_SIZE), border_radius=8)
-        pygame.draw.rect(surf, self.color, (0,0,SEEKER_SIZE,SEEKER_SIZE), border_radius=10)
-        screen.blit(surf, (self.rect.x + offset[0], self.rect.y + offset[1]))
-        # Eyes (polished)
-        eye = pygame.Rect(self.rect.x+14+offset[0], self.rect.y+9+offset[1], 6, 6)
-        pygame.draw.ellipse(screen, (0,0,0), eye)
-        eye2 = pygame.Rect(self.rect.x+14+offset[0], self.rect.y+25+offset[1], 6, 6)
-        pygame.draw.ellipse(screen, (0,0,0), eye2)
+        draw_seeker_body(screen, self.rect.x + offset[0], self.rect.y + offset[1], self.color, self.teleport_flash > 0)
+
+def draw_seeker_body(screen, x, y, color, flash=False):
+    screen.blit(seeker_sprite(color, flash), (x, y))
 
 # --- Golden Seeker (special variant) ---
 
@@ -209,23 +310,25 @@ class GoldenSeeker(Seeker):
     """
     Special seeker variant for bonus points, sparkles, and extra challenge.
     """
-    def __init__(self, x, y, speed, particle_mgr=None):
-        super().__init__(x, y, (255, 224, 60), speed, particle_mgr)
+    def __init__(self, x, y, speed, particle_mgr=None, rng=None):
+        super().__init__(x, y, (255, 224, 60), speed, particle_mgr, rng)
         self.bonus = 2500
         self.sparkle_timer = 0
 
     def draw(self, screen, offset=(0,0)):
-        surf = pygame.Surface((SEEKER_SIZE, SEEKER_SIZE), pygame.SRCALPHA)
-        pygame.draw.rect(surf, (255, 224, 60, 200), (0,0,SEEKER_SIZE,SEEKER_SIZE), border_radius=10)
-        pygame.draw.rect(surf, (255, 255, 160, 160), (6,6,SEEKER_SIZE-12, SEEKER_SIZE-12), border_radius=6)
-        screen.blit(surf, (self.rect.x + offset[0], self.rect.y + offset[1]))
-        # Sparkles
         self.sparkle_timer += 1
-        if self.sparkle_timer % 5 == 0:
-            for _ in range(2):
-                x = self.rect.x + offset[0] + random.randint(0, SEEKER_SIZE)
-                y = self.rect.y + offset[1] + random.randint(0, SEEKER_SIZE)
-                pygame.draw.circle(screen, (255,255,120), (x,y), 2)
+        draw_golden_body(screen, self.rect.x + offset[0], self.rect.y + offset[1], self.sparkle_timer % 5 == 0)
+
+def draw_golden_body(screen, x, y, sparkle=False):
+    screen.blit(golden_sprite(), (x, y))
+    if sparkle:
+        draw_sparkles(screen, x, y)
+
+def draw_sparkles(screen, x, y):
+    # Cosmetic only: the global stream, so drawing never shifts a game's RNG
+    dot = sparkle_sprite()
+    for _ in range(2):
+        screen.blit(dot, (x + random.randint(0, SEEKER_SIZE) - 2, y + random.randint(0, SEEKER_SIZE) - 2))
 
 # --- For Future: BossSeeker, RainbowSeeker, etc. ---
 
@@ -233,8 +336,8 @@ class BossSeeker(Seeker):
     """
     Large, slower, area-denial seeker for advanced game modes.
     """
-    def __init__(self, x, y, particle_mgr=None):
-        super().__init__(x, y, (180, 80, 255), 1, particle_mgr)
+    def __init__(self, x, y, particle_mgr=None, rng=None):
+        super().__init__(x, y, (180, 80, 255), 1, particle_mgr, rng)
         self.rect.width = SEEKER_SIZE * 2
         self.rect.height = SEEKER_SIZE * 2
         self.health = 5
@@ -251,15 +354,373 @@ class BossSeeker(Seeker):
         self.phase += 1
 
     def draw(self, screen, offset=(0,0)):
-        surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(surf, (180,80,255,150), (0,0,self.rect.width,self.rect.height), border_radius=14)
-        pygame.draw.rect(surf, (255,255,255,60), (8,8,self.rect.width-16, self.rect.height-16), border_radius=8)
-        screen.blit(surf, (self.rect.x + offset[0], self.rect.y + offset[1]))
-        # Eyes
-        eye = pygame.Rect(self.rect.x+38+offset[0], self.rect.y+18+offset[1], 14, 14)
-        pygame.draw.ellipse(screen, (0,0,0), eye)
-        eye2 = pygame.Rect(self.rect.x+38+offset[0], self.rect.y+54+offset[1], 14, 14)
-        pygame.draw.ellipse(screen, (0,0,0), eye2)
+        screen.blit(boss_sprite(self.rect.width, self.rect.height), (self.rect.x + offset[0], self.rect.y + offset[1]))
+
+# --- Seeker Swarm (struct-of-arrays, batched update) ---
+
+SEEKER_KIND_NORMAL = 0
+SEEKER_KIND_GOLDEN = 1
+
+GOLDEN_COLOR = (255, 224, 60)
+_DANGER_COLOR = np.array((255, 64, 64))
+_TOUCH_COLOR = np.array((255, 255, 255))
+_FLASH_COLOR = np.array((0, 255, 255))
+_POS_MAX = np.array((WIDTH - SEEKER_SIZE, HEIGHT - SEEKER_SIZE))
+
+class SeekerSwarm:
+    """
+    Every seeker of a game stored as NumPy arrays (positions, speeds, colors, teleport cooldowns,
+    stuck state) and advanced in one batched pass per tick.
+    The rules are Seeker.update()'s: homing with jitter (on the last seen player position without
+    line of sight), obstacle blocking, flow field detours, edge and stuck teleports, danger coloring.
+    Seeker-to-seeker blocking differs. SeekerGroup moves seekers one at a time, each checked against
+    the others' current squares. Here every seeker decides against the start-of-tick positions, and
+    a move is refused if it would overlap any other seeker's old or proposed square.
+    """
+    HISTORY = 40
+    UNSTUCK_TIME = 600  # 10 seconds at 60fps
+
+    def __init__(self, particle_mgr=None, capacity=16, rng=None):
+        self.particle_mgr = particle_mgr
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.n = 0
+        self.tick = 0
+        self.sparkle_timer = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.int64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.base_color = np.zeros((capacity, 3), dtype=np.int64)
+        self.color = np.zeros((capacity, 3), dtype=np.int64)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.teleport_cooldown = np.zeros(capacity, dtype=np.int64)
+        self.teleport_flash = np.zeros(capacity, dtype=np.int64)
+        self.stuck_timer = np.zeros(capacity, dtype=np.int64)
+        self.trail_timer = np.zeros(capacity, dtype=np.int64)
+        self.detour = np.zeros(capacity, dtype=np.int64)  # Decisions left following the flow field around an obstacle
+        self.vel = np.zeros((capacity, 2), dtype=np.int64)  # Step chosen at the last decision
+        self.steering = np.zeros(capacity, dtype=bool)  # Whether that step heads for a flow field waypoint
+        self.decisions = np.zeros(capacity, dtype=np.int64)
+        self.last_seen = np.full((capacity, 2), -1, dtype=np.int64)  # Player center at the last line of sight (-1: none yet)
+        self.history = np.zeros((self.HISTORY, capacity, 2), dtype=np.int64)
+        self.history_count = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self):
+        return self.n
+
+    def _grow(self):
+        capacity = len(self.pos) * 2
+        for name in ("pos", "speed", "base_color", "color", "kind", "teleport_cooldown",
+                     "teleport_flash", "stuck_timer", "trail_timer", "detour", "vel", "steering", "decisions",
+                     "last_seen", "history_count"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+        history = np.zeros((self.HISTORY, capacity, 2), dtype=np.int64)
+        history[:, :self.n] = self.history[:, :self.n]
+        self.history = history
+
+    def spawn(self, x, y, color, speed, kind=SEEKER_KIND_NORMAL):
+        if self.n == len(self.pos):
+            self._grow()
+        i = self.n
+        self.pos[i] = (x, y)
+        self.speed[i] = speed
+        self.base_color[i] = color[:3]
+        self.color[i] = color[:3]
+        self.kind[i] = kind
+        self.teleport_cooldown[i] = self.rng.integers(400, 901)
+        self.teleport_flash[i] = 0
+        self.stuck_timer[i] = 0
+        self.trail_timer[i] = 0
+        self.detour[i] = 0
+        self.vel[i] = 0
+        self.steering[i] = False
+        self.decisions[i] = 0
+        self.last_seen[i] = -1
+        self.history_count[i] = 0
+        self.n += 1
+        return i
+
+    def clear(self):
+        self.n = 0
+
+    # --- Queries ---
+
+    def rect(self, i):
+        return pygame.Rect(int(self.pos[i, 0]), int(self.pos[i, 1]), SEEKER_SIZE, SEEKER_SIZE)
+
+    def rects(self):
+        return [pygame.Rect(x, y, SEEKER_SIZE, SEEKER_SIZE) for x, y in self.pos[:self.n].tolist()]
+
+    def center(self, i):
+        return int(self.pos[i, 0]) + SEEKER_SIZE // 2, int(self.pos[i, 1]) + SEEKER_SIZE // 2
+
+    def positions(self):
+        """Top-left corners as an (n, 2) int array."""
+        return self.pos[:self.n]
+
+    def centers(self):
+        """Centers as an (n, 2) int array."""
+        return self.pos[:self.n] + SEEKER_SIZE // 2
+
+    def set_positions(self, pos):
+        self.pos[:len(pos)] = pos
+
+    def colliding(self, rect):
+        """Boolean mask of seekers whose square collides with `rect`."""
+        pos = self.pos[:self.n]
+        return ((pos[:, 0] < rect.right) & (pos[:, 0] + SEEKER_SIZE > rect.x) &
+                (pos[:, 1] < rect.bottom) & (pos[:, 1] + SEEKER_SIZE > rect.y))
+
+    def collides(self, rect):
+        return bool(self.colliding(rect).any())
+
+    def count_colliding(self, rect):
+        return int(self.colliding(rect).sum())
+
+    def any_within(self, x, y, radius):
+        """True if any seeker center is closer than `radius` to (x, y)."""
+        d = self.pos[:self.n] + SEEKER_SIZE // 2 - (x, y)
+        return bool(((d * d).sum(axis=1) < radius * radius).any())
+
+    # --- Batched update ---
+
+    def update(self, player_rect, obstacles, danger_distance=120, flow=None, think=None, seen=None):
+        # think: (n,) mask of seekers that decide this tick (AIScheduler), the others repeat their last step
+        # seen: (n,) mask of seekers with line of sight to the player (None: all), the others head
+        # for where they last saw it
+        n = self.n
+        if n == 0:
+            return
+        pos = self.pos[:n]
+
+        # Stuck detection: compare against the position HISTORY ticks ago
+        slot = self.tick % self.HISTORY
+        self.tick += 1
+        history = self.history[slot, :n]
+        full = self.history_count[:n] >= self.HISTORY
+        still = full & (np.abs(pos - history).max(axis=1) < 2)
+        stuck_timer = self.stuck_timer[:n]
+        stuck_timer[still] += 1
+        stuck_timer[full & ~still] = 0
+        history[:] = pos
+        self.history_count[:n] += 1
+
+        teleport = (stuck_timer > self.UNSTUCK_TIME) | (self.teleport_cooldown[:n] <= 0)
+        if teleport.any():
+            self._teleport(np.flatnonzero(teleport))
+        moving = ~teleport
+
+        self.teleport_cooldown[:n][moving] -= 1
+        flash = self.teleport_flash[:n]
+        flash[moving & (flash > 0)] -= 1
+
+        # AI movement: home in on player (or where it was last seen), with some random jitter
+        player_center = np.array(player_rect.center)
+        last_seen = self.last_seen[:n]
+        if seen is None:
+            last_seen[:] = player_center
+        else:
+            last_seen[seen | (last_seen[:, 0] < 0)] = player_center
+        detour = self.detour[:n]
+        steering = self.steering[:n]
+        planners = np.flatnonzero(moving if think is None else moving & think)
+        if len(planners):
+            self.decisions[planners] += 1
+            centers = pos[planners] + SEEKER_SIZE // 2
+            d = last_seen[planners] - centers + self.rng.integers(-30, 31, size=(len(planners), 2))
+            # Detouring seekers head for the next cell of the flow field instead (it leads to the
+            # player, so only while the player is in sight)
+            follow = detour[planners] > 0 if flow is not None else np.zeros(len(planners), dtype=bool)
+            if follow.any():
+                detour[planners[follow]] -= 1
+                if seen is not None:
+                    follow &= seen[planners]
+                targets, found = flow.waypoints(centers[follow])
+                follow[follow] = found
+                d[follow] = targets[found] - centers[follow]
+            dist = np.maximum(1.0, np.sqrt((d * d).sum(axis=1)))
+            self.vel[planners] = np.trunc(d * (self.speed[planners] / dist)[:, None])
+            steering[planners] = follow
+        proposed = np.clip(pos + self.vel[:n], 0, _POS_MAX)
+        proposed[teleport] = pos[teleport]
+
+        idx = np.arange(n)
+        walled = self._hits_obstacles(proposed, obstacles)
+        detour[walled & moving] = FLOW_DETOUR_TICKS  # Turned back by an obstacle: route around it for a while
+        blocked = walled | boxes_overlap_any(proposed, SEEKER_SIZE, pos, SEEKER_SIZE, cell=SEEKER_SIZE, exclude=idx)
+        blocked |= boxes_overlap_any(proposed, SEEKER_SIZE, proposed, SEEKER_SIZE, cell=SEEKER_SIZE, exclude=idx)
+        accept = moving & ~blocked
+        pos[accept] = proposed[accept]
+
+        # A detour step that clips a corner slides along it (x only, then y only), against the moved swarm
+        slide_any = steering & walled
+        if slide_any.any():
+            for axis in (1, 0):
+                retry = np.flatnonzero(slide_any & blocked)
+                if len(retry) == 0:
+                    break
+                slide = proposed[retry]
+                slide[:, axis] = pos[retry, axis]
+                clear = ~self._hits_obstacles(slide, obstacles)
+                retry, slide = retry[clear], slide[clear]
+                ok = ~boxes_overlap_any(slide, SEEKER_SIZE, pos, SEEKER_SIZE, cell=SEEKER_SIZE, exclude=retry)
+                ok &= ~boxes_overlap_any(slide, SEEKER_SIZE, slide, SEEKER_SIZE, cell=SEEKER_SIZE,
+                                         exclude=np.arange(len(retry)))
+                pos[retry[ok]] = slide[ok]
+                blocked[retry[ok]] = False
+
+        # Danger coloring
+        rel = pos + SEEKER_SIZE // 2 - player_center
+        danger = (rel * rel).sum(axis=1) < danger_distance * danger_distance
+        touching = self.colliding(player_rect)
+        color = self.color[:n]
+        faded = np.floor(color + (self.base_color[:n] - color) * 0.18).astype(np.int64)
+        new_color = np.where(danger[:, None], _DANGER_COLOR,
+                    np.where(touching[:, None], _TOUCH_COLOR,
+                    np.where((flash > 0)[:, None], _FLASH_COLOR, faded)))
+        color[moving] = new_color[moving]
+
+        # Trail effect (for polish)
+        trail = self.trail_timer[:n]
+        trail[moving] += 1
+        if self.particle_mgr:
+            due = moving & (trail % 3 == 0)
+            self.particle_mgr.spawn_trails(pos[due] + SEEKER_SIZE // 2, self.base_color[:n][due])
+
+    def _hits_obstacles(self, proposed, obstacles):
+        if isinstance(obstacles, SpatialHash):
+            ob = obstacles.boxes()
+            cell = obstacles.cell_size
+        else:
+            ob = np.array([(r.x, r.y, r.width, r.height) for r in obstacles], dtype=np.int64).reshape(-1, 4)
+            cell = int(max(ob[:, 2:].max(initial=SEEKER_SIZE), SEEKER_SIZE))
+        return boxes_overlap_any(proposed, SEEKER_SIZE, ob[:, :2], ob[:, 2:], cell=cell)
+
+    def _teleport(self, idx):
+        # Teleport to a random edge (and do a flash effect)
+        k = len(idx)
+        rng = self.rng
+        edge = rng.integers(0, 4, size=k)
+        along_x = rng.integers(0, WIDTH - SEEKER_SIZE + 1, size=k)
+        along_y = rng.integers(0, HEIGHT - SEEKER_SIZE + 1, size=k)
+        x = np.select([edge < 2, edge == 2], [along_x, 0], WIDTH - SEEKER_SIZE)
+        y = np.select([edge == 0, edge == 1], [0, HEIGHT - SEEKER_SIZE], along_y)
+        self.pos[idx, 0] = x
+        self.pos[idx, 1] = y
+        self.stuck_timer[idx] = 0
+        self.detour[idx] = 0
+        self.vel[idx] = 0
+        self.steering[idx] = False
+        self.last_seen[idx] = -1
+        self.history_count[idx] = 0
+        self.color[idx] = _FLASH_COLOR
+        self.teleport_cooldown[idx] = rng.integers(500, 1101, size=k)
+        self.teleport_flash[idx] = 7
+        if self.particle_mgr:
+            self.particle_mgr.spawn_impacts(self.pos[idx] + SEEKER_SIZE // 2, (0,255,255))
+
+    # --- Drawing ---
+
+    def draw(self, screen, offset=(0,0)):
+        self.sparkle_timer += 1
+        sparkle = self.sparkle_timer % 5 == 0
+        ox, oy = offset[0], offset[1]
+        golden = golden_sprite()
+        blits = []
+        sparkles = []
+        for (x, y), color, kind, flash in zip(self.pos[:self.n].tolist(), self.color[:self.n].tolist(),
+                                              self.kind[:self.n].tolist(), self.teleport_flash[:self.n].tolist()):
+            if kind == SEEKER_KIND_GOLDEN:
+                blits.append((golden, (x + ox, y + oy)))
+                if sparkle:
+                    sparkles.append((x + ox, y + oy))
+            else:
+                blits.append((seeker_sprite(tuple(color), flash > 0), (x + ox, y + oy)))
+        screen.blits(blits, doreturn=False)
+        for x, y in sparkles:
+            draw_sparkles(screen, x, y)
+
+# --- Seeker Group (per-object seekers behind the swarm interface) ---
+
+class SeekerGroup:
+    """
+    Seeker/GoldenSeeker objects behind the same interface as SeekerSwarm.
+    For the default handful of seekers this is faster than the batched path,
+    whose fixed NumPy call overhead only pays off once there are dozens of seekers.
+    Seeker-seeker blocking goes through a SpatialHash kept in step with every move.
+    """
+    def __init__(self, particle_mgr=None, rng=None):
+        self.particle_mgr = particle_mgr
+        self.rng = rng
+        self.seekers = []
+        self.grid = SpatialHash()
+
+    def __len__(self):
+        return len(self.seekers)
+
+    def __iter__(self):
+        return iter(self.seekers)
+
+    def spawn(self, x, y, color, speed, kind=SEEKER_KIND_NORMAL):
+        if kind == SEEKER_KIND_GOLDEN:
+            seeker = GoldenSeeker(x, y, speed, self.particle_mgr, self.rng)
+        else:
+            seeker = Seeker(x, y, color, speed, self.particle_mgr, self.rng)
+        self.seekers.append(seeker)
+        self.grid.insert(seeker, seeker.rect)
+        return len(self.seekers) - 1
+
+    def clear(self):
+        self.seekers = []
+        self.grid.clear()
+
+    def rect(self, i):
+        return self.seekers[i].rect
+
+    def rects(self):
+        return [s.rect for s in self.seekers]
+
+    def center(self, i):
+        return self.seekers[i].rect.center
+
+    def positions(self):
+        return np.array([s.rect.topleft for s in self.seekers], dtype=np.int64).reshape(-1, 2)
+
+    def centers(self):
+        """Centers as a list of (x, y) (what Occluders.visible answers without NumPy)."""
+        return [s.rect.center for s in self.seekers]
+
+    def set_positions(self, pos):
+        """Move the first len(pos) seekers to the given top-left corners (grid left untouched)."""
+        for seeker, (x, y) in zip(self.seekers, pos.tolist()):
+            seeker.rect.topleft = (x, y)
+
+    def collides(self, rect):
+        return self.grid.collides(rect)
+
+    def count_colliding(self, rect):
+        return len(self.grid.query(rect))
+
+    def any_within(self, x, y, radius):
+        for s in self.seekers:
+            sx, sy = s.rect.center
+            if (x-sx)*(x-sx) + (y-sy)*(y-sy) < radius*radius:
+                return True
+        return False
+
+    def update(self, player_rect, obstacles, flow=None, think=None, seen=None):
+        grid = self.grid
+        n = len(self.seekers)
+        think = repeat(True, n) if think is None else think.tolist()
+        seen = repeat(True, n) if seen is None else seen
+        for seeker, plan, sight in zip(self.seekers, think, seen):
+            seeker.update(player_rect, grid, obstacles, flow=flow, think=plan, seen=sight)
+            grid.move(seeker, seeker.rect)
+
+    def draw(self, screen, offset=(0,0)):
+        for seeker in self.seekers:
+            seeker.draw(screen, offset=offset)
 
 # --- End of seeker.py ---
 # (Lines: ~530+, ready for next!)
\ No newline at end of file
@@ -9,6 +9,7 @@ import json
 import os
 from config import (
     THEMES, BOOST_DURATION, SEEKER_SPEEDS, SEEKER_SPAWN_INTERVALS, PROJECTILE_COOLDOWNS,
+    SPAWN_RAMP_SCORE, SPEED_RAMP_SCORE, SEEKER_CEILINGS,
     ACHIEVEMENT_LIST, get_achievement_desc, POWERUP_NAMES
 )
 
@@ -63,6 +64,15 @@ class Settings:
     def get_projectile_cooldown(self):
         return PROJECTILE_COOLDOWNS[self.difficulty]
 
+    def get_spawn_ramp_score(self):
+        return SPAWN_RAMP_SCORE[self.difficulty]
+
+    def get_speed_ramp_score(self):
+        return SPEED_RAMP_SCORE[self.difficulty]
+
+    def get_max_seekers(self):
+        return SEEKER_CEILINGS[self.difficulty]
+
     def save(self):
         data = {
             "theme_index": self.theme_index,
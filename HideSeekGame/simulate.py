@@ -0,0 +1,229 @@
+"""
+simulate.py — Hide & Seek+ Monte Carlo Game Runner
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Plays thousands of headless games with a bot policy (bots.POLICIES) across a process pool and
+reports survival-time and score distributions plus the unlock rate of every achievement (World
+reports pickups and hits; play_game() checks the survival, score, boost, multiplier and clutch goals
+as the game runs). Achievements the game cannot award yet are listed at 0%.
+Game seeds come from one SeedSequence and are handed out in batches, so the results are the same
+for any worker count or batch size and only one small result list crosses back per batch.
+
+    python simulate.py --games 10000 --difficulty Master --workers 8
+    python simulate.py --games 2000 --difficulty Easy --policy random --json easy.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from config import FPS, THEMES, PLAYER_SIZE, SEEKER_SIZE, ACHIEVEMENT_LIST, SHIPPED_PROFILE, apply_profile
+from settings import Settings
+from world import World
+from bots import POLICIES
+
+ACHIEVEMENT_KEYS = [a["key"] for a in ACHIEVEMENT_LIST]
+# Player health never drops and the multiplier stops at x5: these stay at 0% until the game awards them
+NOT_AWARDED = ("Comeback", "ComboKing")
+CLUTCH_DISTANCE = (PLAYER_SIZE + SEEKER_SIZE) // 2 + 10  # Center distance of a seeker passing <10px from the player
+DIFFICULTIES = ("Easy", "Hard", "Master")
+DEFAULT_BATCH = 50
+DEFAULT_MAX_SECONDS = 600  # Games still running after this are stopped and counted as capped
+
+# --- Games ---
+
+def _settings(difficulty):
+    settings = Settings()
+    settings.difficulty = difficulty
+    settings.theme_name = next(iter(THEMES))
+    return settings
+
+def play_game(settings, policy, seed, max_ticks):
+    """One headless game. Returns (ticks survived, score, set of achievement keys unlocked)."""
+    world = World(settings, particles=False, seed=seed)
+    act = POLICIES[policy](seed).act
+    step = world.step
+    player = world.player
+    unlocked = set()
+    collected = boosts = 0
+    boosting = False
+    top_multiplier = 1
+    first_pickup = None
+    seekers_at_minute = 0
+    clutch = False
+    while not world.game_over and world.tick < max_ticks:
+        step(act(world))
+        if world.pending_unlocks:
+            keys = world.drain_unlocks()
+            collected += keys.count("Collector")
+            if collected and first_pickup is None:
+                first_pickup = world.tick
+            unlocked.update(keys)
+        if player.boost_active and not boosting:
+            boosts += 1
+        boosting = player.boost_active
+        top_multiplier = max(top_multiplier, world.multiplier)
+        if not clutch and not world.game_over:
+            clutch = world.seekers.any_within(*player.rect.center, CLUTCH_DISTANCE)
+        if world.tick == 60 * FPS:
+            seekers_at_minute = len(world.seekers)
+
+    survived = world.tick
+    goals = {
+        "FirstBlood": survived >= 20 * FPS,
+        "LastStand": survived >= 120 * FPS,
+        "SpeedDemon": boosts >= 10,
+        "Perfect": survived >= 90 * FPS and (first_pickup is None or first_pickup > 90 * FPS),
+        "Untouchable": seekers_at_minute >= 10,
+        "Hardcore": settings.difficulty == "Master" and world.score >= 20000,
+        "MaxMultiplier": top_multiplier >= 5,
+        "CollectorPro": collected >= 10,
+        "Clutch": clutch,
+    }
+    unlocked.update(key for key, met in goals.items() if met)
+    return survived, world.score, unlocked
+
+def run_batch(difficulty, policy, seeds, max_ticks, profile=None):
+    """
+    Worker entry point: one game per seed, with `profile` (config.apply_profile) laid over the
+    shipped tables. Returns per-game ticks and scores, and unlock counts.
+    """
+    apply_profile(SHIPPED_PROFILE)
+    if profile:
+        apply_profile(profile)
+    settings = _settings(difficulty)
+    ticks, scores = [], []
+    unlocks = dict.fromkeys(ACHIEVEMENT_KEYS, 0)
+    for seed in seeds:
+        t, score, unlocked = play_game(settings, policy, seed, max_ticks)
+        ticks.append(t)
+        scores.append(score)
+        for key in unlocked:
+            if key in unlocks:
+                unlocks[key] += 1
+    return {"ticks": ticks, "scores": scores, "unlocks": unlocks}
+
+def batch_seeds(seed, games, batch_size):
+    """
+    The first `games` seeds of SeedSequence(seed), split into batches. The seeds do not depend on
+    batch_size, and a longer run starts with the seeds of a shorter one.
+    """
+    seeds = np.random.SeedSequence(seed).generate_state(games).tolist()
+    return [seeds[start:start + batch_size] for start in range(0, games, batch_size)]
+
+def merge_batches(results):
+    """(ticks array, scores array, unlock counts) of batch results, concatenated in batch order."""
+    ticks = np.array([t for result in results for t in result["ticks"]])
+    scores = np.array([score for result in results for score in result["scores"]])
+    unlocks = {key: sum(result["unlocks"][key] for result in results) for key in ACHIEVEMENT_KEYS}
+    return ticks, scores, unlocks
+
+def simulate(games, difficulty, policy="flee", workers=None, seed=0, batch_size=DEFAULT_BATCH,
+             max_seconds=DEFAULT_MAX_SECONDS, progress=None, profile=None):
+    """
+    Run `games` games, collecting the batches as they finish. workers=1 runs in this process.
+    progress(done) is called after every batch. Returns (ticks array, scores array, unlock counts).
+    """
+    max_ticks = int(max_seconds * FPS)
+    batches = batch_seeds(seed, games, batch_size)
+    results = [None] * len(batches)
+    done = 0
+
+    def merge(i, result):
+        nonlocal done
+        results[i] = result
+        done += len(result["ticks"])
+        if progress:
+            progress(done)
+
+    if workers == 1:
+        for i, seeds in enumerate(batches):
+            merge(i, run_batch(difficulty, policy, seeds, max_ticks, profile))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_batch, difficulty, policy, seeds, max_ticks, profile): i
+                       for i, seeds in enumerate(batches)}
+            for future in as_completed(futures):
+                merge(futures[future], future.result())
+    # Merged in batch order, so the numbers never depend on which worker finished first
+    return merge_batches(results)
+
+# --- Reporting ---
+
+def distribution(values):
+    values = np.asarray(values, dtype=np.float64)
+    stats = {"mean": float(values.mean()), "min": float(values.min())}
+    for p in (10, 25, 50, 75, 90, 99):
+        stats[f"p{p}"] = float(np.percentile(values, p))
+    stats["max"] = float(values.max())
+    return stats
+
+def summarize(ticks, scores, unlocks, max_seconds=DEFAULT_MAX_SECONDS):
+    games = len(ticks)
+    return {
+        "games": games,
+        "survival_s": distribution(ticks / FPS),
+        "score": distribution(scores),
+        "capped": float((ticks >= int(max_seconds * FPS)).mean()),
+        "unlock_rate": {key: unlocks[key] / games for key in ACHIEVEMENT_KEYS},
+    }
+
+def histogram(values, bins=12, width=40):
+    """Text histogram lines of `values`."""
+    counts, edges = np.histogram(values, bins=bins)
+    peak = max(1, counts.max())
+    return [f"{edges[i]:8.1f}-{edges[i + 1]:<8.1f} {'#' * round(width * c / peak):<{width}} {c}"
+            for i, c in enumerate(counts)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hide & Seek+ Monte Carlo game runner")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, default="Easy")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="flee")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes (1 = run inline)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch", type=int, default=DEFAULT_BATCH, help="games per batch sent to a worker")
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS, help="stop games that survive this long")
+    parser.add_argument("--profile", metavar="FILE", help="difficulty profile JSON to play with (from tune.py)")
+    parser.add_argument("--json", metavar="FILE", help="write the summary to FILE")
+    args = parser.parse_args(argv)
+    profile = None
+    if args.profile:
+        with open(args.profile) as f:
+            profile = json.load(f)
+
+    def progress(done):
+        print(f"\r{done}/{args.games} games", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    ticks, scores, unlocks = simulate(args.games, args.difficulty, args.policy, args.workers, args.seed,
+                                      args.batch, args.max_seconds, progress, profile)
+    elapsed = time.perf_counter() - start
+    print(file=sys.stderr)
+    summary = summarize(ticks, scores, unlocks, args.max_seconds)
+    summary.update(difficulty=args.difficulty, policy=args.policy, seed=args.seed,
+                   workers=args.workers, games_per_sec=round(args.games / elapsed, 1))
+
+    print(f"{args.games} games of {args.difficulty} ({args.policy} bot) in {elapsed:.1f}s "
+          f"on {args.workers} workers ({args.games / elapsed:,.0f} games/sec, {ticks.sum() / elapsed:,.0f} ticks/sec)")
+    for name, stats in (("survival (s)", summary["survival_s"]), ("score", summary["score"])):
+        print(f"{name:<13} " + "  ".join(f"{k} {v:,.1f}" for k, v in stats.items()))
+    print(f"capped at {args.max_seconds:g}s: {summary['capped']:.1%}")
+    print("\nsurvival histogram (s)")
+    for line in histogram(ticks / FPS):
+        print("  " + line)
+    print("\nachievement unlock rates")
+    for key, rate in summary["unlock_rate"].items():
+        note = "  (not awarded in play)" if key in NOT_AWARDED else ""
+        print(f"  {key:<14} {rate:7.1%}{note}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- End of simulate.py ---
@@ -0,0 +1,321 @@
+"""
+spatial.py — Hide & Seek+ Spatial Hash Broadphase
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Uniform-grid indexes for every rect collision query in the game: seeker-seeker, entity-obstacle,
+projectile-player and pickups. SpatialHash serves the per-object code and is updated incrementally
+as entities move; boxes_overlap_any() is the batched equivalent used by the NumPy seeker swarm.
+"""
+
+import time
+import random
+import numpy as np
+import pygame
+from config import WIDTH, HEIGHT, SEEKER_SIZE, OBSTACLE_SIZE, GRID_CELL_SIZE
+
+_ROW = 1 << 16  # Cell id = cx + cy * _ROW (cells stay unique for anything near the field)
+
+class SpatialHash:
+    """
+    Rects keyed by any hashable (an entity, an index) and bucketed into square cells.
+    move() only touches buckets when a rect crosses into a different span of cells.
+    While the index holds few entries, queries scan a flat list with Rect.collidelistall instead,
+    which beats the dict lookups until there are a couple of dozen rects; the buckets are then left
+    stale and rebuilt once the index grows past SMALL.
+    """
+    SMALL = 24
+
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.spans = {}
+        self.slots = {}
+        self.keys = []
+        self.rects = []
+        self.version = 0
+        self._stale = False  # Buckets out of date (only while the index is small)
+        self._boxes = None
+        self._boxes_version = -1
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def _span(self, rect):
+        c = self.cell_size
+        return rect.x // c, rect.y // c, (rect.right - 1) // c, (rect.bottom - 1) // c
+
+    def _add_to_cells(self, key, span):
+        x0, y0, x1, y1 = span
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get(cx + cy * _ROW)
+                if bucket is None:
+                    cells[cx + cy * _ROW] = {key}
+                else:
+                    bucket.add(key)
+
+    def _reindex(self):
+        self.cells.clear()
+        self.spans.clear()
+        for key, rect in zip(self.keys, self.rects):
+            span = self._span(rect)
+            self.spans[key] = span
+            self._add_to_cells(key, span)
+        self._stale = False
+
+    def _remove_from_cells(self, key, span):
+        x0, y0, x1, y1 = span
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells[cx + cy * _ROW]
+                bucket.discard(key)
+                if not bucket:
+                    del cells[cx + cy * _ROW]
+
+    # --- Updates ---
+
+    def insert(self, key, rect):
+        if key in self.slots:
+            self.move(key, rect)
+            return
+        self.slots[key] = len(self.keys)
+        self.keys.append(key)
+        self.rects.append(rect)
+        self.version += 1
+        if len(self.keys) <= self.SMALL:
+            self._stale = True
+        elif self._stale:
+            self._reindex()
+        else:
+            span = self._span(rect)
+            self.spans[key] = span
+            self._add_to_cells(key, span)
+
+    def move(self, key, rect=None):
+        """Re-index `key` after its rect moved (or was replaced by `rect`)."""
+        slot = self.slots[key]
+        if rect is None:
+            rect = self.rects[slot]
+        else:
+            self.rects[slot] = rect
+        self.version += 1
+        if len(self.keys) <= self.SMALL:
+            self._stale = True
+            return
+        span = self._span(rect)
+        old = self.spans[key]
+        if span != old:
+            self._remove_from_cells(key, old)
+            self._add_to_cells(key, span)
+            self.spans[key] = span
+
+    def remove(self, key):
+        slot = self.slots.pop(key)
+        if self._stale:
+            self.spans.pop(key, None)
+        else:
+            self._remove_from_cells(key, self.spans.pop(key))
+        # Swap-remove keeps the flat lists dense
+        last_key = self.keys.pop()
+        last_rect = self.rects.pop()
+        if slot < len(self.keys):
+            self.keys[slot] = last_key
+            self.rects[slot] = last_rect
+            self.slots[last_key] = slot
+        self.version += 1
+
+    def clear(self):
+        self.cells.clear()
+        self.spans.clear()
+        self.slots.clear()
+        self.keys.clear()
+        self.rects.clear()
+        self._stale = False
+        self.version += 1
+
+    def rebuild(self, items):
+        """Replace the contents with (key, rect) pairs."""
+        self.clear()
+        for key, rect in items:
+            self.insert(key, rect)
+
+    # --- Queries ---
+
+    def query(self, rect, ignore=None):
+        """Keys whose rect collides with `rect` (Rect.colliderect semantics)."""
+        if len(self.keys) <= self.SMALL:
+            keys = self.keys
+            return [keys[i] for i in rect.collidelistall(self.rects) if keys[i] is not ignore]
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self.cells
+        rects = self.rects
+        slots = self.slots
+        found = []
+        seen = set()
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get(cx + cy * _ROW)
+                if not bucket:
+                    continue
+                for key in bucket:
+                    if key in seen or key is ignore:
+                        continue
+                    seen.add(key)
+                    if rect.colliderect(rects[slots[key]]):
+                        found.append(key)
+        return found
+
+    def collides(self, rect, ignore=None):
+        """True if anything but `ignore` collides with `rect`."""
+        if len(self.keys) <= self.SMALL:
+            if ignore is None:
+                return rect.collidelist(self.rects) != -1
+            keys = self.keys
+            for i in rect.collidelistall(self.rects):
+                if keys[i] is not ignore:
+                    return True
+            return False
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self.cells
+        rects = self.rects
+        slots = self.slots
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get(cx + cy * _ROW)
+                if not bucket:
+                    continue
+                for key in bucket:
+                    if key is not ignore and rect.colliderect(rects[slots[key]]):
+                        return True
+        return False
+
+    def boxes(self):
+        """All rects as an (n, 4) int array of x, y, w, h, cached until the index changes."""
+        if self._boxes_version != self.version:
+            self._boxes = np.array([(r.x, r.y, r.width, r.height) for r in self.rects],
+                                   dtype=np.int64).reshape(-1, 4)
+            self._boxes_version = self.version
+        return self._boxes
+
+def hits_any(rect, colliders, ignore=None):
+    """`rect` against a SpatialHash or a plain list of Rects."""
+    if isinstance(colliders, SpatialHash):
+        return colliders.collides(rect, ignore)
+    return rect.collidelist(colliders) != -1
+
+# --- Batched Broadphase (NumPy) ---
+
+_BROADCAST_LIMIT = 128  # Up to this many boxes a dense pairwise test beats grid binning
+
+def boxes_overlap_any(query, qsize, others, osize, cell=GRID_CELL_SIZE, exclude=None):
+    """
+    For each query box (k, 2 top-lefts, all qsize x qsize), True if it strictly overlaps
+    (like Rect.colliderect) any box in `others` (m, 2 top-lefts). osize is one size for every
+    other box or an (m, 2) array of widths/heights; no box may be larger than `cell`.
+    exclude[i] is an index into `others` that query i ignores.
+    """
+    k, m = len(query), len(others)
+    hit = np.zeros(k, dtype=bool)
+    if k == 0 or m == 0:
+        return hit
+    osize = np.broadcast_to(np.asarray(osize), (m, 2)) if np.ndim(osize) else osize
+    if k <= _BROADCAST_LIMIT and m <= 2 * _BROADCAST_LIMIT:
+        d = others[None, :, :] - query[:, None, :]
+        close = ((d < qsize) & (d > -osize)).all(axis=2)
+        if exclude is not None:
+            close[np.arange(k), exclude] = False
+        return close.any(axis=1)
+
+    # Bin `others` into cells (one cell of padding all round keeps neighbor ids in range).
+    # Any box overlapping a query has its corner in the 3x3 cells around the query's corner.
+    # Equal boxes one cell wide whose corners share a cell always overlap, which settles
+    # most queries in crowds without a single pair test.
+    grid_w = WIDTH // cell + 3
+    grid_cells = grid_w * (HEIGHT // cell + 3)
+    ocells = (np.clip(others[:, 1] // cell, -1, HEIGHT // cell) + 1) * grid_w + np.clip(others[:, 0] // cell, -1, WIDTH // cell) + 1
+    qcell = (query[:, 1] // cell + 1) * grid_w + query[:, 0] // cell + 1
+    counts = np.bincount(ocells, minlength=grid_cells)
+    neighbors = [-grid_w - 1, -grid_w, -grid_w + 1, -1, 1, grid_w - 1, grid_w, grid_w + 1]
+    rest = np.arange(k)
+    if np.ndim(osize) == 0 and qsize == osize == cell:
+        same = counts[qcell]
+        if exclude is not None:
+            same = same - (ocells[exclude] == qcell)
+        hit = same > 0
+        rest = np.flatnonzero(~hit)
+        if len(rest) == 0:
+            return hit
+    else:
+        neighbors.append(0)
+
+    order = np.argsort(ocells, kind="stable")
+    starts = np.cumsum(counts) - counts
+    targets = (qcell[rest, None] + np.array(neighbors)).ravel()
+    count = counts[targets]
+    total = int(count.sum())
+    if total == 0:
+        return hit
+    owner = rest[np.repeat(np.arange(len(targets)) // len(neighbors), count)]
+    first = np.repeat(starts[targets] - (np.cumsum(count) - count), count)
+    j = order[first + np.arange(total)]
+    d = others[j] - query[owner]
+    reach = osize[j] if np.ndim(osize) else osize
+    close = ((d < qsize) & (d > -reach)).all(axis=1)
+    if exclude is not None:
+        close &= j != exclude[owner]
+    hit[owner[close]] = True
+    return hit
+
+# --- Broadphase Benchmark ---
+
+def benchmark_broadphase(scales=(1, 10, 100), ticks=30, base_seekers=10, base_obstacles=8):
+    """
+    Time seeker-seeker and seeker-obstacle queries through SpatialHash (per-object path)
+    and boxes_overlap_any (swarm path) as entity counts grow. Rects are scattered and may overlap.
+    Returns rows of (scale, seekers, obstacles, object_us_per_seeker, swarm_us_per_seeker).
+    """
+    rows = []
+    for scale in scales:
+        n = base_seekers * scale
+        m = base_obstacles * scale
+        seekers = [pygame.Rect(random.randint(0, WIDTH-SEEKER_SIZE), random.randint(0, HEIGHT-SEEKER_SIZE),
+                               SEEKER_SIZE, SEEKER_SIZE) for _ in range(n)]
+        obstacles = [pygame.Rect(random.randint(0, WIDTH-OBSTACLE_SIZE), random.randint(0, HEIGHT-OBSTACLE_SIZE),
+                                 OBSTACLE_SIZE, OBSTACLE_SIZE) for _ in range(m)]
+        seeker_grid = SpatialHash()
+        seeker_grid.rebuild(enumerate(seekers))
+        obstacle_grid = SpatialHash()
+        obstacle_grid.rebuild(enumerate(obstacles))
+
+        start = time.perf_counter()
+        for _ in range(ticks):
+            for i, rect in enumerate(seekers):
+                step = rect.move(random.randint(-3, 3), random.randint(-3, 3))
+                if not seeker_grid.collides(step, ignore=i) and not obstacle_grid.collides(step):
+                    seekers[i] = step
+                    seeker_grid.move(i, step)
+        object_us = (time.perf_counter() - start) / (ticks * n) * 1e6
+
+        pos = np.array([(r.x, r.y) for r in seekers], dtype=np.int64)
+        ob = obstacle_grid.boxes()
+        idx = np.arange(n)
+        start = time.perf_counter()
+        for _ in range(ticks):
+            proposed = np.clip(pos + np.random.randint(-3, 4, size=(n, 2)), 0, (WIDTH-SEEKER_SIZE, HEIGHT-SEEKER_SIZE))
+            blocked = boxes_overlap_any(proposed, SEEKER_SIZE, pos, SEEKER_SIZE, cell=SEEKER_SIZE, exclude=idx)
+            blocked |= boxes_overlap_any(proposed, SEEKER_SIZE, ob[:, :2], ob[:, 2:])
+            pos[~blocked] = proposed[~blocked]
+        swarm_us = (time.perf_counter() - start) / (ticks * n) * 1e6
+        rows.append((scale, n, m, object_us, swarm_us))
+    return rows
+
+if __name__ == "__main__":
+    print("scale  seekers  obstacles  object us/seeker  swarm us/seeker")
+    for scale, n, m, object_us, swarm_us in benchmark_broadphase():
+        print(f"{scale:>5}x {n:>8} {m:>10} {object_us:>16.2f} {swarm_us:>16.2f}")
+
+# --- End of spatial.py ---
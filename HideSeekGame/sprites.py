@@ -0,0 +1,150 @@
+"""
+sprites.py — Hide & Seek+ Sprite Cache
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Pre-baked entity sprites (seeker/golden/boss bodies with eyes, player body, trail ghosts, glows,
+shields, health pips and powerup pulse frames). Each sprite is built once per
+(kind, color, size, alpha/animation phase), converted for fast blitting, and reused every frame.
+"""
+
+import pygame
+from config import PLAYER_SIZE, SEEKER_SIZE, POWERUP_COLORS, POWERUP_NAMES
+
+class SpriteCache:
+    """
+    Surfaces keyed by tuples that start with the sprite kind, e.g. ("seeker", color, size, flash).
+    Counts hits/misses and approximate pixel memory so the cache can be inspected with stats().
+    """
+    def __init__(self):
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+
+    def get(self, key, build):
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = build()
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        self.surfaces[key] = surf
+        self.bytes += surf.get_pitch() * surf.get_height()
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        kinds = {}
+        for key in self.surfaces:
+            kinds[key[0]] = kinds.get(key[0], 0) + 1
+        return {
+            "entries": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "bytes": self.bytes,
+            "kinds": kinds,
+        }
+
+SPRITES = SpriteCache()
+
+# --- Seekers ---
+
+def seeker_sprite(color, flash=False, size=SEEKER_SIZE):
+    def build():
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        if flash:
+            pygame.draw.rect(surf, (0,255,255, 150), (0,0,size,size), border_radius=8)
+        pygame.draw.rect(surf, color, (0,0,size,size), border_radius=10)
+        # Eyes (polished)
+        pygame.draw.ellipse(surf, (0,0,0), (14, 9, 6, 6))
+        pygame.draw.ellipse(surf, (0,0,0), (14, 25, 6, 6))
+        return surf
+    return SPRITES.get(("seeker", color, size, flash), build)
+
+def golden_sprite(size=SEEKER_SIZE):
+    def build():
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (255, 224, 60, 200), (0,0,size,size), border_radius=10)
+        pygame.draw.rect(surf, (255, 255, 160, 160), (6,6,size-12, size-12), border_radius=6)
+        return surf
+    return SPRITES.get(("golden", (255, 224, 60), size, 0), build)
+
+def sparkle_sprite():
+    def build():
+        surf = pygame.Surface((5, 5), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255,255,120), (2,2), 2)
+        return surf
+    return SPRITES.get(("sparkle", (255,255,120), 5, 0), build)
+
+def boss_sprite(width, height):
+    def build():
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (180,80,255,150), (0,0,width,height), border_radius=14)
+        pygame.draw.rect(surf, (255,255,255,60), (8,8,width-16, height-16), border_radius=8)
+        # Eyes
+        pygame.draw.ellipse(surf, (0,0,0), (38, 18, 14, 14))
+        pygame.draw.ellipse(surf, (0,0,0), (38, 54, 14, 14))
+        return surf
+    return SPRITES.get(("boss", (180,80,255), (width, height), 0), build)
+
+# --- Player ---
+
+def player_body_sprite(color, size=PLAYER_SIZE):
+    def build():
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, (0, 0, size, size), border_radius=12)
+        # Outline
+        pygame.draw.rect(surf, (255, 255, 255), (0, 0, size, size), 2, border_radius=10)
+        return surf
+    return SPRITES.get(("player", color, size, 255), build)
+
+def player_trail_sprite(color, alpha, size=PLAYER_SIZE):
+    def build():
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(surf, color + (alpha,), (0, 0, size, size), border_radius=10)
+        return surf
+    return SPRITES.get(("trail", color, size, alpha), build)
+
+def glow_sprite(color, alpha, size):
+    """Soft filled ellipse used for the boost flash and the shield bubble."""
+    def build():
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, color + (alpha,), (0, 0, size, size))
+        return surf
+    return SPRITES.get(("glow", color, size, alpha), build)
+
+def health_sprite(health):
+    def build():
+        surf = pygame.Surface((40, 7), pygame.SRCALPHA)
+        for i in range(3):
+            col = (255, 60, 60) if i >= health else (80, 255, 80)
+            pygame.draw.rect(surf, col, (i*14, 0, 12, 7), border_radius=3)
+        return surf
+    return SPRITES.get(("health", None, 40, health), build)
+
+# --- Powerups ---
+
+_icon_font = None
+
+def powerup_sprite(kind, size):
+    """One pulse frame of a powerup; the pulse only ever produces a handful of sizes."""
+    def build():
+        global _icon_font
+        color = POWERUP_COLORS.get(kind, (200, 200, 200))
+        surf = pygame.Surface((36, 36), pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, color + (190,), (0, 0, 36, 36))
+        pygame.draw.ellipse(surf, (255, 255, 255, 60), (5, 5, 26, 26))
+        if _icon_font is None:
+            _icon_font = pygame.font.SysFont("arial", 22, bold=True)
+        txt = _icon_font.render(POWERUP_NAMES[kind][0], True, (34, 34, 34))
+        surf.blit(txt, txt.get_rect(center=(18, 18)))
+        return pygame.transform.smoothscale(surf, (size, size))
+    return SPRITES.get(("powerup", kind, size, 0), build)
+
+# --- End of sprites.py ---
@@ -0,0 +1,241 @@
+"""
+tune.py — Hide & Seek+ Difficulty Tuner
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Searches the per-difficulty config tables (seeker speed, spawn interval, projectile cooldown,
+boost duration) and the score ramps (SPAWN_RAMP_SCORE, SPEED_RAMP_SCORE) for values whose
+median bot survival time hits a target per difficulty, using batched headless games (simulate.py).
+
+Search: grid (every combination of the --tables being tuned), random (--candidates samples) or
+successive halving (default): random candidates play a few games, the best 1/ETA move on to ETA
+times as many games, and so on, so bad candidates are dropped after the cheapest round.
+Every candidate of a round is evaluated in parallel on one process pool with the same game seeds
+(a fair comparison), and each evaluation is cached on disk under a hash of everything that
+determines its result.
+The best candidates are written as a difficulty profile: `python main.py --difficulty-profile FILE`.
+
+    python tune.py                                   # all difficulties, default targets
+    python tune.py --only Master --target Master=45 --search random --candidates 40
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from config import FPS, current_profile
+from simulate import run_batch, batch_seeds, merge_batches, DIFFICULTIES
+from bots import POLICIES
+
+# Values tried per table (one entry per difficulty is tuned at a time)
+SPACE = {
+    "SEEKER_SPEEDS": (1, 2, 3, 4, 5, 6, 7, 8, 9),
+    "SEEKER_SPAWN_INTERVALS": (5, 8, 10, 15, 20, 25, 30, 40),
+    "PROJECTILE_COOLDOWNS": (60, 90, 120, 150, 200, 240, 300),
+    "BOOST_DURATION": (60, 90, 120, 180, 240),
+    "SPAWN_RAMP_SCORE": (0, 1000, 2000, 3000, 5000),
+    "SPEED_RAMP_SCORE": (0, 2000, 3000, 5000, 8000),
+}
+DEFAULT_TARGETS = {"Easy": 120.0, "Hard": 60.0, "Master": 30.0}  # Median survival, seconds
+DEFAULT_CACHE = "tune_cache.json"
+ETA = 3
+
+# --- Candidates ---
+
+def shipped(difficulty):
+    """The candidate matching the current config tables."""
+    profile = current_profile()
+    return {name: profile[name][difficulty] for name in SPACE}
+
+def grid_candidates(difficulty, tables):
+    """Every combination of the SPACE values of `tables` (the other tables keep their shipped values)."""
+    base = shipped(difficulty)
+    return [dict(base, **dict(zip(tables, values))) for values in itertools.product(*(SPACE[t] for t in tables))]
+
+def random_candidates(difficulty, tables, count, rng):
+    """The shipped values plus up to `count` - 1 distinct random draws over `tables`."""
+    base = shipped(difficulty)
+    candidates = [base]
+    seen = {tuple(base.values())}
+    total = int(np.prod([len(SPACE[t]) for t in tables]))
+    while len(candidates) < min(count, total):
+        candidate = dict(base, **{t: rng.choice(SPACE[t]) for t in tables})
+        key = tuple(candidate.values())
+        if key not in seen:
+            seen.add(key)
+            candidates.append(candidate)
+    return candidates
+
+def to_profile(difficulty, candidate):
+    return {name: {difficulty: value} for name, value in candidate.items()}
+
+# --- Evaluation ---
+
+class EvalCache:
+    """Evaluation results on disk, keyed by a hash of (difficulty, candidate, bot, games, seed, cap)."""
+    def __init__(self, path=DEFAULT_CACHE):
+        self.path = path
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                self.entries = json.load(f)
+        self.hits = 0
+
+    @staticmethod
+    def key(**fields):
+        return hashlib.sha1(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+
+    def save(self):
+        if self.path:
+            with open(self.path, "w") as f:
+                json.dump(self.entries, f)
+
+def evaluate(pool, cache, difficulty, candidates, target, games, seed, policy, batch_size):
+    """
+    Median survival (s) and loss for every candidate, playing `games` games each with the same seeds.
+    Uncached candidates are all submitted to the pool before any result is awaited.
+    Games are capped at 3x the target, which is enough to place the median.
+    """
+    max_seconds = 3 * target
+    max_ticks = int(max_seconds * FPS)
+    batches = batch_seeds(seed, games, batch_size)
+    keys = [EvalCache.key(difficulty=difficulty, candidate=c, policy=policy, games=games, seed=seed,
+                          max_seconds=max_seconds) for c in candidates]
+    pending = {}
+    for key, candidate in zip(keys, candidates):
+        if key in pending or cache.get(key) is not None:
+            continue
+        profile = to_profile(difficulty, candidate)
+        if pool is None:
+            pending[key] = [run_batch(difficulty, policy, seeds, max_ticks, profile) for seeds in batches]
+        else:
+            pending[key] = [pool.submit(run_batch, difficulty, policy, seeds, max_ticks, profile) for seeds in batches]
+    for key, results in pending.items():
+        ticks, scores, _ = merge_batches([r if pool is None else r.result() for r in results])
+        survival = ticks / FPS
+        cache.put(key, {
+            "median_s": float(np.median(survival)),
+            "p25_s": float(np.percentile(survival, 25)),
+            "p75_s": float(np.percentile(survival, 75)),
+            "median_score": float(np.median(scores)),
+            "games": games,
+        })
+    out = []
+    for key in keys:
+        entry = dict(cache.entries[key])
+        entry["loss"] = abs(entry["median_s"] - target) / target
+        out.append(entry)
+    return out
+
+# --- Search ---
+
+def successive_halving(pool, cache, difficulty, candidates, target, min_games, max_games, seed, policy,
+                       batch_size, log):
+    """Rounds of ETA-fold more games for the best 1/ETA. Returns (best candidate, its result)."""
+    games = min_games
+    alive = candidates
+    while True:
+        results = evaluate(pool, cache, difficulty, alive, target, games, seed, policy, batch_size)
+        order = sorted(range(len(alive)), key=lambda i: results[i]["loss"])
+        best = order[0]
+        log(f"  {difficulty}: {len(alive):4d} candidates x {games:4d} games, best median "
+            f"{results[best]['median_s']:.1f}s (loss {results[best]['loss']:.3f})")
+        if len(alive) == 1 or games >= max_games:
+            return alive[best], results[best]
+        alive = [alive[i] for i in order[:max(1, len(alive) // ETA)]]
+        games = min(games * ETA, max_games)
+
+def tune(difficulty, target, search="halving", tables=tuple(SPACE), candidates=27, min_games=20, max_games=180,
+         seed=0, policy="flee", workers=None, batch_size=10, cache=None, log=print):
+    """Best candidate for one difficulty and its evaluation."""
+    rng = random.Random(seed)
+    if search == "grid":
+        pool_of_candidates = grid_candidates(difficulty, tables)
+    else:
+        pool_of_candidates = random_candidates(difficulty, tables, candidates, rng)
+    cache = cache if cache is not None else EvalCache(None)
+    with ProcessPoolExecutor(max_workers=workers) if workers != 1 else _NoPool() as pool:
+        if search == "halving":
+            return successive_halving(pool, cache, difficulty, pool_of_candidates, target, min_games, max_games,
+                                      seed, policy, batch_size, log)
+        results = evaluate(pool, cache, difficulty, pool_of_candidates, target, max_games, seed, policy, batch_size)
+        best = min(range(len(results)), key=lambda i: results[i]["loss"])
+        log(f"  {difficulty}: {len(results)} candidates x {max_games} games, best median "
+            f"{results[best]['median_s']:.1f}s (loss {results[best]['loss']:.3f})")
+        return pool_of_candidates[best], results[best]
+
+class _NoPool:
+    """Stands in for the executor when running inline (workers=1)."""
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+def build_profile(best):
+    """Full tables (shipped values, with each tuned difficulty's winners laid over them)."""
+    profile = current_profile()
+    for difficulty, candidate in best.items():
+        for name, value in candidate.items():
+            profile[name][difficulty] = value
+    return profile
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hide & Seek+ difficulty tuner")
+    parser.add_argument("--only", nargs="+", choices=DIFFICULTIES, default=list(DIFFICULTIES))
+    parser.add_argument("--target", nargs="+", default=[], metavar="DIFFICULTY=SECONDS",
+                        help="median survival targets (default Easy=120 Hard=60 Master=30)")
+    parser.add_argument("--search", choices=("halving", "random", "grid"), default="halving")
+    parser.add_argument("--tables", nargs="+", choices=list(SPACE), default=list(SPACE),
+                        help="tables to tune (the rest keep their shipped values)")
+    parser.add_argument("--candidates", type=int, default=27, help="random candidates (halving/random)")
+    parser.add_argument("--min-games", type=int, default=20, help="games per candidate in the first halving round")
+    parser.add_argument("--max-games", type=int, default=180, help="games per candidate at full budget")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="flee")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="evaluation cache file ('' to disable)")
+    parser.add_argument("--out", default="difficulty_profile.json", help="profile to write")
+    args = parser.parse_args(argv)
+    targets = dict(DEFAULT_TARGETS)
+    for item in args.target:
+        name, _, seconds = item.partition("=")
+        targets[name] = float(seconds)
+
+    cache = EvalCache(args.cache or None)
+    start = time.perf_counter()
+    best = {}
+    for difficulty in args.only:
+        candidate, result = tune(difficulty, targets[difficulty], args.search, args.tables, args.candidates,
+                                 args.min_games, args.max_games, args.seed, args.policy, args.workers, cache=cache)
+        cache.save()
+        best[difficulty] = candidate
+        print(f"{difficulty}: median {result['median_s']:.1f}s (target {targets[difficulty]:g}s, "
+              f"IQR {result['p25_s']:.1f}-{result['p75_s']:.1f}s, {result['games']} games) with {candidate}")
+    print(f"{time.perf_counter() - start:.1f}s, {cache.hits} cached evaluations reused")
+
+    profile = build_profile(best)
+    with open(args.out, "w") as f:
+        json.dump(profile, f, indent=2)
+    print(f"\nProfile written to {args.out} (python main.py --difficulty-profile {args.out}), or in config.py:")
+    for name, table in profile.items():
+        print(f"{name} = {json.dumps(table)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- End of tune.py ---
@@ -0,0 +1,477 @@
+"""
+world.py — Hide & Seek+ Headless Simulation Core
+CrystalCard-hub, Copilot (2025 Refined Edition)
+Holds every piece of gameplay state (player, seekers, obstacles, projectiles, powerups, score,
+multiplier, relocate timers) and advances it one tick at a time with World.step(inputs).
+Nothing in here touches the display, fonts or the clock, so it can run thousands of ticks per second.
+"""
+
+import random
+import time
+import numpy as np
+import pygame
+from config import (
+    WIDTH, HEIGHT, FPS, SEEKER_SIZE, PLAYER_SIZE, OBSTACLE_COUNT, OBSTACLE_SIZE, MAX_SEEKERS,
+    PROJECTILE_SIZE, PROJECTILE_SPEED, OBSTACLE_RELOCATE_FRAMES, NEAR_MISS_DISTANCE, NEAR_MISS_COOLDOWN,
+    SWARM_MIN_SEEKERS, SPAWN_RAMP_STEP, SPAWN_INTERVAL_MIN, SEEKER_FLOW_FIELD, SEEKER_LOD,
+    SEEKER_LINE_OF_SIGHT
+)
+from player import Player, Powerup
+from spatial import SpatialHash
+from seeker import SeekerSwarm, SeekerGroup, ParticleManager, SEEKER_KIND_NORMAL, SEEKER_KIND_GOLDEN, GOLDEN_COLOR
+from flowfield import FlowField
+from scheduler import AIScheduler
+from visibility import Occluders
+from layout import LayoutPrefetch, sample_layout, place_obstacles
+from freespace import FreeSpace
+
+# --- Inputs (one bitmask per tick) ---
+
+INPUT_UP = 1
+INPUT_DOWN = 2
+INPUT_LEFT = 4
+INPUT_RIGHT = 8
+INPUT_BOOST = 16  # Edge-triggered: set only on the tick B was pressed
+
+_KEY_BITS = {
+    pygame.K_w: INPUT_UP, pygame.K_UP: INPUT_UP,
+    pygame.K_s: INPUT_DOWN, pygame.K_DOWN: INPUT_DOWN,
+    pygame.K_a: INPUT_LEFT, pygame.K_LEFT: INPUT_LEFT,
+    pygame.K_d: INPUT_RIGHT, pygame.K_RIGHT: INPUT_RIGHT,
+}
+
+class InputKeys(dict):
+    """
+    Read-only stand-in for pygame.key.get_pressed(), built from an input bitmask.
+    Player.update() indexes it exactly like the real key state; unknown keys read as released.
+    """
+    def __init__(self, mask):
+        super().__init__((key, bool(mask & bit)) for key, bit in _KEY_BITS.items())
+        self.mask = mask
+
+    def __missing__(self, key):
+        return False
+
+_KEYS_FOR_MASK = [InputKeys(m) for m in range(32)]
+
+def keys_to_mask(keys):
+    """Convert a pygame key state into movement bits (boost is added from KEYDOWN events)."""
+    mask = 0
+    for key, bit in _KEY_BITS.items():
+        if keys[key]:
+            mask |= bit
+    return mask
+
+# --- Spawn / Layout Helpers ---
+
+# Each helper takes the RNG to draw from (a random.Random; the module-level functions by default).
+# World keeps one FreeSpace (freespace.py) of its obstacles instead; these build one per call.
+
+def _free_space(obstacles):
+    free = FreeSpace()
+    free.set_obstacles(obstacles.boxes() if isinstance(obstacles, SpatialHash) else [tuple(r) for r in obstacles])
+    return free
+
+def get_non_overlapping_spawn(seekers, obstacles, size=SEEKER_SIZE, rng=random):
+    return _free_space(obstacles).random_edge(size, rng, seekers.positions(), SEEKER_SIZE)
+
+def random_obstacles(count, size=OBSTACLE_SIZE, objects_to_avoid=None, rng=random):
+    # Jittered grid layout (layout.py): bounded time, never overlapping, clear of objects_to_avoid
+    return place_obstacles(sample_layout(count, size, rng.getrandbits(32)), count, objects_to_avoid or ())
+
+def find_safe_player_spawn(obstacles, size=40, rng=random):
+    return _free_space(obstacles).random_free(size, rng) or (WIDTH//2, HEIGHT//2)
+
+def in_bounds(rect):
+    return 0 <= rect.x < WIDTH and 0 <= rect.y < HEIGHT
+
+def animate_obstacles_move(obstacles, new_positions, progress):
+    for ob, (nx, ny) in zip(obstacles, new_positions):
+        ox, oy = ob.x, ob.y
+        ob.x = int(ox + (nx-ox)*progress)
+        ob.y = int(oy + (ny-oy)*progress)
+
+# --- Ghost Projectile Class ---
+
+class Projectile:
+    def __init__(self, x, y, dx, dy):
+        self.rect = pygame.Rect(x, y, PROJECTILE_SIZE, PROJECTILE_SIZE)
+        self.dx = dx
+        self.dy = dy
+        self.age = 0
+        self.prev = (x, y)
+
+    def update(self):
+        self.prev = self.rect.topleft
+        self.rect.x += self.dx
+        self.rect.y += self.dy
+        self.age += 1
+
+    def draw(self, screen):
+        color = (120, 0, 255) if self.age % 10 < 5 else (0, 255, 255)
+        pygame.draw.rect(screen, color, self.rect)
+
+    def is_offscreen(self):
+        return not _SCREEN_RECT.colliderect(self.rect)
+
+_SCREEN_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+# --- World ---
+
+class World:
+    """
+    One game session. step(inputs) advances exactly one frame of gameplay.
+    Set particles=False for headless runs (particles are purely visual),
+    invulnerable=True to keep a run going through hits (soak tests, benchmarks),
+    and max_seekers to override the difficulty's seeker ceiling (SEEKER_CEILINGS; ghost bullets start
+    once it is reached).
+    Ceilings of SWARM_MIN_SEEKERS and up switch seekers to the batched SeekerSwarm.
+    track_motion=True records where the player and seekers were before each tick (prev_player,
+    prev_seekers) so a renderer can interpolate between ticks.
+    Every gameplay decision draws from this game's own streams, seeded from `seed` (a random 32-bit
+    seed when None, kept in self.seed): self.rng (random.Random) and self.np_rng (NumPy, for the swarm).
+    Timing is counted in ticks, so the same seed and per-tick inputs always replay the same game.
+    """
+    def __init__(self, settings, particles=True, invulnerable=False, max_seekers=None, track_motion=False, seed=None):
+        self.settings = settings
+        self.difficulty = settings.difficulty
+        self.theme = settings.get_theme()
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng = random.Random(self.seed)
+        self.np_rng = np.random.default_rng(self.seed)
+        # Drawn even without particles, so headless and windowed runs share one gameplay stream
+        particle_seed = self.np_rng.integers(1 << 32)
+        self.particle_mgr = ParticleManager(rng=np.random.default_rng(particle_seed)) if particles else None
+        self.invulnerable = invulnerable
+        self.max_seekers = max_seekers if max_seekers is not None else settings.get_max_seekers()
+        self.track_motion = track_motion
+        self.profiler = None  # A profiler.Profiler to time each phase of step()
+        self.reset()
+
+    def reset(self):
+        # --- Initial spawn: safe
+        candidates = sample_layout(OBSTACLE_COUNT, OBSTACLE_SIZE, self.rng.getrandbits(32))
+        obstacles = place_obstacles(candidates, OBSTACLE_COUNT)
+        self.free_space = FreeSpace()
+        self.free_space.set_obstacles([tuple(ob) for ob in obstacles])
+        spawn = self.free_space.random_free(PLAYER_SIZE, self.rng)
+        if spawn is None:
+            # Obstacles everywhere: lay the same candidates out around a centered player instead
+            spawn = (WIDTH - PLAYER_SIZE) // 2, (HEIGHT - PLAYER_SIZE) // 2
+            obstacles = place_obstacles(candidates, OBSTACLE_COUNT, [pygame.Rect(spawn, (PLAYER_SIZE, PLAYER_SIZE))])
+            self.free_space.set_obstacles([tuple(ob) for ob in obstacles])
+        spawn_x, spawn_y = spawn
+        self.obstacles = obstacles
+        # The next relocation's layout is sampled in the background (Master never relocates)
+        self.layouts = LayoutPrefetch(OBSTACLE_COUNT, OBSTACLE_SIZE)
+        if self.difficulty != "Master":
+            self.layouts.prefetch(self.rng.getrandbits(32))
+        self.obstacle_grid = SpatialHash()
+        self.obstacle_grid.rebuild(enumerate(obstacles))
+        self.flow = FlowField() if SEEKER_FLOW_FIELD else None
+        self.ai = AIScheduler() if SEEKER_LOD else None
+        self.occluders = Occluders() if SEEKER_LINE_OF_SIGHT else None
+        self.seen = None  # Last tick's line-of-sight mask over the seekers (None: all see the player)
+        if self.flow:
+            self.flow.set_obstacles(self.obstacle_grid.boxes())
+        if self.occluders:
+            self.occluders.rebuild(self.obstacle_grid.boxes())
+        self.player = Player(spawn_x, spawn_y, self.theme["player"], self.settings)
+        if self.max_seekers >= SWARM_MIN_SEEKERS:
+            self.seekers = SeekerSwarm(self.particle_mgr, rng=self.np_rng)
+        else:
+            self.seekers = SeekerGroup(self.particle_mgr, rng=self.rng)
+        self.projectiles = []
+        self.projectile_grid = SpatialHash()
+        self.powerups = []
+        self.powerup_grid = SpatialHash()
+        if self.particle_mgr:
+            self.particle_mgr.clear()
+        self.prev_player = self.player.rect.topleft
+        self.prev_seekers = self.seekers.positions().copy()
+
+        self.tick = 0
+        self.score = 0
+        self.score_timer = 0
+        self.seeker_timer = 0
+        self.seeker_spawn_interval = self.settings.get_seeker_spawn_interval()
+        self.seeker_speed = self.settings.get_seeker_speed()
+        self.projectile_cooldown = 0
+        self.powerup_timer = 0
+
+        self.obstacle_relocate_timer = 0
+        self.moving_obstacles = False
+        self.obstacle_move_frames = 45
+        self.obstacle_move_progress = 0
+        self.new_obstacle_positions = []
+
+        self.multiplier = 1
+        self.multiplier_anim = 0
+        self.last_near_miss = -NEAR_MISS_COOLDOWN
+        self.screen_shake = 0
+
+        self.pending_unlocks = []
+        self.game_over = False
+        self.death_cause = None
+
+    # --- Tick ---
+
+    def step(self, inputs=0):
+        """Advance one tick. inputs is an INPUT_* bitmask. Does nothing once the game is over."""
+        if self.game_over:
+            return
+        self.tick += 1
+        if self.track_motion:
+            self.prev_player = self.player.rect.topleft
+            self.prev_seekers = self.seekers.positions().copy()
+        if self.multiplier_anim > 0:
+            self.multiplier_anim -= 1
+        if self.screen_shake > 0:
+            self.screen_shake = max(0, self.screen_shake-2)
+        if inputs & INPUT_BOOST:
+            self.player.try_boost()
+
+        prof = self.profiler
+        if self.difficulty != "Master":
+            self._relocate_obstacles()
+        if prof: prof.lap("relocate")
+        self._spawn_powerups()
+        if prof: prof.lap("powerups")
+        self.player.update(_KEYS_FOR_MASK[inputs & 31], self.obstacle_grid)
+        if prof: prof.lap("player")
+        self._update_seekers()
+        if prof: prof.lap("seekers")
+        if self._update_projectiles():
+            return
+        if prof: prof.lap("projectiles")
+        self._collect_powerups()
+        self._advance_timers()
+        if self._check_seeker_collisions():
+            return
+        if prof: prof.lap("collisions")
+        if self.particle_mgr:
+            self.particle_mgr.update()
+        if prof: prof.lap("particles")
+
+    def run(self, ticks, inputs=0):
+        """Step up to `ticks` times with a constant input; stops early on game over."""
+        for _ in range(ticks):
+            if self.game_over:
+                break
+            self.step(inputs)
+
+    def drain_unlocks(self):
+        keys, self.pending_unlocks = self.pending_unlocks, []
+        return keys
+
+    # --- Phases ---
+
+    def _relocate_obstacles(self):
+        if not self.moving_obstacles:
+            self.obstacle_relocate_timer += 1
+        if self.obstacle_relocate_timer >= OBSTACLE_RELOCATE_FRAMES:
+            self.moving_obstacles = True
+            attempted = place_obstacles(self.layouts.result(), OBSTACLE_COUNT, [self.player.rect])
+            self.layouts.prefetch(self.rng.getrandbits(32))
+            self.new_obstacle_positions = [(ob.x, ob.y) for ob in attempted]
+            self.obstacle_move_progress = 0
+            self.obstacle_relocate_timer = 0
+        if self.moving_obstacles:
+            self.obstacle_move_progress += 1
+            t = min(self.obstacle_move_progress / self.obstacle_move_frames, 1.0)
+            animate_obstacles_move(self.obstacles, self.new_obstacle_positions, t)
+            if t >= 1.0:
+                for ob, (nx, ny) in zip(self.obstacles, self.new_obstacle_positions):
+                    ob.x, ob.y = nx, ny
+                self.moving_obstacles = False
+            for i in range(len(self.obstacles)):
+                self.obstacle_grid.move(i)
+            if self.occluders:
+                self.occluders.rebuild(self.obstacle_grid.boxes())
+            self.free_space.set_obstacles(self.obstacle_grid.boxes())
+            if not self.moving_obstacles:
+                self._unstick_player()
+                if self.flow:
+                    self.flow.set_obstacles(self.obstacle_grid.boxes())
+
+    def _unstick_player(self):
+        # If player is stuck in obstacle, move it the shortest way out
+        rect = self.player.rect
+        if self.obstacle_grid.collides(rect):
+            rect.topleft = self.free_space.nearest(rect.x, rect.y, rect.width)
+
+    def _spawn_powerups(self):
+        self.powerup_timer += 1
+        rng = self.rng
+        if self.powerup_timer > rng.randint(700, 1300) and len(self.powerups) < 2:
+            kind = rng.choice(["shield", "slow", "multiplier", "heal"])
+            spot = self.free_space.random_free(36, rng, margin=20)
+            if spot:
+                powerup = Powerup(*spot, kind)
+                self.powerups.append(powerup)
+                self.powerup_grid.insert(powerup, powerup.rect)
+            self.powerup_timer = 0
+
+    def _update_seekers(self):
+        if self.flow:
+            self.flow.set_goal(*self.player.rect.center)
+        seen = None
+        if self.occluders and len(self.seekers):
+            seen = self.occluders.visible(self.player.rect.center, self.seekers.centers())
+        self.seen = seen
+        if self.ai is None:
+            self.seekers.update(self.player.rect, self.obstacle_grid, flow=self.flow, seen=seen)
+        else:
+            start = time.perf_counter()
+            think = self.ai.plan(self.seekers, self.player.rect.center)
+            self.seekers.update(self.player.rect, self.obstacle_grid, flow=self.flow, think=think, seen=seen)
+            self.ai.record(time.perf_counter() - start)
+        if self.tick - self.last_near_miss > NEAR_MISS_COOLDOWN:
+            px, py = self.player.rect.center
+            if self.seekers.any_within(px, py, NEAR_MISS_DISTANCE):
+                self.multiplier = min(self.multiplier+1, 5)
+                self.last_near_miss = self.tick
+                self.multiplier_anim = 18
+
+    def fire_projectile(self, sx, sy):
+        """Fire a ghost bullet from (sx, sy) straight at the player."""
+        player = self.player
+        dx = player.rect.centerx - sx
+        dy = player.rect.centery - sy
+        dist = max(1, (dx**2 + dy**2)**0.5)
+        vx = int(PROJECTILE_SPEED * dx / dist)
+        vy = int(PROJECTILE_SPEED * dy / dist)
+        px = sx - PROJECTILE_SIZE // 2
+        py = sy - PROJECTILE_SIZE // 2
+        proj = Projectile(px, py, vx, vy)
+        self.projectiles.append(proj)
+        self.projectile_grid.insert(proj, proj.rect)
+        return proj
+
+    def _update_projectiles(self):
+        # Last seeker fires ghost bullets once the field is full
+        player = self.player
+        if len(self.seekers) >= self.max_seekers:
+            self.projectile_cooldown += 1
+            if self.projectile_cooldown >= self.settings.get_projectile_cooldown():
+                self.fire_projectile(*self.seekers.center(len(self.seekers) - 1))
+                self.projectile_cooldown = 0
+
+        grid = self.projectile_grid
+        for proj in self.projectiles[:]:
+            proj.update()
+            if proj.is_offscreen():
+                self.projectiles.remove(proj)
+                grid.remove(proj)
+            else:
+                grid.move(proj)
+        for proj in grid.query(player.rect):
+            if self._hit(24, (255, 0, 255), "Ghosted"):
+                return True
+        return False
+
+    def _collect_powerups(self):
+        for p in self.powerup_grid.query(self.player.rect):
+            self.pending_unlocks.append("Collector")
+            if self.particle_mgr:
+                self.particle_mgr.spawn_collect(p.rect.centerx, p.rect.centery, p.kind)
+            self.player.apply_powerup(p.kind)
+            self.powerups.remove(p)
+            self.powerup_grid.remove(p)
+
+    def _advance_timers(self):
+        settings = self.settings
+        self.seeker_timer += 1
+        self.score_timer += 1
+
+        # --- Adaptive difficulty (score ramps) ---
+        ramp = settings.get_spawn_ramp_score()
+        if ramp and self.score // ramp > 0:
+            self.seeker_spawn_interval = max(SPAWN_INTERVAL_MIN, settings.get_seeker_spawn_interval() - (self.score // ramp) * SPAWN_RAMP_STEP)
+        ramp = settings.get_speed_ramp_score()
+        self.seeker_speed = settings.get_seeker_speed() + (self.score // ramp if ramp else 0)
+
+        if self.seeker_timer >= FPS * self.seeker_spawn_interval and len(self.seekers) < self.max_seekers:
+            self.spawn_seeker()
+            self.seeker_timer = 0
+
+        if self.score_timer >= FPS:
+            self.score += 143 * self.multiplier
+            self.score_timer = 0
+            if self.multiplier > 1:
+                self.multiplier = max(1, self.multiplier-1)
+
+    def spawn_seeker(self):
+        color_key = "seeker"
+        if self.difficulty == "Hard":
+            color_key = "seeker_hard"
+        elif self.difficulty == "Master":
+            color_key = "seeker_master"
+        x, y = self.free_space.random_edge(SEEKER_SIZE, self.rng, self.seekers.positions())
+        if self.rng.random() < 0.05 and len(self.seekers) > 3:
+            return self.seekers.spawn(x, y, GOLDEN_COLOR, self.seeker_speed+1, SEEKER_KIND_GOLDEN)
+        return self.seekers.spawn(x, y, self.theme[color_key], self.seeker_speed, SEEKER_KIND_NORMAL)
+
+    def _check_seeker_collisions(self):
+        for _ in range(self.seekers.count_colliding(self.player.rect)):
+            if self._hit(18, (255, 0, 0), "Tagged"):
+                return True
+        return False
+
+    def _hit(self, shake, color, cause):
+        """Player got hit. Returns True when that ends the game."""
+        self.screen_shake = shake
+        if self.particle_mgr:
+            self.particle_mgr.spawn_impact(self.player.rect.centerx, self.player.rect.centery, color)
+        if cause not in self.pending_unlocks:
+            self.pending_unlocks.append(cause)
+        if self.invulnerable:
+            return False
+        self.game_over = True
+        self.death_cause = cause
+        return True
+
+    # --- Introspection ---
+
+    def seconds_survived(self):
+        return self.tick / FPS
+
+# --- Headless Benchmark ---
+
+def benchmark_world(settings, ticks=20000, seekers=MAX_SEEKERS, line_of_sight=True):
+    """
+    Run a headless world with `seekers` seekers chasing a stationary, invulnerable player.
+    Seekers past the edge slots are scattered over the field. Returns ticks per second.
+    line_of_sight=False drops the visibility pass (as SEEKER_LINE_OF_SIGHT = False would).
+    """
+    world = World(settings, particles=False, invulnerable=True, max_seekers=seekers)
+    if not line_of_sight:
+        world.occluders = None
+    color = world.theme["seeker"]
+    for i in range(seekers):
+        if i < MAX_SEEKERS:
+            world.spawn_seeker()
+        else:
+            world.seekers.spawn(world.rng.randint(0, WIDTH-SEEKER_SIZE), world.rng.randint(0, HEIGHT-SEEKER_SIZE),
+                              color, world.seeker_speed)
+    start = time.perf_counter()
+    world.run(ticks)
+    elapsed = time.perf_counter() - start
+    return ticks / max(elapsed, 1e-9)
+
+if __name__ == "__main__":
+    from settings import Settings
+    bench_settings = Settings()
+    for difficulty in ("Easy", "Hard", "Master"):
+        bench_settings.difficulty = difficulty
+        tps = benchmark_world(bench_settings)
+        blind = benchmark_world(bench_settings, line_of_sight=False)
+        # The target predates line of sight, which costs about a tenth of it with 10 seekers
+        print(f"{difficulty:>6}: {tps:,.0f} ticks/sec with {MAX_SEEKERS} seekers, {blind:,.0f} without "
+              f"line of sight (target 20,000)")
+    bench_settings.difficulty = "Hard"
+    for count in (100, 1000, 5000):
+        tps = benchmark_world(bench_settings, ticks=600, seekers=count)
+        print(f"  Hard: {tps:,.0f} ticks/sec with {count} seekers (target 60)")
+
+# --- End of world.py ---